@@ -0,0 +1,4 @@
+"""
+Benchmarks do ReportMaster Framework
+Execute a partir da raiz do repositório: python -m benchmarks.<modulo>
+"""
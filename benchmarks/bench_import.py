@@ -0,0 +1,82 @@
+"""
+Benchmark do tempo de import: `python -X importtime` em um processo limpo
+
+Uso: python -m benchmarks.bench_import [--repeat 5] [--top 10] [--max-ms 150]
+
+Falha se importar o framework e construir um ReportBuilder carregar algum
+módulo pesado (WeasyPrint, matplotlib, pandas, NumPy, Jinja2).
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SNIPPET = (
+    "import src.reporter.report_framework as rf; "
+    "rf.ReportBuilder(rf.ReportConfig(title='x'))"
+)
+
+HEAVY_MODULES = ('weasyprint', 'matplotlib', 'pandas', 'numpy', 'jinja2')
+
+
+def run_importtime() -> List[Tuple[str, int, int]]:
+    """Executa o snippet com -X importtime e retorna (módulo, próprio_us, acumulado_us)"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', SNIPPET],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def top_level(name: str) -> str:
+    return name.split('.')[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='falha se o melhor tempo acumulado passar deste limite')
+    args = parser.parse_args()
+
+    best_ms = None
+    best_entries: List[Tuple[str, int, int]] = []
+    for _ in range(args.repeat):
+        entries = run_importtime()
+        total_ms = sum(cumulative for name, _, cumulative in entries if '.' not in name.strip()) / 1000
+        if best_ms is None or total_ms < best_ms:
+            best_ms, best_entries = total_ms, entries
+
+    framework = next(
+        (cumulative for name, _, cumulative in best_entries if name == 'src.reporter.report_framework'),
+        0
+    )
+    print(f'import total (melhor de {args.repeat}): {best_ms:.1f} ms')
+    print(f'src.reporter.report_framework (acumulado): {framework / 1000:.1f} ms')
+
+    by_package: Dict[str, int] = {}
+    for name, self_us, _ in best_entries:
+        by_package[top_level(name)] = by_package.get(top_level(name), 0) + self_us
+    print(f"\n{'pacote':<30} {'próprio (ms)':>12}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f'{package:<30} {self_us / 1000:>12.1f}')
+
+    loaded = sorted({top_level(name) for name, _, _ in best_entries} & set(HEAVY_MODULES))
+    if loaded:
+        raise SystemExit(f"Módulos pesados carregados no import: {', '.join(loaded)}")
+    if args.max_ms is not None and best_ms > args.max_ms:
+        raise SystemExit(f'Import levou {best_ms:.1f} ms (limite {args.max_ms:.1f} ms)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark da renderização de tabelas: loop iterrows (legado) x renderizador por colunas
+
+Uso: python -m benchmarks.bench_table [--rows 1000 10000 100000] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.reporter.tables import render_table
+
+
+def render_table_iterrows(df: pd.DataFrame) -> str:
+    """Implementação original de ReportBuilder._render_table (referência)"""
+    html = '<div class="data-table-wrapper">'
+    html += '<table class="data-table">'
+
+    html += '<thead><tr>'
+    for col in df.columns:
+        html += f'<th>{col}</th>'
+    html += '</tr></thead>'
+
+    html += '<tbody>'
+    for _, row in df.iterrows():
+        html += '<tr>'
+        for val in row:
+            if isinstance(val, (int, float)):
+                if isinstance(val, float):
+                    formatted = f'{val:,.2f}'
+                else:
+                    formatted = f'{val:,}'
+            else:
+                formatted = str(val)
+            html += f'<td>{formatted}</td>'
+        html += '</tr>'
+    html += '</tbody>'
+
+    html += '</table></div>'
+    return html
+
+
+def make_ledger(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Gera um razão contábil sintético com colunas de tipos mistos"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Conta': rng.choice(['Receita', 'Custo', 'Despesa', 'Imposto'], rows),
+        'Documento': rng.integers(100_000, 999_999, rows),
+        'Quantidade': rng.integers(1, 5_000, rows),
+        'Valor': rng.normal(10_000, 3_000, rows).round(2),
+        'Saldo': rng.normal(1_000_000, 250_000, rows),
+    })
+
+
+def best_of(func, df: pd.DataFrame, repeat: int) -> float:
+    """Menor tempo (s) entre `repeat` execuções"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'linhas':>10} {'iterrows (linhas/s)':>22} {'colunas (linhas/s)':>22} {'ganho':>8}")
+    for rows in args.rows:
+        df = make_ledger(rows)
+
+        if render_table_iterrows(df) != render_table(df):
+            raise SystemExit(f'Markup divergente para {rows} linhas')
+
+        legacy = best_of(render_table_iterrows, df, args.repeat)
+        vectorized = best_of(render_table, df, args.repeat)
+        print(
+            f'{rows:>10,} {rows / legacy:>22,.0f} {rows / vectorized:>22,.0f} '
+            f'{legacy / vectorized:>7.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
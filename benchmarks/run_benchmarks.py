@@ -0,0 +1,193 @@
+"""
+Driver do suite de benchmarks: latência (p50/p90/p99), vazão e pico de RSS em JSON
+
+Uso: python -m benchmarks.run_benchmarks [CASOS...] [--output resultados.json]
+                                         [--compare base.json] [--quick] [--list]
+
+CASOS filtra por grupo (table, chart, builder, template, layout, generate),
+nome (ex.: table/10000) ou prefixo ('generate/'). Cada caso roda em um
+processo próprio para que o pico de RSS seja dele; --in-process desliga esse
+isolamento. Casos que dependem do WeasyPrint são pulados quando ele não está
+disponível.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+SCHEMA_VERSION = 1
+
+
+def peak_rss_mb() -> float:
+    """Pico de RSS deste processo (ru_maxrss é KiB no Linux e bytes no macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Percentil com interpolação linear sobre valores já ordenados"""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(timings: List[float], units: int) -> Dict[str, Any]:
+    ordered = sorted(timings)
+    mean = sum(ordered) / len(ordered)
+    return {
+        'iterations': len(ordered),
+        'latency_ms': {
+            'min': ordered[0] * 1000,
+            'mean': mean * 1000,
+            'p50': percentile(ordered, 50) * 1000,
+            'p90': percentile(ordered, 90) * 1000,
+            'p99': percentile(ordered, 99) * 1000,
+            'max': ordered[-1] * 1000,
+        },
+        'throughput': units / percentile(ordered, 50),
+    }
+
+
+def run_case(name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Executa um caso neste processo"""
+    from benchmarks.suite import CASES, measure
+
+    case = next(c for c in CASES if c.name == name)
+    result: Dict[str, Any] = {
+        'name': case.name,
+        'group': case.group,
+        'params': case.params,
+        'unit': f'{case.unit}/s',
+    }
+
+    skip = case.missing_requirement()
+    if skip:
+        return {**result, 'status': 'skipped', 'reason': skip}
+
+    func = case.setup()
+    timings = measure(func, **options)
+    return {**result, 'status': 'ok', **summarize(timings, case.units), 'peak_rss_mb': peak_rss_mb()}
+
+
+def run_isolated(name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Executa um caso em um processo novo e lê o resultado da saída padrão"""
+    proc = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.run_benchmarks', '--child', name,
+         '--child-options', json.dumps(options)],
+        capture_output=True,
+        text=True
+    )
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()
+        return {'name': name, 'status': 'error', 'reason': error[-1] if error else f'código {proc.returncode}'}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def git_revision() -> Optional[str]:
+    try:
+        proc = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True)
+    except OSError:
+        return None
+    return proc.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        'schema': SCHEMA_VERSION,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def format_results(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None) -> str:
+    base = {r['name']: r for r in (baseline or {}).get('results', []) if r.get('status') == 'ok'}
+    header = f"{'caso':<22} {'iter':>5} {'p50 (ms)':>10} {'p90 (ms)':>10} {'p99 (ms)':>10} {'vazão':>18} {'RSS (MB)':>9}"
+    if base:
+        header += f" {'p50 x base':>11}"
+    lines = [header]
+
+    for r in results:
+        if r['status'] != 'ok':
+            lines.append(f"{r['name']:<22} {r['status']}: {r.get('reason', '')}")
+            continue
+        latency = r['latency_ms']
+        throughput = f"{r['throughput']:,.1f} {r['unit']}"
+        line = (
+            f"{r['name']:<22} {r['iterations']:>5} {latency['p50']:>10.2f} {latency['p90']:>10.2f} "
+            f"{latency['p99']:>10.2f} {throughput:>18} {r['peak_rss_mb']:>9.1f}"
+        )
+        if r['name'] in base:
+            line += f" {latency['p50'] / base[r['name']]['latency_ms']['p50']:>10.2f}x"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('cases', nargs='*', help='grupos, nomes ou prefixos (padrão: todos)')
+    parser.add_argument('--output', '-o', help='grava os resultados em JSON neste caminho')
+    parser.add_argument('--compare', help='JSON de uma execução anterior para comparar o p50')
+    parser.add_argument('--min-iterations', type=int, default=5)
+    parser.add_argument('--max-iterations', type=int, default=50)
+    parser.add_argument('--min-time', type=float, default=1.0, help='segundos mínimos por caso')
+    parser.add_argument('--quick', action='store_true', help='3 iterações por caso, sem tempo mínimo')
+    parser.add_argument('--in-process', action='store_true', help='não isola os casos em processos próprios')
+    parser.add_argument('--list', action='store_true', help='lista os casos e sai')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--child-options', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_case(args.child, json.loads(args.child_options))))
+        return
+
+    from benchmarks.suite import select
+
+    cases = select(args.cases)
+    if args.list:
+        for case in cases:
+            print(f'{case.name:<22} {case.group}')
+        return
+    if not cases:
+        raise SystemExit(f'Nenhum caso corresponde a {args.cases}')
+
+    options = {
+        'min_iterations': 3 if args.quick else args.min_iterations,
+        'max_iterations': 3 if args.quick else args.max_iterations,
+        'min_time': 0.0 if args.quick else args.min_time,
+    }
+
+    results = []
+    for case in cases:
+        result = run_case(case.name, options) if args.in_process else run_isolated(case.name, options)
+        results.append(result)
+        print(format_results([result]).splitlines()[-1], file=sys.stderr, flush=True)
+
+    report = {**environment(), 'isolated': not args.in_process, 'options': options, 'results': results}
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print(format_results(results, baseline))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f'\nResultados gravados em {args.output}')
+
+
+if __name__ == '__main__':
+    main()
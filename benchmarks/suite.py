@@ -0,0 +1,242 @@
+"""
+Casos do suite de benchmarks (sem acesso à rede)
+
+Cada caso prepara seus dados no `setup` e devolve a função medida; o driver
+(benchmarks.run_benchmarks) cuida de repetições, percentis, vazão e RSS.
+"""
+
+import importlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from benchmarks.bench_table import make_ledger
+from src.reporter.report_framework import ChartType, ReportBuilder, ReportConfig, ReportTheme, create_report
+
+
+@dataclass
+class Case:
+    """Um benchmark: `setup()` devolve a função sem argumentos que será cronometrada"""
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Any]]
+    units: int = 1
+    unit: str = 'ops'
+    requires: Tuple[str, ...] = ()
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    def missing_requirement(self) -> Optional[str]:
+        """Motivo para pular o caso (dependência ausente ou sem bibliotecas do sistema)"""
+        for module in self.requires:
+            try:
+                importlib.import_module(module)
+            except (ImportError, OSError) as exc:
+                return f"{module} indisponível ({type(exc).__name__}: {str(exc).splitlines()[0][:60]})"
+        return None
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, group: str, **kwargs: Any) -> Callable:
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable:
+        CASES.append(Case(name, group, setup, **kwargs))
+        return setup
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Relatórios representativos
+# ---------------------------------------------------------------------------
+
+KPIS = [
+    {'label': 'Receita', 'value': 'R$ 2.5M', 'trend': 'up', 'change': '+15%'},
+    {'label': 'Clientes', 'value': '342', 'trend': 'up', 'change': '+22%'},
+    {'label': 'Conversão', 'value': '3.2%', 'trend': 'down', 'change': '-0.5%'},
+]
+
+
+def small_report() -> ReportBuilder:
+    """Resumo executivo, KPIs e uma tabela curta"""
+    report = create_report('Resumo Semanal', theme=ReportTheme.CORPORATE)
+    report.add_executive_summary(
+        highlights=['Receita acima da meta', 'Churn estável'],
+        metrics={'MRR': 'R$ 833K', 'NPS': '72'}
+    )
+    report.add_kpi_grid('Indicadores', KPIS, columns=3)
+    report.add_table('Vendas por Região', make_ledger(50))
+    return report
+
+
+def dashboard_report(seed: int = 0) -> ReportBuilder:
+    """KPIs, três gráficos e duas tabelas médias"""
+    rng = np.random.default_rng(seed)
+    report = create_report('Dashboard Mensal', theme=ReportTheme.EXECUTIVE)
+    report.add_kpi_grid('Indicadores', KPIS, columns=3)
+    report.add_chart('Receita', ChartType.BAR, {'2024': rng.integers(50, 100, 12).tolist()})
+    report.add_chart('Tendência', ChartType.LINE, {'Receita': rng.normal(100, 10, 12).round(1).tolist()})
+    report.add_chart('Mix', ChartType.PIE, {'Mix': [40, 35, 25]}, labels=['A', 'B', 'C'])
+    report.add_table('Lançamentos', make_ledger(500, seed))
+    report.add_table('Detalhe', make_ledger(1_000, seed + 1), page_break_before=True)
+    return report
+
+
+def ledger_report(rows: int = 10_000) -> ReportBuilder:
+    """Uma tabela longa (dezenas de páginas)"""
+    report = create_report('Razão Contábil', theme=ReportTheme.MINIMAL)
+    report.add_section('Notas', 'Extrato completo do período.')
+    report.add_table('Lançamentos', make_ledger(rows))
+    return report
+
+
+REPORTS = {
+    'small': small_report,
+    'dashboard': dashboard_report,
+    'ledger': ledger_report,
+}
+
+
+# ---------------------------------------------------------------------------
+# Casos
+# ---------------------------------------------------------------------------
+
+def _table_case(rows: int) -> None:
+    @case(f'table/{rows}', 'table', units=rows, unit='linhas', params={'rows': rows})
+    def setup():
+        builder = ReportBuilder(ReportConfig(title='Benchmark'))
+        df = make_ledger(rows)
+        return lambda: builder._render_table(df)
+
+
+for _rows in (1_000, 10_000, 100_000):
+    _table_case(_rows)
+
+
+def _chart_case(chart_type: ChartType) -> None:
+    @case(f'chart/{chart_type.value}', 'chart', requires=('matplotlib',), params={'type': chart_type.value})
+    def setup():
+        from src.reporter.charts import render_chart_png
+
+        config = {
+            'type': chart_type.value,
+            'data': {'Série A': [12, 19, 3, 5, 2, 3], 'Série B': [7, 11, 5, 8, 3, 7]},
+            'labels': ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun'],
+            'colors': None
+        }
+        # Sem cache: mede a renderização do matplotlib em si
+        return lambda: render_chart_png(config)
+
+
+for _chart_type in ChartType:
+    _chart_case(_chart_type)
+
+
+@case('builder/construct', 'builder', params={'report': 'dashboard'})
+def _builder_construct():
+    ledger = make_ledger(1_000)
+
+    def build():
+        report = create_report('Dashboard Mensal')
+        report.add_executive_summary(['Receita acima da meta'], {'MRR': 'R$ 833K'})
+        report.add_kpi_grid('Indicadores', KPIS, columns=3)
+        report.add_chart('Receita', ChartType.BAR, {'2024': list(range(12))})
+        report.add_table('Lançamentos', ledger)
+        report.add_comparison('Fornecedores', [{'name': 'A', 'Preço': '1'}], ['Preço'])
+        return report
+
+    return build
+
+
+def _template_case(name: str) -> None:
+    @case(f'template/{name}', 'template', requires=('jinja2',), params={'report': name})
+    def setup():
+        from src.reporter.templates import get_template
+
+        report = REPORTS[name]()
+        context = {
+            'config': report.config,
+            'sections': report._prepare_sections(),
+            'date_formatted': report.config.date.strftime('%d/%m/%Y'),
+            'logo_url': None,
+            'theme': report._theme_name()
+        }
+        template = get_template(report.config.template)
+        return lambda: template.render(**context)
+
+
+def _layout_case(name: str) -> None:
+    @case(f'layout/{name}', 'layout', requires=('weasyprint',), params={'report': name})
+    def setup():
+        from weasyprint import HTML
+
+        from src.reporter.assets import RenderAssets
+        from src.reporter.themes import get_stylesheets
+
+        report = REPORTS[name]()
+        assets = RenderAssets()
+        html = report._build_html(assets=assets)
+        stylesheets = get_stylesheets(report._theme_name(), report.config.custom_css)
+        return lambda: HTML(string=html, url_fetcher=assets.url_fetcher()).render(stylesheets=stylesheets)
+
+
+def _reset_caches() -> None:
+    """Esvazia os caches de fragmentos, gráficos e assets (o de relatórios só vale com cache=True)"""
+    from src.reporter.assets import configure_asset_registry
+    from src.reporter.charts import configure_chart_cache
+    from src.reporter.fragments import configure_fragment_cache
+
+    configure_fragment_cache()
+    configure_chart_cache()
+    configure_asset_registry()
+
+
+def _generate_case(name: str) -> None:
+    @case(f'generate/{name}', 'generate', requires=('weasyprint', 'matplotlib'), params={'report': name})
+    def setup():
+        report = REPORTS[name]()
+
+        def generate():
+            # Sem os caches, cada iteração mede a renderização completa, não um acerto de cache
+            _reset_caches()
+            return report.generate()
+        return generate
+
+
+for _name in REPORTS:
+    _template_case(_name)
+    _layout_case(_name)
+    _generate_case(_name)
+
+
+def select(patterns: List[str]) -> List[Case]:
+    """Casos pelo nome exato, grupo ou prefixo terminado em '/' (todos, sem padrões)"""
+    if not patterns:
+        return list(CASES)
+    return [
+        c for c in CASES
+        if any(c.name == p or c.group == p.rstrip('/') or (p.endswith('/') and c.name.startswith(p)) for p in patterns)
+    ]
+
+
+def measure(
+    func: Callable[[], Any],
+    min_iterations: int = 3,
+    max_iterations: int = 50,
+    min_time: float = 1.0,
+    warmup: int = 1
+) -> List[float]:
+    """Latências (s): ao menos `min_iterations` e `min_time` segundos, no máximo `max_iterations`"""
+    for _ in range(warmup):
+        func()
+
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < max_iterations and (
+        len(timings) < min_iterations or time.perf_counter() - started < min_time
+    ):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
@@ -11,6 +11,7 @@ from examples.exemplo_comparativo import exemplo_comparativo
 from examples.exemplo_completo import exemplo_completo
 from examples.exemplo_multi_idioma import exemplo_multi_idioma
 from examples.exemplo_pipeline import exemplo_pipeline
+from examples.exemplo_sql import exemplo_sql
 
 
 def main():
@@ -37,4 +38,7 @@ def main():
     print("\n7. Multi-idioma...")
     exemplo_multi_idioma()
     
+    print("\n8. Tabela direto do banco (SQL em blocos)...")
+    exemplo_sql()
+    
     print("\n✨ Todos os exemplos executados com sucesso!")
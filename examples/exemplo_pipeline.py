@@ -43,7 +43,11 @@ def exemplo_pipeline():
         
         report.add_table(
             title="Detalhamento por Produto",
-            data=vendas
+            data=vendas,
+            highlight_rows={
+                'row-danger': "'% Meta' < 100",
+                'row-success': "'% Meta' >= 100",
+            }
         )
         
         # Salva com nome padrão
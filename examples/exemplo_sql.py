@@ -0,0 +1,54 @@
+from src.reporter.report_framework import (
+    create_report,
+    ColumnFormat,
+    ReportTheme,
+)
+import sqlite3
+import numpy as np
+
+
+
+def exemplo_sql():
+    """Tabela direto de uma consulta SQL, lida em blocos"""
+
+    # Banco de exemplo em memória (em produção: a conexão do seu banco)
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE vendas (pedido INTEGER, regiao TEXT, valor REAL, margem REAL)')
+
+    rng = np.random.default_rng(42)
+    regioes = ['Norte', 'Sul', 'Leste', 'Oeste']
+    conn.executemany(
+        'INSERT INTO vendas VALUES (?, ?, ?, ?)',
+        (
+            (pedido, regioes[pedido % 4], float(rng.uniform(100, 5000)), float(rng.uniform(-0.1, 0.4)))
+            for pedido in range(1, 20_001)
+        )
+    )
+
+    report = create_report(
+        title="Pedidos do Trimestre",
+        theme=ReportTheme.CORPORATE
+    )
+
+    report.add_section(
+        "Sobre este relatório",
+        "Os pedidos são lidos do banco em blocos de 5.000 linhas e formatados direto em HTML."
+    )
+
+    # Só a marcação da tabela fica guardada, nunca o resultado inteiro da consulta
+    report.add_table_from_query(
+        title="Pedidos acima de R$ 1.000",
+        conn=conn,
+        sql='SELECT pedido AS "Pedido", regiao AS "Região", valor AS "Valor", margem AS "Margem" '
+            'FROM vendas WHERE valor > ? ORDER BY pedido',
+        params=(1000,),
+        chunksize=5_000,
+        formats={'Valor': 'currency', 'Margem': ColumnFormat.percent(scale=100)},
+        locale='pt-BR',
+        highlight_rows={'row-danger': "Margem < 0"},
+        page_break_before=True
+    )
+    conn.close()
+
+    report.generate("files/pedidos_sql.pdf")
+    print("✅ Relatório gerado a partir do banco: files/pedidos_sql.pdf")
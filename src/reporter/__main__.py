@@ -0,0 +1,7 @@
+"""Permite executar `python -m src.reporter <comando>`"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+API assíncrona para uso dentro de serviços asyncio (aiohttp, FastAPI, ...)
+A renderização roda em um executor limitado, fora do event loop, com limite de
+concorrência e de fila para aplicar backpressure
+"""
+
+import asyncio
+import os
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional, Union
+
+from .batch import _render_job, get_render_pool, pack_builder
+
+
+class RenderQueueFull(RuntimeError):
+    """A fila do renderizador assíncrono está cheia (backpressure)"""
+
+
+class AsyncRenderer:
+    """Renderizador assíncrono com concorrência e profundidade de fila limitadas
+
+    No máximo `max_concurrency` relatórios renderizam ao mesmo tempo e até
+    `max_queue` aguardam vaga; além disso, `render` falha imediatamente com
+    RenderQueueFull. `executor` pode ser 'process' (pool de workers aquecidos,
+    compartilhado com generate_many), 'thread' ou um Executor próprio.
+
+    Cancelar a task que aguarda `render` libera a vaga; um relatório que ainda
+    não começou no executor é descartado, um que já está em andamento termina
+    no worker e o resultado é ignorado.
+
+    O limite de concorrência vale por event loop: o mesmo renderizador pode
+    servir vários loops (ex.: asyncio.run chamado mais de uma vez).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_queue: int = 64,
+        executor: Union[str, Executor] = 'process'
+    ):
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._executor_spec = executor
+        self._executor: Optional[Executor] = executor if isinstance(executor, Executor) else None
+        self._semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = \
+            weakref.WeakKeyDictionary()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Relatórios em andamento ou aguardando vaga"""
+        return self._pending
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor_spec == 'process':
+            # Sem cache: o pool compartilhado é trocado se um worker morrer
+            return get_render_pool(self.max_concurrency).executor
+        if self._executor is None:
+            if self._executor_spec == 'thread':
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix='reporter-render'
+                )
+            else:
+                raise ValueError(f"Executor desconhecido: {self._executor_spec!r}")
+        return self._executor
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """Semáforo do event loop (criado no primeiro render de cada loop)"""
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def render(self, builder: Any, output_path: Optional[str] = None) -> bytes:
+        """Gera o PDF de `builder` sem bloquear o event loop"""
+        if self._pending >= self.max_concurrency + self.max_queue:
+            raise RenderQueueFull(
+                f"{self._pending} relatórios pendentes "
+                f"(concorrência {self.max_concurrency}, fila {self.max_queue})"
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            async with self._semaphore(loop):
+                if self._executor_spec == 'thread':
+                    payload = builder
+                else:
+                    # Serializar um relatório grande também é trabalho: fora do event loop
+                    payload = await loop.run_in_executor(None, pack_builder, builder)
+                pdf_bytes, _, _ = await loop.run_in_executor(
+                    self.executor,
+                    _render_job,
+                    payload,
+                    os.fspath(output_path) if output_path is not None else None,
+                    True
+                )
+                return pdf_bytes
+        finally:
+            self._pending -= 1
+
+    async def render_many(
+        self,
+        builders: Iterable[Any],
+        return_exceptions: bool = False
+    ) -> List[Union[bytes, BaseException]]:
+        """Gera vários PDFs concorrentemente, respeitando os limites do renderizador"""
+        return await asyncio.gather(
+            *(self.render(builder) for builder in builders),
+            return_exceptions=return_exceptions
+        )
+
+    def shutdown(self) -> None:
+        """Encerra o executor de threads próprio (o pool de processos é compartilhado)"""
+        if self._executor_spec == 'thread' and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_default_renderer: Optional[AsyncRenderer] = None
+
+
+def get_async_renderer() -> AsyncRenderer:
+    """Renderizador assíncrono padrão do processo"""
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = AsyncRenderer()
+    return _default_renderer
+
+
+def configure_async_renderer(
+    max_concurrency: Optional[int] = None,
+    max_queue: int = 64,
+    executor: Union[str, Executor] = 'process'
+) -> AsyncRenderer:
+    """Substitui o renderizador assíncrono padrão"""
+    global _default_renderer
+    if _default_renderer is not None:
+        _default_renderer.shutdown()
+    _default_renderer = AsyncRenderer(max_concurrency, max_queue, executor)
+    return _default_renderer
+
+
+async def agenerate_many(
+    builders: Iterable[Any],
+    return_exceptions: bool = False,
+    renderer: Optional[AsyncRenderer] = None
+) -> List[Union[bytes, BaseException]]:
+    """Versão assíncrona de lote: PDFs na mesma ordem de `builders`"""
+    renderer = renderer or get_async_renderer()
+    return await renderer.render_many(builders, return_exceptions=return_exceptions)
@@ -0,0 +1,229 @@
+"""
+Registro de assets em memória (gráficos, logo)
+Imagens ficam como bytes sob URLs por hash de conteúdo e chegam ao WeasyPrint
+por um url_fetcher próprio, sem ida e volta em base64 dentro do HTML.
+Imagens idênticas (o mesmo logo, um gráfico repetido) são guardadas uma vez.
+"""
+
+import base64
+import hashlib
+import mimetypes
+import os
+import threading
+import urllib.parse
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .cache import LRUCache
+
+ASSET_SCHEME = 'reporter-asset'
+
+# Diretórios locais liberados na renderização corrente (None: sem restrição)
+_allowed_roots: ContextVar[Optional[Tuple[str, ...]]] = ContextVar('reporter_allowed_roots', default=None)
+
+
+@contextmanager
+def restrict_resources(allowed_roots: Iterable[Union[str, os.PathLike]] = ()) -> Iterator[None]:
+    """Limita o que uma renderização lê fora da memória (especificações não confiáveis)
+
+    Dentro do bloco só assets em memória, data: URIs e arquivos sob
+    `allowed_roots` são lidos: logo, @import e url() fora deles, file:// e
+    URLs remotas são recusados (o logo some, o recurso não carrega).
+    """
+    roots = tuple(os.path.realpath(os.fspath(root)) for root in allowed_roots)
+    token = _allowed_roots.set(roots)
+    try:
+        yield
+    finally:
+        _allowed_roots.reset(token)
+
+
+def resource_policy() -> Optional[Tuple[str, ...]]:
+    """Diretórios liberados na renderização corrente (None: sem restrição)"""
+    return _allowed_roots.get()
+
+
+def check_local_path(path: Union[str, os.PathLike]) -> None:
+    """PermissionError se `path` está fora dos diretórios liberados"""
+    roots = _allowed_roots.get()
+    if roots is None:
+        return
+    real = os.path.realpath(os.fspath(path))
+    for root in roots:
+        if os.path.commonpath([root, real]) == root:
+            return
+    raise PermissionError(f"Arquivo fora dos diretórios permitidos: {os.fspath(path)}")
+
+
+def check_url(url: str) -> None:
+    """PermissionError se a URL não pode ser lida na renderização corrente"""
+    if _allowed_roots.get() is None or url.startswith('data:'):
+        return
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme != 'file':
+        raise PermissionError(f"URL externa recusada: {url}")
+    from urllib.request import url2pathname  # puxa ssl/http.client: só quando há restrição
+
+    check_local_path(url2pathname(parts.path))
+
+
+@dataclass(frozen=True)
+class Asset:
+    data: bytes
+    mime_type: str = 'image/png'
+
+
+def asset_url(data: bytes) -> str:
+    """URL estável do conteúdo (o mesmo em qualquer processo)"""
+    return f'{ASSET_SCHEME}:{hashlib.sha256(data).hexdigest()}'
+
+
+class AssetRegistry:
+    """Assets por hash de conteúdo, LRU limitado em bytes
+
+    Arquivos (o logo) são lidos do disco uma vez por (caminho, tamanho, mtime).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = 128 * 1024 * 1024):
+        self._assets = LRUCache(max_entries=None, max_bytes=max_bytes)
+        self._files: Dict[str, Tuple[int, int, str, Asset]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    @property
+    def nbytes(self) -> int:
+        return self._assets.nbytes
+
+    def add(self, data: bytes, mime_type: str = 'image/png') -> Tuple[str, Asset]:
+        url = asset_url(data)
+        asset = self._assets.get(url)
+        if asset is None:
+            asset = Asset(data, mime_type)
+            self._assets.put(url, asset, len(data))
+        return url, asset
+
+    def get(self, url: str) -> Optional[Asset]:
+        return self._assets.get(url)
+
+    def add_file(self, path: str) -> Tuple[str, Asset]:
+        """Asset de um arquivo, relido só quando tamanho ou mtime mudam
+
+        OSError se não existir ou (PermissionError) se estiver fora dos
+        diretórios liberados por restrict_resources.
+        """
+        check_local_path(path)
+        st = os.stat(path)
+        with self._lock:
+            known = self._files.get(path)
+        if known is not None and known[:2] == (st.st_size, st.st_mtime_ns):
+            _, _, url, asset = known
+            if self._assets.get(url) is None:
+                self._assets.put(url, asset, len(asset.data))
+            return url, asset
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        mime_type = mimetypes.guess_type(path)[0] or 'image/png'
+        url, asset = self.add(data, mime_type)
+        with self._lock:
+            self._files[path] = (st.st_size, st.st_mtime_ns, url, asset)
+        return url, asset
+
+    def clear(self) -> None:
+        self._assets.clear()
+        with self._lock:
+            self._files.clear()
+
+
+_registry = AssetRegistry()
+
+
+def configure_asset_registry(max_bytes: Optional[int] = 128 * 1024 * 1024) -> AssetRegistry:
+    """Reconfigura o registro de assets do processo"""
+    global _registry
+    _registry = AssetRegistry(max_bytes=max_bytes)
+    return _registry
+
+
+def get_asset_registry() -> AssetRegistry:
+    return _registry
+
+
+class RenderAssets:
+    """Assets referenciados por uma renderização
+
+    Mantém os bytes vivos até o fim do layout, mesmo que o registro os descarte,
+    e fornece o url_fetcher do WeasyPrint.
+    """
+
+    def __init__(self, registry: Optional[AssetRegistry] = None):
+        self.registry = registry if registry is not None else get_asset_registry()
+        self.assets: Dict[str, Asset] = {}
+
+    def add(self, data: bytes, mime_type: str = 'image/png') -> str:
+        url, asset = self.registry.add(data, mime_type)
+        self.assets[url] = asset
+        return url
+
+    def add_file(self, path: str) -> str:
+        url, asset = self.registry.add_file(path)
+        self.assets[url] = asset
+        return url
+
+    def pin(self, url: str) -> bool:
+        """Reserva um asset já registrado; False se ele foi descartado"""
+        asset = self.assets.get(url) or self.registry.get(url)
+        if asset is None:
+            return False
+        self.assets[url] = asset
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(asset.data) for asset in self.assets.values())
+
+    def data_uri(self, url: str) -> str:
+        asset = self.assets[url]
+        return f'data:{asset.mime_type};base64,{base64.b64encode(asset.data).decode()}'
+
+    def inline(self, html: str) -> str:
+        """HTML autocontido: troca as URLs de asset por data URIs (para uso sem o fetcher)"""
+        for url in self.assets:
+            if url in html:
+                html = html.replace(url, self.data_uri(url))
+        return html
+
+    def url_fetcher(self) -> Any:
+        """url_fetcher do WeasyPrint que serve os assets e delega as demais URLs (ver restrict_resources)"""
+        return make_url_fetcher(self.assets)
+
+
+def make_url_fetcher(assets: Dict[str, Asset]) -> Any:
+    import weasyprint
+
+    if hasattr(weasyprint, 'URLFetcher'):
+        from weasyprint.urls import URLFetcherResponse
+
+        class AssetURLFetcher(weasyprint.URLFetcher):
+            def fetch(self, url, headers=None):
+                asset = assets.get(url)
+                if asset is None:
+                    check_url(url)
+                    return super().fetch(url, headers)
+                return URLFetcherResponse(url, asset.data, {'Content-Type': asset.mime_type})
+
+        return AssetURLFetcher()
+
+    # WeasyPrint antigo: url_fetcher é uma função que retorna um dicionário
+    def fetch(url: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        asset = assets.get(url)
+        if asset is None:
+            check_url(url)
+            return weasyprint.default_url_fetcher(url, *args, **kwargs)
+        return {'string': asset.data, 'mime_type': asset.mime_type, 'redirected_url': url}
+
+    return fetch
@@ -0,0 +1,375 @@
+"""
+Geração em lote com pool de workers aquecidos
+Cada worker importa WeasyPrint, pandas e matplotlib e renderiza um documento
+mínimo uma única vez; os relatórios seguintes já encontram fontes, stylesheets
+e template carregados
+"""
+
+import atexit
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+
+@dataclass
+class BatchResult:
+    """Resultado de um relatório do lote"""
+    index: int
+    output_path: Optional[str] = None
+    pdf_bytes: Optional[bytes] = None
+    size: int = 0
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+    traceback: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    """Vazão agregada de um lote"""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_bytes: int = 0
+    render_time: float = 0.0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def reports_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+
+BatchItem = Union[Any, Tuple[Any, Optional[str]]]
+
+TRANSPORTS = ('pipe', 'shm')
+
+
+def _warm_render_worker() -> None:
+    """Inicializador dos workers: imports pesados + um render mínimo"""
+    import pandas  # noqa: F401
+    from matplotlib.figure import Figure  # noqa: F401
+    from weasyprint import HTML
+
+    from .templates import get_template
+    from .themes import get_theme_stylesheet
+
+    get_template()
+    HTML(string='<p>warm-up</p>').write_pdf(stylesheets=[get_theme_stylesheet('corporate')])
+
+
+def _noop() -> None:
+    pass
+
+
+def pack_builder(builder: Any) -> Any:
+    """Prepara o relatório para envio ao worker
+
+    ReportBuilder comuns (e ReportSpec) viajam como ReportSpec binário (colunas
+    em buffers); subclasses, que podem sobrescrever a renderização, seguem por pickle.
+    """
+    from .spec import ReportSpec
+
+    if isinstance(builder, ReportSpec):
+        return builder.to_bytes()
+    if _is_plain_builder(builder):
+        return ReportSpec.from_builder(builder).to_bytes()
+    return builder
+
+
+def _is_plain_builder(builder: Any) -> bool:
+    from .report_framework import ReportBuilder
+
+    return type(builder) is ReportBuilder
+
+
+def _is_spec(builder: Any) -> bool:
+    from .spec import ReportSpec
+
+    return isinstance(builder, ReportSpec)
+
+
+def unpack_builder(payload: Any) -> Any:
+    """Inverso de pack_builder, executado no worker"""
+    from .spec import ReportSpec
+
+    if isinstance(payload, bytes):
+        return ReportSpec.from_bytes(payload).to_builder()
+    if isinstance(payload, ReportSpec):
+        return payload.to_builder()
+    return payload
+
+
+def _generate(builder: Any, output_path: Optional[str], return_bytes: bool) -> Tuple[Optional[bytes], int, float]:
+    """Gera o PDF e devolve (bytes opcionais, tamanho, tempo)
+
+    Com caminho de saída e sem `return_bytes`, o WeasyPrint escreve direto no
+    arquivo e o PDF nunca fica inteiro em memória no worker.
+    """
+    start = time.perf_counter()
+    if output_path is not None and not return_bytes:
+        builder.generate_to(output_path)
+        pdf_bytes, size = None, os.path.getsize(output_path)
+    else:
+        pdf_bytes = builder.generate(output_path)
+        size = len(pdf_bytes)
+    return pdf_bytes, size, time.perf_counter() - start
+
+
+def _render_job(payload: Any, output_path: Optional[str], return_bytes: bool) -> Tuple[Optional[bytes], int, float]:
+    """Executa no worker: gera o PDF e devolve (bytes opcionais, tamanho, tempo)"""
+    return _generate(unpack_builder(payload), output_path, return_bytes)
+
+
+def _render_shared_job(handle: Tuple[str, int], output_path: Optional[str], return_bytes: bool) -> Tuple[Optional[bytes], int, float]:
+    """Como _render_job, mas lendo as tabelas do segmento de memória compartilhada"""
+    from .shm import with_shared_builder
+
+    return with_shared_builder(handle, lambda builder: _generate(builder, output_path, return_bytes))
+
+
+def _release_when_done(future: Future, shared: Any) -> Future:
+    """Future que só termina depois de o segmento de `shared` ser removido
+
+    Callbacks rodam depois de acordar quem espera; repassar o resultado a um
+    segundo future garante que o segmento já sumiu quando a espera retorna.
+    """
+    outer: Future = Future()
+    outer.add_done_callback(lambda done: done.cancelled() and future.cancel())
+
+    def forward(done: Future) -> None:
+        shared.release()
+        if done.cancelled():
+            outer.cancel()
+        if not outer.set_running_or_notify_cancel():
+            return
+        if done.exception() is not None:
+            outer.set_exception(done.exception())
+        else:
+            outer.set_result(done.result())
+
+    future.add_done_callback(forward)
+    return outer
+
+
+class RenderPool:
+    """Pool persistente de processos aquecidos para renderizar relatórios"""
+
+    def __init__(self, jobs: Optional[int] = None):
+        self.jobs = jobs or os.cpu_count() or 1
+        # Workers herdam o resource tracker deste processo: segmentos de memória
+        # compartilhada (transport='shm') ficam registrados uma única vez, no dono
+        resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_warm_render_worker
+        )
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        return self._executor
+
+    @property
+    def broken(self) -> bool:
+        """Um worker morreu e o executor não aceita mais jobs"""
+        return bool(getattr(self._executor, '_broken', False))
+
+    def prestart(self) -> None:
+        """Sobe todos os workers (e roda o aquecimento) antes do primeiro relatório"""
+        wait([self._executor.submit(_noop) for _ in range(self.jobs)])
+
+    def submit(
+        self,
+        builder: Any,
+        output_path: Optional[str] = None,
+        return_bytes: bool = True,
+        transport: str = 'pipe'
+    ) -> Future:
+        """Envia um relatório ao pool
+
+        `builder` é um ReportBuilder ou ReportSpec. `transport='pipe'` serializa
+        o relatório no pipe do worker; 'shm' publica as tabelas em memória
+        compartilhada (removida quando o job termina) e o worker as lê sem cópia.
+        Subclasses de ReportBuilder sempre usam 'pipe'.
+        """
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Transporte desconhecido: {transport!r} (use {', '.join(TRANSPORTS)})")
+
+        if transport == 'shm' and (_is_plain_builder(builder) or _is_spec(builder)):
+            from .shm import SharedSpec
+
+            shared = SharedSpec(builder) if _is_spec(builder) else SharedSpec.from_builder(builder)
+            try:
+                future = self._executor.submit(_render_shared_job, shared.handle, output_path, return_bytes)
+            except BaseException:
+                shared.release()
+                raise
+            return _release_when_done(future, shared)
+
+        return self._executor.submit(_render_job, pack_builder(builder), output_path, return_bytes)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_pools: Dict[int, RenderPool] = {}
+_pool_lock = threading.Lock()
+
+
+def get_render_pool(jobs: Optional[int] = None) -> RenderPool:
+    """Pool compartilhado do processo, um por número de workers
+
+    Pools de outros tamanhos seguem vivos (outros chamadores podem estar
+    usando); um pool quebrado (worker morto) é trocado por um novo.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    with _pool_lock:
+        pool = _pools.get(jobs)
+        if pool is None or pool.broken:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            pool = _pools[jobs] = RenderPool(jobs)
+        return pool
+
+
+def shutdown_render_pool() -> None:
+    """Encerra os pools compartilhados (chamado automaticamente na saída)"""
+    with _pool_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+atexit.register(shutdown_render_pool)
+
+
+def _unpack(item: BatchItem) -> Tuple[Any, Optional[str]]:
+    if isinstance(item, tuple):
+        builder, output_path = item
+        return builder, (os.fspath(output_path) if output_path is not None else None)
+    return item, None
+
+
+class BatchRun:
+    """Resultados de generate_many, entregues na ordem em que terminam
+
+    Itere para consumir os BatchResult; `stats` acompanha a vazão agregada e
+    fica completo quando a iteração termina.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[BatchItem],
+        pool: RenderPool,
+        return_bytes: Optional[bool],
+        max_pending: int,
+        transport: str = 'pipe'
+    ):
+        self.stats = BatchStats()
+        self._items = iter(items)
+        self._pool = pool
+        self._return_bytes = return_bytes
+        self._max_pending = max_pending
+        self._transport = transport
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        in_flight: Dict[Future, Tuple[int, Optional[str]]] = {}
+        index = 0
+        exhausted = False
+
+        while True:
+            # Mantém no máximo `max_pending` relatórios em voo (memória limitada)
+            while not exhausted and len(in_flight) < self._max_pending:
+                try:
+                    item = next(self._items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                builder, output_path = _unpack(item)
+                return_bytes = self._return_bytes if self._return_bytes is not None else output_path is None
+                self.stats.submitted += 1
+                try:
+                    # Serializar (ou publicar em memória compartilhada) também pode falhar
+                    future = self._pool.submit(builder, output_path, return_bytes, self._transport)
+                except Exception as exc:
+                    yield self._failure(index, output_path, exc)
+                else:
+                    in_flight[future] = (index, output_path)
+                index += 1
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, output_path = in_flight.pop(future)
+                yield self._collect(future, idx, output_path)
+
+        self.stats.finished_at = time.perf_counter()
+
+    def _collect(self, future: Future, index: int, output_path: Optional[str]) -> BatchResult:
+        try:
+            pdf_bytes, size, elapsed = future.result()
+        except Exception as exc:
+            return self._failure(index, output_path, exc)
+
+        self.stats.completed += 1
+        self.stats.total_bytes += size
+        self.stats.render_time += elapsed
+        return BatchResult(
+            index=index,
+            output_path=output_path,
+            pdf_bytes=pdf_bytes,
+            size=size,
+            elapsed=elapsed
+        )
+
+    def _failure(self, index: int, output_path: Optional[str], exc: Exception) -> BatchResult:
+        self.stats.failed += 1
+        return BatchResult(
+            index=index,
+            output_path=output_path,
+            error=exc,
+            traceback=''.join(traceback.format_exception(exc))
+        )
+
+
+def generate_many(
+    items: Iterable[BatchItem],
+    jobs: Optional[int] = None,
+    return_bytes: Optional[bool] = None,
+    max_pending: Optional[int] = None,
+    transport: str = 'pipe'
+) -> BatchRun:
+    """Gera vários relatórios em um pool persistente de workers aquecidos
+
+    `items` contém ReportBuilder, ReportSpec ou tuplas (relatório, caminho_de_saída).
+    Os bytes do PDF só voltam ao processo principal quando não há caminho de
+    saída (ou com `return_bytes=True`). Erros são devolvidos no BatchResult,
+    sem interromper o lote.
+
+    Com `transport='shm'`, as tabelas de cada relatório são escritas uma vez
+    em memória compartilhada e lidas sem cópia pelo worker; `max_pending`
+    limita quantos segmentos existem ao mesmo tempo.
+    """
+    pool = get_render_pool(jobs)
+    return BatchRun(
+        items,
+        pool,
+        return_bytes=return_bytes,
+        max_pending=max_pending or pool.jobs * 4,
+        transport=transport
+    )
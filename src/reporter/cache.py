@@ -0,0 +1,321 @@
+"""
+Caches endereçados por conteúdo
+LRU em memória limitado por entradas/bytes, com camada opcional em disco limitada por tamanho
+"""
+
+import dataclasses
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+
+def fingerprint(*parts: Any) -> str:
+    """Hash SHA-256 estável (entre processos e execuções) de estruturas aninhadas
+
+    Aceita None, bool, números, strings, bytes, Enum, datas, dict, list/tuple,
+    dataclasses, arrays NumPy, Series e DataFrames do pandas.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        _feed(digest, part)
+    return digest.hexdigest()
+
+
+def _feed_bytes(digest, tag: bytes, data: bytes) -> None:
+    digest.update(tag)
+    digest.update(struct.pack('<Q', len(data)))
+    digest.update(data)
+
+
+def _feed(digest, obj: Any) -> None:
+    """Alimenta o hash com uma codificação tipada (sem ambiguidade) de `obj`"""
+    if obj is None:
+        digest.update(b'N')
+    elif isinstance(obj, bool):
+        digest.update(b'T' if obj else b'F')
+    elif isinstance(obj, int):
+        _feed_bytes(digest, b'I', str(obj).encode())
+    elif isinstance(obj, float):
+        _feed_bytes(digest, b'R', obj.hex().encode())
+    elif isinstance(obj, str):
+        _feed_bytes(digest, b'S', obj.encode('utf-8', 'surrogatepass'))
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        _feed_bytes(digest, b'Y', bytes(obj))
+    elif isinstance(obj, Enum):
+        digest.update(b'E')
+        _feed(digest, obj.value)
+    elif isinstance(obj, (datetime, date, time)):
+        _feed_bytes(digest, b'D', obj.isoformat().encode())
+    elif isinstance(obj, dict):
+        items = sorted(obj.items(), key=lambda item: (type(item[0]).__name__, str(item[0])))
+        digest.update(b'M' + struct.pack('<Q', len(items)))
+        for key, value in items:
+            _feed(digest, key)
+            _feed(digest, value)
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b'L' + struct.pack('<Q', len(obj)))
+        for item in obj:
+            _feed(digest, item)
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        _feed_bytes(digest, b'C', type(obj).__qualname__.encode())
+        for f in dataclasses.fields(obj):
+            _feed(digest, f.name)
+            _feed(digest, getattr(obj, f.name))
+    else:
+        _feed_array_like(digest, obj)
+
+
+def _feed_array_like(digest, obj: Any) -> None:
+    """Arrays NumPy e objetos pandas (importados só quando aparecem)"""
+    import numpy as np
+
+    if isinstance(obj, np.generic):
+        _feed(digest, obj.item())
+        return
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            _feed(digest, obj.tolist())
+        else:
+            _feed_bytes(digest, b'A', f'{obj.dtype.str}{obj.shape}'.encode())
+            _feed_bytes(digest, b'B', np.ascontiguousarray(obj).tobytes())
+        return
+
+    import pandas as pd
+
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        digest.update(b'P')
+        if isinstance(obj, pd.DataFrame):
+            _feed(digest, [str(col) for col in obj.columns])
+            _feed(digest, [str(dtype) for dtype in obj.dtypes])
+        else:
+            _feed(digest, [str(obj.name), str(obj.dtype)])
+        _feed(digest, pd.util.hash_pandas_object(obj, index=True).to_numpy())
+        return
+
+    raise TypeError(f"Não é possível gerar fingerprint de {type(obj).__name__}")
+
+
+@dataclass
+class CacheStats:
+    """Contadores de um cache"""
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _sizeof(value: Any) -> int:
+    """Tamanho aproximado usado nos limites de bytes"""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return 0
+
+
+class LRUCache:
+    """Cache LRU em memória limitado por número de entradas e/ou bytes"""
+
+    def __init__(self, max_entries: Optional[int] = 256, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: 'OrderedDict[str, Tuple[Any, int]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            self._data.move_to_end(key)
+            return item[0]
+
+    def put(self, key: str, value: Any, size: Optional[int] = None) -> None:
+        size = _sizeof(value) if size is None else size
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            while self._data and (
+                (self.max_entries is not None and len(self._data) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                _, (_, evicted) = self._data.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+
+class DiskCache:
+    """Diretório de arquivos (um por chave) limitado em bytes, com remoção LRU
+
+    O atime/mtime de cada arquivo é atualizado nas leituras; ao exceder o
+    limite, os arquivos usados há mais tempo são removidos.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 512 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._bytes = sum(p.stat().st_size for p in self._files())
+        self.evictions = 0
+
+    def _files(self):
+        return (p for p in self.directory.glob('*/*') if p.is_file() and not p.name.startswith('.'))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        import tempfile
+
+        # Escrita atômica: outros processos nunca leem um arquivo pela metade
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._bytes += len(data) - previous
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove os arquivos menos recentes até caber em 90% do limite"""
+        entries = []
+        for path in self._files():
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+        self._bytes = total
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self._files():
+                path.unlink(missing_ok=True)
+            self._bytes = 0
+
+
+class ContentCache:
+    """Cache em duas camadas: LRU em memória e, opcionalmente, diretório em disco
+
+    A camada de disco só armazena valores `bytes`; acertos no disco são
+    promovidos para a memória.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 256,
+        max_bytes: Optional[int] = None,
+        directory: Optional[Union[str, Path]] = None,
+        disk_max_bytes: int = 512 * 1024 * 1024
+    ):
+        self.memory = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+        self.disk = DiskCache(directory, disk_max_bytes) if directory else None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+                with self._lock:
+                    self._disk_hits += 1
+
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def put(self, key: str, value: Any, size: Optional[int] = None) -> None:
+        self.memory.put(key, value, size)
+        if self.disk is not None and isinstance(value, bytes):
+            self.disk.put(key, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        evictions = self.memory.evictions + (self.disk.evictions if self.disk else 0)
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            disk_hits=self._disk_hits,
+            evictions=evictions,
+            entries=len(self.memory),
+            bytes=self.memory.nbytes
+        )
@@ -0,0 +1,193 @@
+"""
+Renderização de gráficos com cache endereçado por conteúdo
+Gráficos idênticos (mesmo tipo, dados, rótulos e cores) custam apenas um lookup de hash
+"""
+
+from __future__ import annotations
+
+import atexit
+import io
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+from .cache import CacheStats, ContentCache, fingerprint
+
+
+CHART_DPI = 150
+
+# Incrementar quando a renderização mudar, invalidando caches em disco antigos
+CHART_RENDER_VERSION = 1
+
+_cache = ContentCache(max_entries=256, max_bytes=64 * 1024 * 1024)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def configure_chart_cache(
+    max_entries: Optional[int] = 256,
+    max_bytes: Optional[int] = 64 * 1024 * 1024,
+    directory: Optional[Union[str, Path]] = None,
+    disk_max_bytes: int = 512 * 1024 * 1024
+) -> ContentCache:
+    """Reconfigura o cache de gráficos do processo (LRU em memória + disco opcional)"""
+    global _cache
+    _cache = ContentCache(
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        directory=directory,
+        disk_max_bytes=disk_max_bytes
+    )
+    return _cache
+
+
+def chart_cache_stats() -> CacheStats:
+    """Acertos, falhas e ocupação do cache de gráficos"""
+    return _cache.stats
+
+
+def chart_key(chart_config: Dict[str, Any]) -> str:
+    """Chave estável do gráfico: tudo que influencia a imagem gerada"""
+    return fingerprint(
+        CHART_RENDER_VERSION,
+        CHART_DPI,
+        chart_config['type'],
+        chart_config['data'],
+        chart_config.get('labels'),
+        chart_config.get('colors')
+    )
+
+
+def render_chart_png(chart_config: Dict[str, Any]) -> bytes:
+    """Renderiza o gráfico com matplotlib e retorna o PNG (sem cache)
+
+    Usa a API orientada a objetos (Figure) em vez do estado global do pyplot,
+    então pode rodar em threads e processos de workers.
+    """
+    from matplotlib.figure import Figure
+
+    chart_type = chart_config['type']
+    data = chart_config['data']
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+
+    if chart_type == 'bar':
+        for label, values in data.items():
+            ax.bar(range(len(values)), values, label=label)
+    elif chart_type == 'line':
+        for label, values in data.items():
+            ax.plot(values, label=label, marker='o')
+    elif chart_type == 'pie':
+        values = list(data.values())[0]
+        labels = chart_config.get('labels', [])
+        ax.pie(values, labels=labels, autopct='%1.1f%%')
+
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=CHART_DPI, bbox_inches='tight')
+    return buf.getvalue()
+
+
+def _render_chart_png_or_none(chart_config: Dict[str, Any]) -> Optional[bytes]:
+    try:
+        return render_chart_png(chart_config)
+    except ImportError:
+        return None
+
+
+def _warm_chart_worker() -> None:
+    """Inicializador dos workers: paga o import do matplotlib/Agg uma única vez"""
+    from matplotlib.backends import backend_agg  # noqa: F401
+    from matplotlib.figure import Figure
+
+    Figure(figsize=(1, 1)).savefig(io.BytesIO(), format='png')
+
+
+def get_chart_pool(workers: int) -> ProcessPoolExecutor:
+    """Pool de processos compartilhado para gráficos (recriado se `workers` mudar)"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_chart_worker)
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_chart_pool() -> None:
+    """Encerra o pool de gráficos (chamado automaticamente na saída do processo)"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+        _pool, _pool_workers = None, 0
+
+
+atexit.register(shutdown_chart_pool)
+
+
+def render_chart(chart_config: Dict[str, Any], cache: bool = True) -> Optional[bytes]:
+    """PNG do gráfico, vindo do cache quando possível (None sem matplotlib)
+
+    `cache=False` renderiza sem consultar nem alimentar o cache.
+    """
+    if not cache:
+        return _render_chart_png_or_none(chart_config)
+    return render_charts([chart_config])[0]
+
+
+def render_charts(
+    chart_configs: List[Dict[str, Any]],
+    workers: int = 0
+) -> List[Optional[bytes]]:
+    """PNGs de vários gráficos, na mesma ordem de `chart_configs`
+
+    Acertos vêm do cache; os demais (sem repetição) são renderizados em um pool
+    de `workers` processos quando `workers > 1`, ou sequencialmente.
+    `workers=-1` usa todos os núcleos.
+    """
+    if workers < 0:
+        workers = os.cpu_count() or 1
+
+    keys = [chart_key(config) for config in chart_configs]
+    pngs: Dict[str, Optional[bytes]] = {}
+    pending: Dict[str, Dict[str, Any]] = {}
+    for key, config in zip(keys, chart_configs):
+        if key in pngs or key in pending:
+            continue
+        png = _cache.get(key)
+        if png is None:
+            pending[key] = config
+        else:
+            pngs[key] = png
+
+    if pending:
+        if workers > 1 and len(pending) > 1:
+            rendered = get_chart_pool(workers).map(_render_chart_png_or_none, pending.values())
+        else:
+            rendered = map(_render_chart_png_or_none, pending.values())
+        for key, png in zip(pending, rendered):
+            pngs[key] = png
+            if png is not None:
+                _cache.put(key, png)
+
+    return [pngs[key] for key in keys]
+
+
+def chart_html(src: Optional[str]) -> str:
+    """Tag <img> do gráfico a partir da URL do asset (ou placeholder quando não há imagem)"""
+    if src is None:
+        return '<div class="chart-placeholder">Gráfico (matplotlib não disponível)</div>'
+    return f'<img src="{src}" class="chart-image" />'
@@ -0,0 +1,65 @@
+"""
+Linha de comando do ReportMaster
+
+Uso:
+    python -m src.reporter serve [--host 127.0.0.1] [--port 8765] [--socket /tmp/reporter.sock]
+                                 [--workers N] [--max-queue 64] [--quiet]
+                                 [--allow-path DIR ...]
+"""
+
+import argparse
+import signal
+import sys
+from typing import List, Optional
+
+from .server import DEFAULT_HOST, DEFAULT_PORT, RenderServer
+
+
+def _serve(args: argparse.Namespace) -> int:
+    server = RenderServer(
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket,
+        workers=args.workers,
+        max_queue=args.max_queue,
+        quiet=args.quiet,
+        allowed_paths=args.allow_path
+    )
+
+    # SIGTERM (systemd, docker stop) encerra como Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        print(f"Aquecendo {server.pool.jobs} workers...", file=sys.stderr)
+        server.prestart()
+        print(f"ReportMaster servindo em {server.address}", file=sys.stderr)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='reporter', description='ReportMaster Framework')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help='servidor de renderização com workers aquecidos')
+    serve.add_argument('--host', default=DEFAULT_HOST)
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve.add_argument('--socket', default=None, help='escuta em um socket Unix em vez de TCP')
+    serve.add_argument('--workers', type=int, default=None, help='padrão: número de núcleos')
+    serve.add_argument('--max-queue', type=int, default=64, help='renderizações aguardando worker')
+    serve.add_argument('--quiet', action='store_true', help='não registra cada requisição')
+    serve.add_argument(
+        '--allow-path', action='append', default=[], metavar='DIR',
+        help='diretório de onde as especificações podem ler arquivos (logo, CSS); repetível'
+    )
+    serve.set_defaults(handler=_serve)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,75 @@
+"""
+Documento já diagramado pelo WeasyPrint
+Uma única passada de layout atende contagem de páginas, PDF (inteiro ou de
+páginas escolhidas) e miniaturas PNG
+"""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Any, BinaryIO, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from .assets import RenderAssets
+    from .tracing import RenderStats
+
+
+class RenderedDocument:
+    """Resultado de ReportBuilder.render_document()
+
+    `document` é o weasyprint.Document original; os assets da renderização
+    ficam vivos junto com ele.
+    """
+
+    def __init__(self, document: Any, assets: RenderAssets, stats: Optional[RenderStats] = None):
+        self.document = document
+        self.assets = assets
+        self.stats = stats
+
+    @property
+    def page_count(self) -> int:
+        return len(self.document.pages)
+
+    def __len__(self) -> int:
+        return self.page_count
+
+    def _select(self, pages: Optional[Sequence[int]]) -> Any:
+        """Documento com apenas as páginas pedidas (índices a partir de 0), sem novo layout"""
+        if pages is None:
+            return self.document
+        count = self.page_count
+        for index in pages:
+            if not -count <= index < count:
+                raise IndexError(f"Página {index} fora do documento ({count} páginas)")
+        return self.document.copy([self.document.pages[index] for index in pages])
+
+    def write_pdf(
+        self,
+        target: Optional[Union[str, BinaryIO]] = None,
+        pages: Optional[Sequence[int]] = None
+    ) -> Optional[bytes]:
+        """PDF do documento (ou só de `pages`); sem `target`, retorna os bytes"""
+        return self._select(pages).write_pdf(target)
+
+    def thumbnails(self, pages: Sequence[int] = (0,), width: int = 300) -> List[bytes]:
+        """PNGs das páginas pedidas com `width` pixels de largura
+
+        Rasteriza o PDF dessas páginas com pypdfium2 (extra `reporter[thumbnails]`).
+        """
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            raise ImportError('Miniaturas exigem o pypdfium2: pip install "reporter[thumbnails]"') from None
+
+        pdf = pdfium.PdfDocument(self.write_pdf(pages=pages))
+        try:
+            images = []
+            for index in range(len(pdf)):
+                page = pdf[index]
+                bitmap = page.render(scale=width / page.get_width())
+                buffer = io.BytesIO()
+                bitmap.to_pil().save(buffer, format='PNG')
+                images.append(buffer.getvalue())
+            return images
+        finally:
+            pdf.close()
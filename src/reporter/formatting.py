@@ -0,0 +1,256 @@
+"""
+Formatação de colunas por dtype e locale
+Cada formatador é aplicado à coluna inteira de uma vez (arrays NumPy / acessores pandas)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+class FormatType(Enum):
+    """Tipos de formatação de coluna suportados"""
+    TEXT = "text"
+    INTEGER = "integer"
+    NUMBER = "number"
+    CURRENCY = "currency"
+    PERCENT = "percent"
+    DATE = "date"
+    AUTO = "auto"
+
+
+@dataclass(frozen=True)
+class Locale:
+    """Convenções numéricas e de data de um idioma"""
+    code: str
+    decimal_sep: str
+    thousands_sep: str
+    currency_prefix: str
+    date_format: str
+
+
+LOCALES: Dict[str, Locale] = {
+    'en-US': Locale('en-US', '.', ',', '$', '%m/%d/%Y'),
+    'pt-BR': Locale('pt-BR', ',', '.', 'R$ ', '%d/%m/%Y'),
+}
+
+DEFAULT_LOCALE = 'en-US'
+
+_DEFAULT_DECIMALS = {
+    FormatType.INTEGER: 0,
+    FormatType.NUMBER: 2,
+    FormatType.CURRENCY: 2,
+    FormatType.PERCENT: 1,
+}
+
+# Separador usado para aplicar str.translate numa coluna inteira de uma vez
+_JOIN_SEP = '\x1f'
+
+
+@dataclass(frozen=True)
+class ColumnFormat:
+    """Formatação declarativa de uma coluna de tabela"""
+    type: FormatType = FormatType.TEXT
+    decimals: Optional[int] = None
+    thousands: bool = True
+    symbol: Optional[str] = None
+    scale: float = 1.0
+    date_format: Optional[str] = None
+    na_rep: str = ''
+
+    @classmethod
+    def text(cls, na_rep: str = '') -> 'ColumnFormat':
+        return cls(FormatType.TEXT, na_rep=na_rep)
+
+    @classmethod
+    def integer(cls, thousands: bool = True, na_rep: str = '') -> 'ColumnFormat':
+        return cls(FormatType.INTEGER, thousands=thousands, na_rep=na_rep)
+
+    @classmethod
+    def number(cls, decimals: int = 2, thousands: bool = True, na_rep: str = '') -> 'ColumnFormat':
+        return cls(FormatType.NUMBER, decimals=decimals, thousands=thousands, na_rep=na_rep)
+
+    @classmethod
+    def currency(cls, decimals: int = 2, symbol: Optional[str] = None, na_rep: str = '') -> 'ColumnFormat':
+        return cls(FormatType.CURRENCY, decimals=decimals, symbol=symbol, na_rep=na_rep)
+
+    @classmethod
+    def percent(cls, decimals: int = 1, scale: float = 1.0, na_rep: str = '') -> 'ColumnFormat':
+        """`scale=100` quando a coluna guarda frações (0.155 -> 15.5%)"""
+        return cls(FormatType.PERCENT, decimals=decimals, scale=scale, na_rep=na_rep)
+
+    @classmethod
+    def date(cls, date_format: Optional[str] = None, na_rep: str = '') -> 'ColumnFormat':
+        return cls(FormatType.DATE, date_format=date_format, na_rep=na_rep)
+
+    @classmethod
+    def auto(cls, decimals: int = 2, thousands: bool = True, na_rep: str = '') -> 'ColumnFormat':
+        """Cada valor pelo seu tipo: inteiros sem casas, reais com `decimals`, o resto como texto"""
+        return cls(FormatType.AUTO, decimals=decimals, thousands=thousands, na_rep=na_rep)
+
+
+FormatSpec = Union[ColumnFormat, FormatType, str]
+
+
+def get_locale(locale: Union[str, Locale, None]) -> Locale:
+    """Resolve um código de locale ('pt-BR', 'en-US') para suas convenções"""
+    if isinstance(locale, Locale):
+        return locale
+    code = locale or DEFAULT_LOCALE
+    try:
+        return LOCALES[code]
+    except KeyError:
+        raise ValueError(
+            f"Locale desconhecido: {code!r} (disponíveis: {', '.join(LOCALES)})"
+        ) from None
+
+
+def to_column_format(spec: FormatSpec) -> ColumnFormat:
+    """Normaliza 'currency', FormatType.CURRENCY ou ColumnFormat para ColumnFormat"""
+    if isinstance(spec, ColumnFormat):
+        return spec
+    return ColumnFormat(FormatType(spec.value if isinstance(spec, FormatType) else spec))
+
+
+def infer_format(values: pd.Series) -> ColumnFormat:
+    """Infere a formatação padrão de uma coluna a partir do dtype"""
+    import pandas as pd
+
+    dtype = values.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return ColumnFormat.text()
+    if pd.api.types.is_integer_dtype(dtype):
+        return ColumnFormat.integer()
+    if pd.api.types.is_float_dtype(dtype):
+        return ColumnFormat.number()
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return ColumnFormat.date()
+
+    if dtype == object:
+        inferred = pd.api.types.infer_dtype(values, skipna=True)
+        if inferred == 'integer':
+            return ColumnFormat.integer()
+        if inferred in ('floating', 'decimal'):
+            return ColumnFormat.number()
+        if inferred in ('mixed-integer-float', 'mixed-integer', 'mixed'):
+            # Tipos misturados: 1 continua 1 e 2.5 vira 2.50, como na tabela original
+            return ColumnFormat.auto()
+
+    return ColumnFormat.text()
+
+
+def resolve_formats(
+    df: pd.DataFrame,
+    formats: Optional[Mapping[str, FormatSpec]] = None
+) -> List[ColumnFormat]:
+    """Formatação final de cada coluna: explícita quando informada, senão inferida"""
+    formats = formats or {}
+    unknown = set(formats) - set(df.columns)
+    if unknown:
+        raise KeyError(f"Formatação para colunas inexistentes: {sorted(map(str, unknown))}")
+
+    return [
+        to_column_format(formats[col]) if col in formats else infer_format(df.iloc[:, i])
+        for i, col in enumerate(df.columns)
+    ]
+
+
+def _localize(strings: List[str], locale: Locale) -> List[str]:
+    """Troca separadores decimais/milhar da coluna inteira com um único translate"""
+    if locale.decimal_sep == '.' and locale.thousands_sep == ',':
+        return strings
+    table = str.maketrans({',': locale.thousands_sep, '.': locale.decimal_sep})
+    return _JOIN_SEP.join(strings).translate(table).split(_JOIN_SEP)
+
+
+def _format_numbers(
+    numbers: np.ndarray,
+    fmt: ColumnFormat,
+    locale: Locale,
+    prefix: str = '',
+    suffix: str = ''
+) -> np.ndarray:
+    """Formata um array numérico (sem NaN) com casas decimais, milhar e afixos"""
+    import numpy as np
+
+    decimals = fmt.decimals if fmt.decimals is not None else _DEFAULT_DECIMALS[fmt.type]
+    # object: inteiros Python grandes demais para int64 (colunas mistas)
+    if numbers.dtype.kind in 'iuO' and decimals == 0:
+        spec = '{:,d}' if fmt.thousands else '{:d}'
+    else:
+        spec = ('{:,.%df}' if fmt.thousands else '{:.%df}') % decimals
+
+    negative = numbers < 0
+    strings = _localize(list(map(spec.format, np.abs(numbers).tolist())), locale)
+
+    out = np.asarray(strings, dtype=object)
+    if prefix or suffix:
+        out = prefix + out + suffix
+    if negative.any():
+        out[negative] = '-' + out[negative]
+    return out
+
+
+def format_column(
+    values: pd.Series,
+    fmt: ColumnFormat,
+    locale: Union[str, Locale, None] = None
+) -> List[str]:
+    """Formata uma coluna inteira, retornando uma string por linha"""
+    import numpy as np
+    import pandas as pd
+
+    locale = get_locale(locale)
+    missing = values.isna().to_numpy()
+
+    if fmt.type is FormatType.DATE:
+        dates = pd.to_datetime(values, errors='coerce')
+        date_format = fmt.date_format or locale.date_format
+        if fmt.date_format is None and ((dates.dt.normalize() != dates) & dates.notna()).any():
+            date_format += ' %H:%M'
+        out = dates.dt.strftime(date_format).to_numpy(dtype=object, na_value=None)
+        missing = missing | dates.isna().to_numpy()
+
+    elif fmt.type is FormatType.TEXT:
+        out = np.asarray(list(map(str, values.tolist())), dtype=object)
+
+    elif fmt.type is FormatType.AUTO:
+        items = values.tolist()
+        out = np.asarray(list(map(str, items)), dtype=object)
+        integers = np.asarray([isinstance(item, int) and not isinstance(item, bool) for item in items], dtype=bool)
+        floats = np.asarray([isinstance(item, float) for item in items], dtype=bool) & ~missing
+        if integers.any():
+            numbers = np.array([item for item, found in zip(items, integers) if found])
+            out[integers] = _format_numbers(numbers, ColumnFormat.integer(fmt.thousands), locale)
+        if floats.any():
+            decimals = fmt.decimals if fmt.decimals is not None else _DEFAULT_DECIMALS[FormatType.NUMBER]
+            numbers = np.array([item for item, found in zip(items, floats) if found], dtype='float64')
+            out[floats] = _format_numbers(numbers, ColumnFormat.number(decimals, fmt.thousands), locale)
+
+    else:
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind in 'iu':
+            # Inteiros nativos ficam exatos (sem passar por float64)
+            numbers = values.to_numpy()
+        else:
+            numbers = pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+            missing = missing | np.isnan(numbers)
+            numbers = np.where(missing, 0.0, numbers)
+
+        if fmt.type is FormatType.CURRENCY:
+            symbol = fmt.symbol if fmt.symbol is not None else locale.currency_prefix
+            out = _format_numbers(numbers, fmt, locale, prefix=symbol)
+        elif fmt.type is FormatType.PERCENT:
+            out = _format_numbers(numbers * fmt.scale, fmt, locale, suffix='%')
+        else:
+            out = _format_numbers(numbers, fmt, locale)
+
+    if missing.any():
+        out[missing] = fmt.na_rep
+    return out.tolist()
@@ -0,0 +1,108 @@
+"""
+Cache de fragmentos HTML por seção
+Tabelas e gráficos já renderizados são reaproveitados pelo hash das suas
+entradas: regerar um dashboard em que só uma seção mudou custa o hash das
+demais, não a renderização
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from .cache import CacheStats, ContentCache, fingerprint
+from .tables import HighlightRule, evaluate_condition
+
+# Incrementar quando o HTML de tabelas/gráficos mudar, invalidando caches em disco antigos
+FRAGMENT_RENDER_VERSION = 2
+
+_cache = ContentCache(max_entries=1024, max_bytes=128 * 1024 * 1024)
+_enabled = True
+_lock = threading.Lock()
+
+
+def configure_fragment_cache(
+    max_entries: Optional[int] = 1024,
+    max_bytes: Optional[int] = 128 * 1024 * 1024,
+    directory: Optional[Union[str, Path]] = None,
+    disk_max_bytes: int = 512 * 1024 * 1024,
+    enabled: bool = True
+) -> ContentCache:
+    """Reconfigura o cache de fragmentos do processo; `enabled=False` o desliga
+
+    Com `directory`, fragmentos sobrevivem entre execuções ("mesmo relatório,
+    novo dia").
+    """
+    global _cache, _enabled
+    with _lock:
+        _cache = ContentCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            directory=directory,
+            disk_max_bytes=disk_max_bytes
+        )
+        _enabled = enabled
+    return _cache
+
+
+def fragment_cache_stats() -> CacheStats:
+    """Acertos, falhas e ocupação do cache de fragmentos"""
+    return _cache.stats
+
+
+def fragment_cache_enabled() -> bool:
+    return _enabled
+
+
+def resolve_highlights(df: Any, rules: List[HighlightRule]) -> List[HighlightRule]:
+    """Funções de destaque viram máscaras (avaliadas uma vez, usadas na chave e na renderização)"""
+    return [
+        rule if isinstance(rule.condition, str) or not callable(rule.condition)
+        else HighlightRule(evaluate_condition(df, rule.condition), rule.css_class, rule.columns)
+        for rule in rules
+    ]
+
+
+def table_key(
+    df: Any,
+    formats: Optional[Any],
+    locale: Optional[str],
+    highlights: List[HighlightRule]
+) -> str:
+    """Chave do fragmento de tabela (destaques já resolvidos por resolve_highlights)
+
+    TypeError se alguma célula não tem hash (listas, dicts): a tabela não é cacheável.
+    """
+    return fingerprint(
+        FRAGMENT_RENDER_VERSION,
+        'table',
+        df,
+        {str(col): spec for col, spec in (formats or {}).items()},
+        locale,
+        [(rule.condition, rule.css_class, rule.columns) for rule in highlights]
+    )
+
+
+def chart_fragment_key(png_key: str) -> str:
+    """Chave do fragmento de gráfico (a URL do asset) a partir da chave do PNG"""
+    return fingerprint(FRAGMENT_RENDER_VERSION, 'chart', png_key)
+
+
+def get_fragment(key: str) -> Optional[str]:
+    data = _cache.get(key)
+    return data.decode('utf-8') if data is not None else None
+
+
+def put_fragment(key: str, html: str) -> None:
+    # Guardado como bytes para que a camada em disco também o aceite
+    data = html.encode('utf-8')
+    _cache.put(key, data, len(data))
+
+
+def cached_fragment(key: str, render: Callable[[], str]) -> Tuple[str, bool]:
+    """(fragmento, veio_do_cache): usa o cache ou renderiza e armazena"""
+    html = get_fragment(key)
+    if html is not None:
+        return html, True
+    html = render()
+    put_fragment(key, html)
+    return html, False
@@ -0,0 +1,333 @@
+"""
+Renderização particionada de relatórios muito grandes
+O WeasyPrint diagrama um documento inteiro em uma única thread; aqui as seções
+são divididas nas quebras de página explícitas (page_break_before/after), cada
+partição é diagramada em um RenderPool próprio e os PDFs são unidos com o
+pypdf (extra opcional `reporter[partition]`; sem ele, generate() renderiza em
+um único processo). Numeração "Página X de Y", links do índice e capa continuam
+corretos: a numeração de cada partição parte das contagens da renderização
+anterior do mesmo conteúdo e só as partições em que ela errou são refeitas.
+"""
+
+from __future__ import annotations
+
+import atexit
+import io
+import re
+import threading
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+from .cache import LRUCache, fingerprint
+from .tracing import NULL_TRACER, Tracer
+
+if TYPE_CHECKING:
+    from .assets import Asset
+    from .batch import RenderPool
+    from .report_framework import ReportBuilder, Section
+
+
+# Marcadores emitidos pelo template base; templates sem eles não são particionados
+SECTION_MARKER = '<!--reporter:section-->'
+SECTIONS_END_MARKER = '<!--reporter:sections-end-->'
+
+_BODY_OPEN = re.compile(r'<body\b[^>]*>', re.IGNORECASE)
+_BODY_CLOSE = re.compile(r'</body\s*>', re.IGNORECASE)
+_IDS = re.compile(r'\bid\s*=\s*"([^"]+)"')
+_INTERNAL_HREFS = re.compile(r'\bhref\s*=\s*"#([^"]+)"')
+_PAGE_TOTAL = re.compile(r'counter\(\s*pages\s*(?:,[^)]*)?\)')
+
+# Páginas de cada partição já diagramada, pelo conteúdo (HTML + CSS)
+_page_counts = LRUCache(max_entries=4096)
+
+# Pools da diagramação particionada, um por número de workers, separados do
+# pool compartilhado de generate_many/AsyncRenderer
+_pools: Dict[int, RenderPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_partition_pool(workers: int) -> RenderPool:
+    """Pool próprio das partições (um pool quebrado é trocado por um novo)"""
+    from .batch import RenderPool
+
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None or pool.broken:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            pool = _pools[workers] = RenderPool(workers)
+        return pool
+
+
+def shutdown_partition_pools() -> None:
+    """Encerra os pools de partições (chamado automaticamente na saída)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+atexit.register(shutdown_partition_pools)
+
+
+@dataclass
+class Partition:
+    """Um pedaço do relatório diagramado por um worker"""
+    html: str
+    sections: List[int]
+    anchors: Set[str]
+
+
+def segment_starts(sections: Sequence[Section]) -> List[int]:
+    """Índices das seções que começam em página nova (onde é seguro cortar)"""
+    starts = [0]
+    for index in range(1, len(sections)):
+        if sections[index].page_break_before or sections[index - 1].page_break_after:
+            starts.append(index)
+    return starts
+
+
+def _group_segments(starts: List[int], weights: List[int], parts: int) -> List[List[int]]:
+    """Agrupa segmentos consecutivos em até `parts` partições de peso parecido"""
+    bounds = starts + [len(weights)]
+    segments = [list(range(bounds[i], bounds[i + 1])) for i in range(len(starts))]
+    segment_weights = [sum(weights[i] for i in segment) for segment in segments]
+
+    target = sum(segment_weights) / parts
+    groups: List[List[int]] = []
+    current: List[int] = []
+    accumulated = 0.0
+    for position, (segment, weight) in enumerate(zip(segments, segment_weights)):
+        remaining_segments = len(segments) - position
+        remaining_groups = parts - len(groups)
+        # Fecha o grupo ao atingir o alvo, ou quando cada grupo restante precisa de um segmento
+        if current and (accumulated >= target or remaining_segments < remaining_groups):
+            groups.append(current)
+            current, accumulated = [], 0.0
+        current.extend(segment)
+        accumulated += weight
+    groups.append(current)
+    return groups
+
+
+def split_document(html: str, sections: Sequence[Section], parts: int) -> Optional[List[Partition]]:
+    """Divide o HTML completo em documentos independentes, um por partição
+
+    A capa e o índice ficam na primeira; o rodapé do relatório, na última.
+    Retorna None quando não há onde cortar ou o template não tem os marcadores.
+    """
+    if SECTIONS_END_MARKER not in html:
+        return None
+    body, end = html.split(SECTIONS_END_MARKER, 1)
+    pieces = body.split(SECTION_MARKER)
+    if len(pieces) != len(sections) + 1:
+        return None
+
+    prefix, chunks = pieces[0], pieces[1:]
+    body_open = _BODY_OPEN.search(prefix)
+    body_close = _BODY_CLOSE.search(end)
+    if body_open is None or body_close is None:
+        return None
+    head, front = prefix[:body_open.end()], prefix[body_open.end():]
+    back, closing = end[:body_close.start()], end[body_close.start():]
+
+    starts = segment_starts(sections)
+    parts = min(parts, len(starts))
+    if parts < 2:
+        return None
+
+    partitions = []
+    groups = _group_segments(starts, [len(chunk) for chunk in chunks], parts)
+    for number, group in enumerate(groups):
+        content = ''.join(chunks[i] for i in group)
+        if number == 0:
+            content = front + content
+        if number == len(groups) - 1:
+            content += back
+        partitions.append(Partition(content, group, set(_IDS.findall(content))))
+
+    for partition in partitions:
+        # Links para âncoras de outras partições (o índice) precisam de um destino
+        # local para o WeasyPrint não descartá-los; o destino real é ajustado na união
+        missing = set(_INTERNAL_HREFS.findall(partition.html)) - partition.anchors
+        placeholders = ''.join(
+            f'<span id="{name}" style="position: absolute"></span>' for name in sorted(missing)
+        )
+        partition.html = head + placeholders + partition.html + closing
+    return partitions
+
+
+def _numbering_css(css_texts: List[str], first_page: int, total_pages: int) -> List[str]:
+    """CSS da partição: counter(pages) vira o total do relatório e a contagem começa em `first_page`"""
+    texts = [_PAGE_TOTAL.sub(f'"{total_pages}"', text) for text in css_texts]
+    texts.append(f'@page :first {{ counter-reset: page {first_page} }}')
+    return texts
+
+
+def _numbering(counts: List[int]) -> List[Tuple[int, int]]:
+    """(primeira página, total) de cada partição a partir das páginas de cada uma"""
+    total = sum(counts)
+    starts = [1]
+    for count in counts[:-1]:
+        starts.append(starts[-1] + count)
+    return [(start, total) for start in starts]
+
+
+def _layout_partition_job(
+    html: str,
+    assets: Dict[str, Asset],
+    css_texts: List[str],
+    numbering: Optional[Tuple[int, int]] = None
+) -> Tuple[int, bytes]:
+    """Executa no worker: (páginas, PDF) da partição
+
+    `numbering` é (primeira página, total de páginas do relatório).
+    """
+    from weasyprint import HTML
+
+    from .assets import make_url_fetcher
+    from .themes import get_custom_stylesheet
+
+    if numbering is not None:
+        css_texts = _numbering_css(css_texts, *numbering)
+    stylesheets = [get_custom_stylesheet(text) for text in css_texts]
+    document = HTML(string=html, url_fetcher=make_url_fetcher(assets)).render(stylesheets=stylesheets)
+    return len(document.pages), document.write_pdf()
+
+
+def merge_pdfs(pdfs: List[bytes], owners: Dict[str, int]) -> bytes:
+    """Une os PDFs das partições, refazendo destinos de links e marcadores
+
+    `owners` indica a partição que contém de fato cada âncora; links que
+    apontavam para marcadores provisórios passam a apontar para ela.
+    """
+    from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import ArrayObject, FloatObject, NameObject, NullObject
+
+    writer = PdfWriter()
+    destinations: Dict[str, Tuple[int, Optional[float], Optional[float]]] = {}
+
+    for number, data in enumerate(pdfs):
+        reader = PdfReader(io.BytesIO(data))
+        offset = len(writer.pages)
+        for name, destination in reader.named_destinations.items():
+            if name in destinations and owners.get(name) != number:
+                continue
+            page = reader.get_destination_page_number(destination)
+            destinations[name] = (offset + page, destination.left, destination.top)
+        for page in reader.pages:
+            writer.add_page(page)
+        _copy_outline(writer, reader, reader.outline, offset)
+
+    def position(value: Optional[float]):
+        return NullObject() if value is None else FloatObject(value)
+
+    for page in writer.pages:
+        for annotation in page.get('/Annots') or []:
+            annotation = annotation.get_object()
+            name = annotation.get('/Dest')
+            if not isinstance(name, str) or name not in destinations:
+                continue
+            index, left, top = destinations[name]
+            annotation[NameObject('/Dest')] = ArrayObject([
+                writer.pages[index].indirect_reference, NameObject('/XYZ'),
+                position(left), position(top), FloatObject(0)
+            ])
+
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def _copy_outline(writer, reader, items, offset: int, parent=None) -> None:
+    """Copia os marcadores (bookmarks) de uma partição, deslocando as páginas"""
+    last = None
+    for item in items:
+        if isinstance(item, list):
+            _copy_outline(writer, reader, item, offset, last)
+            continue
+        page = reader.get_destination_page_number(item)
+        last = writer.add_outline_item(item.title, offset + page, parent=parent)
+
+
+def render_partitioned(
+    builder: ReportBuilder,
+    workers: int,
+    chart_workers: int = 0,
+    tracer: Tracer = NULL_TRACER
+) -> Optional[bytes]:
+    """PDF do relatório diagramado em partições paralelas
+
+    Retorna None (e o chamador renderiza da forma usual) se não houver quebras
+    de página para cortar, o template não tiver os marcadores ou o pypdf não
+    estiver instalado.
+
+    Com numeração de páginas no CSS, cada partição é diagramada uma vez com a
+    numeração prevista pelas contagens anteriores (ou a partir da página 1, na
+    primeira vez); as que erraram a previsão são refeitas em uma única passada
+    de correção, já com as contagens reais.
+    """
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        warnings.warn("Renderização particionada requer o pypdf (pip install pypdf); usando um único processo")
+        return None
+
+    from .themes import get_theme_css
+
+    assets = builder._render_assets()
+    with tracer.span('build_html') as span:
+        html = builder._build_html(chart_workers=chart_workers, tracer=tracer, assets=assets)
+        span.bytes = len(html)
+
+    partitions = split_document(html, builder.sections, workers)
+    if partitions is None:
+        return None
+
+    css_texts = [get_theme_css(builder._theme_name())]
+    if builder.config.custom_css:
+        css_texts.append(builder.config.custom_css)
+    executor = get_partition_pool(workers).executor
+
+    def submit(partition: Partition, numbering: Optional[Tuple[int, int]]):
+        used = {url: asset for url, asset in assets.assets.items() if url in partition.html}
+        return executor.submit(_layout_partition_job, partition.html, used, css_texts, numbering)
+
+    numbered = any('counter(page' in text for text in css_texts)
+    with_total = any(_PAGE_TOTAL.search(text) for text in css_texts)
+    keys = [fingerprint(partition.html, css_texts) for partition in partitions] if numbered else []
+    planned: List[Optional[Tuple[int, int]]] = [None] * len(partitions)
+    if numbered:
+        # Partições nunca vistas contam como 1 página até a diagramação dizer quantas têm
+        planned = _numbering([_page_counts.get(key) or 1 for key in keys])
+
+    with tracer.span('layout', partitions=len(partitions), workers=workers) as span:
+        futures = [submit(partition, numbers) for partition, numbers in zip(partitions, planned)]
+        results = [future.result() for future in futures]
+        span.bytes = sum(len(pdf) for _, pdf in results)
+
+    if numbered:
+        counts = [pages for pages, _ in results]
+        for key, pages in zip(keys, counts):
+            _page_counts.put(key, pages)
+        actual = _numbering(counts)
+        # O total só importa se o CSS usa counter(pages)
+        wrong = [
+            i for i, (guess, real) in enumerate(zip(planned, actual))
+            if guess[0] != real[0] or (with_total and guess[1] != real[1])
+        ]
+        if wrong:
+            with tracer.span('fixup', partitions=len(wrong), pages=actual[-1][1]) as span:
+                futures = {i: submit(partitions[i], actual[i]) for i in wrong}
+                for i, future in futures.items():
+                    results[i] = future.result()
+                span.bytes = sum(len(results[i][1]) for i in wrong)
+    pdfs = [pdf for _, pdf in results]
+
+    with tracer.span('merge', partitions=len(partitions)) as span:
+        owners = {name: number for number, partition in enumerate(partitions) for name in partition.anchors}
+        pdf_bytes = merge_pdfs(pdfs, owners)
+        span.bytes = len(pdf_bytes)
+    return pdf_bytes
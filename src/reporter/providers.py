@@ -0,0 +1,229 @@
+"""
+Dados de seções resolvidos sob demanda e em paralelo
+add_table/add_chart aceitam, no lugar dos dados, uma função, uma função
+assíncrona ou uma fonte em arquivo. Em generate() todas são disparadas ao mesmo
+tempo (com limite de concorrência) e cada seção é renderizada assim que os
+seus dados chegam: 20 consultas lentas custam a mais lenta, não a soma.
+Corrotinas sempre rodam no event loop próprio do módulo, em uma thread dedicada,
+então generate() funciona também de dentro de código assíncrono.
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional
+
+from .sources import DataSource
+from .tables import to_frame
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Future
+
+    import pandas as pd
+
+    from .report_framework import Section
+
+
+_max_concurrency = 8
+_lock = threading.Lock()
+
+# Event loop dos provedores: (loop, thread, pid que o criou; workers com fork recriam o seu)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_pid = 0
+
+# Resultados em andamento do generate() atual, por id do provedor
+_active: ContextVar[Optional[Dict[int, Future]]] = ContextVar('reporter_prefetch', default=None)
+
+
+def configure_providers(max_concurrency: int = 8) -> None:
+    """Quantos provedores de dados podem rodar ao mesmo tempo em um generate()"""
+    global _max_concurrency
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency deve ser ao menos 1")
+    with _lock:
+        _max_concurrency = max_concurrency
+
+
+def is_lazy(data: Any) -> bool:
+    """Fonte em arquivo ou função (síncrona ou assíncrona)?"""
+    return isinstance(data, DataSource) or callable(data)
+
+
+def check_data(data: Any) -> None:
+    """TypeError para corrotinas e awaitables soltos, que só podem ser aguardados uma vez"""
+    if inspect.isawaitable(data):
+        if inspect.iscoroutine(data):
+            data.close()
+        raise TypeError(
+            "Passe a função assíncrona (sem chamá-la), não a corrotina: "
+            "os dados podem ser resolvidos mais de uma vez"
+        )
+
+
+def _provider_loop() -> asyncio.AbstractEventLoop:
+    """Event loop dos provedores, rodando em uma thread daemon (criado no primeiro uso)"""
+    global _loop, _loop_thread, _loop_pid
+    with _lock:
+        if _loop is None or _loop_pid != os.getpid():
+            import asyncio
+
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, name='reporter-providers', daemon=True)
+            _loop_thread.start()
+            _loop_pid = os.getpid()
+        return _loop
+
+
+def _submit(coroutine: Any) -> Future:
+    """Agenda a corrotina no loop dos provedores"""
+    import asyncio
+
+    return asyncio.run_coroutine_threadsafe(coroutine, _provider_loop())
+
+
+async def _run(item: Any, loop: Any, executor: Any) -> Any:
+    """Executa um provedor no loop dos provedores: corrotinas no loop, o resto em threads"""
+    if isinstance(item, DataSource):
+        return await loop.run_in_executor(executor, item.load)
+    if inspect.iscoroutinefunction(item):
+        return await item()
+    result = await loop.run_in_executor(executor, item)
+    return await result if inspect.isawaitable(result) else result
+
+
+async def _fetch_all(items: Dict[int, Any], futures: Dict[int, Future], limit: int) -> None:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    semaphore = asyncio.Semaphore(limit)
+    loop = asyncio.get_running_loop()
+
+    async def fetch(key: int, item: Any) -> None:
+        future = futures[key]
+        async with semaphore:
+            # Provedores ainda não iniciados são descartados se o generate() terminou antes
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = await _run(item, loop, executor)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix='reporter-fetch')
+    try:
+        # Semaphore é FIFO: as seções começam a ser buscadas na ordem do relatório
+        await asyncio.gather(*(fetch(key, item) for key, item in items.items()))
+    finally:
+        # Sem esperar as threads: o loop é compartilhado com os demais relatórios
+        executor.shutdown(wait=False)
+
+
+def _section_items(sections: Iterable[Section]) -> Iterator[Any]:
+    for section in sections:
+        if is_lazy(section.data_table):
+            yield section.data_table
+        if section.chart is not None and is_lazy(section.chart['data']):
+            yield section.chart['data']
+
+
+@contextmanager
+def prefetch(sections: Iterable[Section]) -> Iterator[None]:
+    """Dispara todos os provedores das seções em paralelo durante o bloco
+
+    Dentro dele, materialize() espera pelo resultado já em andamento em vez de
+    executar o provedor de novo. Reentrante: um bloco interno reaproveita o externo.
+    """
+    if _active.get() is not None:
+        yield
+        return
+
+    items = {id(item): item for item in _section_items(sections)}
+    if not items:
+        yield
+        return
+
+    from concurrent.futures import Future
+
+    futures: Dict[int, Future] = {key: Future() for key in items}
+    _submit(_fetch_all(items, futures, _max_concurrency))
+    token = _active.set(futures)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+        for future in futures.values():
+            future.cancel()
+
+
+async def _await(item: Any) -> Any:
+    result = item()
+    return await result if inspect.isawaitable(result) else result
+
+
+def _wait(item: Any) -> Any:
+    """Resultado de um provedor assíncrono, aguardado no loop dos provedores"""
+    if threading.current_thread() is _loop_thread:
+        # Bloquear aqui travaria o próprio loop que precisa resolver o provedor
+        raise RuntimeError("Provedores assíncronos não podem ser resolvidos de dentro de outro provedor assíncrono")
+    return _submit(_await(item)).result()
+
+
+def _call(item: Any) -> Any:
+    """Executa o provedor diretamente (fora de um prefetch)
+
+    Funções comuns rodam na thread atual; corrotinas, no loop dos provedores,
+    mesmo que a thread atual já tenha um event loop rodando.
+    """
+    if isinstance(item, DataSource):
+        return item.load()
+    if inspect.iscoroutinefunction(item):
+        return _wait(item)
+    result = item()
+    if inspect.isawaitable(result):
+        return _wait(lambda: result)
+    return result
+
+
+def materialize(data: Any) -> Any:
+    """Dados em memória: resultado do prefetch, provedor executado agora ou os próprios dados"""
+    futures = _active.get()
+    if futures is not None and id(data) in futures:
+        return futures[id(data)].result()
+    return _call(data) if is_lazy(data) else data
+
+
+def resolve_table(data: Any) -> pd.DataFrame:
+    """DataFrame da tabela, resolvendo provedores e fontes em arquivo"""
+    return to_frame(materialize(data)) if is_lazy(data) else data
+
+
+def resolve_chart(chart: Dict[str, Any]) -> Dict[str, Any]:
+    """Configuração de gráfico com os dados resolvidos (a mesma, se já estiverem em memória)
+
+    Se o provedor ou a fonte devolver um DataFrame, cada coluna vira uma série
+    e `labels` pode ser o nome da coluna de rótulos.
+    """
+    if not is_lazy(chart['data']):
+        return chart
+
+    import pandas as pd
+
+    data = materialize(chart['data'])
+    resolved = dict(chart)
+    if isinstance(data, pd.DataFrame):
+        labels = chart.get('labels')
+        label_column = labels if isinstance(labels, str) else None
+        resolved['data'] = {col: data[col].tolist() for col in data.columns if col != label_column}
+        if label_column is not None:
+            resolved['labels'] = data[label_column].tolist()
+    else:
+        resolved['data'] = data
+    return resolved
@@ -0,0 +1,155 @@
+"""
+Cache de relatórios completos endereçado pelo fingerprint da especificação
+Se configuração, seções, dados das tabelas e ambiente de renderização não
+mudaram, o PDF volta do cache sem passar pelo Jinja nem pelo WeasyPrint
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+from .assets import get_asset_registry
+from .cache import CacheStats, ContentCache, fingerprint
+from .charts import CHART_DPI, CHART_RENDER_VERSION
+from .templates import template_source
+from .themes import get_theme_css
+
+if TYPE_CHECKING:
+    from .report_framework import ReportBuilder
+
+
+# Incrementar quando a geração do HTML/PDF mudar, invalidando caches em disco antigos
+REPORT_RENDER_VERSION = 2
+
+_weasyprint_version: Optional[str] = None
+
+
+def _renderer_version() -> str:
+    """Versão instalada do WeasyPrint (sem importá-lo)"""
+    global _weasyprint_version
+    if _weasyprint_version is None:
+        from importlib import metadata
+
+        try:
+            _weasyprint_version = metadata.version('weasyprint')
+        except metadata.PackageNotFoundError:
+            _weasyprint_version = ''
+    return _weasyprint_version
+
+
+def _logo_stamp(logo_path: Optional[str]) -> Any:
+    """Identifica o logo pelo conteúdo (URL de asset; o arquivo só é relido quando muda)"""
+    if not logo_path:
+        return None
+    try:
+        url, _ = get_asset_registry().add_file(logo_path)
+    except OSError:
+        return None
+    return url
+
+
+def report_fingerprint(builder: ReportBuilder, output_format: str = 'pdf') -> str:
+    """Fingerprint determinístico de tudo que influencia a saída (PDF ou HTML)
+
+    A data entra como aparece no relatório (dd/mm/aaaa): o padrão
+    `datetime.now()` não muda o fingerprint dentro do mesmo dia. Funções de
+    destaque entram pela máscara que produzem. Template, tema e logo entram
+    pelo conteúdo, então registrá-los de novo sob o mesmo nome invalida o cache.
+    TypeError se alguma célula de tabela não tem hash (listas, dicts).
+    """
+    from .spec import SPEC_VERSION, ReportSpec
+
+    spec = ReportSpec.from_builder(builder)
+    config: Dict[str, Any] = dict(spec.config)
+    config['date'] = builder.config.date.strftime('%d/%m/%Y')
+    theme = config['theme']
+
+    return fingerprint(
+        REPORT_RENDER_VERSION,
+        SPEC_VERSION,
+        output_format,
+        CHART_RENDER_VERSION,
+        CHART_DPI,
+        _renderer_version(),
+        get_theme_css(theme),
+        template_source(builder.config.template),
+        _logo_stamp(builder.config.logo_path),
+        config,
+        spec.sections
+    )
+
+
+class ReportCache(ContentCache):
+    """Relatórios gerados por fingerprint: LRU em memória limitado e diretório opcional em disco"""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 32,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        directory: Optional[Union[str, Path]] = None,
+        disk_max_bytes: int = 2 * 1024 * 1024 * 1024
+    ):
+        super().__init__(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            directory=directory,
+            disk_max_bytes=disk_max_bytes
+        )
+
+    def get_or_render(
+        self,
+        builder: ReportBuilder,
+        render: Callable[[], bytes],
+        output_format: str = 'pdf'
+    ) -> bytes:
+        """Saída em cache para o builder ou, na falta, `render()` armazenado sob o fingerprint
+
+        Relatórios sem fingerprint (células sem hash) são renderizados sem cache.
+        """
+        try:
+            key = report_fingerprint(builder, output_format)
+        except TypeError:
+            return render()
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+
+_cache: Optional[ReportCache] = None
+_cache_lock = threading.Lock()
+
+
+def configure_report_cache(
+    max_entries: Optional[int] = 32,
+    max_bytes: Optional[int] = 256 * 1024 * 1024,
+    directory: Optional[Union[str, Path]] = None,
+    disk_max_bytes: int = 2 * 1024 * 1024 * 1024
+) -> ReportCache:
+    """Reconfigura o cache de relatórios usado por generate(cache=True)"""
+    global _cache
+    with _cache_lock:
+        _cache = ReportCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            directory=directory,
+            disk_max_bytes=disk_max_bytes
+        )
+    return _cache
+
+
+def get_report_cache() -> ReportCache:
+    """Cache de relatórios do processo (criado na primeira chamada, só em memória)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ReportCache()
+        return _cache
+
+
+def report_cache_stats() -> CacheStats:
+    """Acertos, falhas e ocupação do cache de relatórios"""
+    return get_report_cache().stats
@@ -1,18 +1,162 @@
 """
 ReportMaster - Framework declarativo para geração de relatórios profissionais
 Usa Jinja2 + WeasyPrint em baixo nível, mas expõe API super abstrata
+
+WeasyPrint, pandas e matplotlib só são importados quando realmente usados
+(generate(), add_table(), gráficos), mantendo o import deste módulo leve.
 """
 
+from __future__ import annotations
+
+import dataclasses
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple, Union, Callable
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
-from jinja2 import Template, Environment, BaseLoader
-from weasyprint import HTML, CSS
-import pandas as pd
+from functools import partial
 from io import BytesIO
 import base64
+import os
+
+from .assets import AssetRegistry, RenderAssets, configure_asset_registry, get_asset_registry
+from .cache import CacheStats
+from .charts import (
+    chart_cache_stats,
+    chart_html,
+    chart_key,
+    configure_chart_cache,
+    render_chart,
+    render_charts,
+    shutdown_chart_pool,
+)
+from .fragments import (
+    cached_fragment,
+    chart_fragment_key,
+    configure_fragment_cache,
+    fragment_cache_enabled,
+    fragment_cache_stats,
+    get_fragment,
+    put_fragment,
+    resolve_highlights,
+    table_key,
+)
+from .formatting import ColumnFormat, FormatSpec, FormatType
+from .templates import (
+    BASE_TEMPLATE,
+    TEMPLATE_STRING,
+    enable_bytecode_cache,
+    get_template,
+    register_template,
+    template_variables,
+)
+from .providers import check_data, configure_providers, is_lazy, prefetch, resolve_chart, resolve_table
+from .sources import CsvSource, DataSource, FeatherSource, ParquetSource, open_source
+from .themes import (
+    CORPORATE_THEME_CSS,
+    available_themes,
+    get_stylesheets,
+    get_theme_css,
+    register_theme,
+)
+from .tables import HighlightRule, HighlightSpec, render_table, render_table_chunks, to_frame, to_highlight_rules
+from .tracing import (
+    NULL_TRACER,
+    Hook,
+    RenderHook,
+    RenderStats,
+    Span,
+    Tracer,
+    add_render_hook,
+    default_tracer,
+    global_render_hooks,
+    remove_render_hook,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .aio import AsyncRenderer
+    from .document import RenderedDocument
+    from .report_cache import ReportCache
+
+
+# Reexportações carregadas sob demanda (asyncio/multiprocessing só quando usados)
+_LAZY_EXPORTS = {
+    'AsyncRenderer': '.aio',
+    'RenderQueueFull': '.aio',
+    'agenerate_many': '.aio',
+    'configure_async_renderer': '.aio',
+    'get_async_renderer': '.aio',
+    'BatchResult': '.batch',
+    'BatchRun': '.batch',
+    'BatchStats': '.batch',
+    'RenderPool': '.batch',
+    'generate_many': '.batch',
+    'get_render_pool': '.batch',
+    'ReportSpec': '.spec',
+    'ReportCache': '.report_cache',
+    'configure_report_cache': '.report_cache',
+    'report_cache_stats': '.report_cache',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __package__), name)
+    globals()[name] = value
+    return value
+
+
+# API pública; `import *` também traz as reexportações sob demanda
+__all__ = [
+    'OUTPUT_FORMATS',
+    'ReportTheme',
+    'ChartType',
+    'Section',
+    'ReportConfig',
+    'ReportBuilder',
+    'create_report',
+    'quick_report',
+    'TEMPLATE_STRING',
+    'CORPORATE_THEME_CSS',
+    'BASE_TEMPLATE',
+    'register_template',
+    'enable_bytecode_cache',
+    'register_theme',
+    'available_themes',
+    'ColumnFormat',
+    'FormatSpec',
+    'FormatType',
+    'HighlightRule',
+    'HighlightSpec',
+    'DataSource',
+    'FeatherSource',
+    'ParquetSource',
+    'CsvSource',
+    'open_source',
+    'configure_providers',
+    'CacheStats',
+    'configure_asset_registry',
+    'configure_chart_cache',
+    'chart_cache_stats',
+    'configure_fragment_cache',
+    'fragment_cache_stats',
+    'Hook',
+    'RenderHook',
+    'RenderStats',
+    'Span',
+    'add_render_hook',
+    'remove_render_hook',
+    *_LAZY_EXPORTS,
+]
+
+
+OUTPUT_FORMATS = ('pdf', 'html')
 
 
 class ReportTheme(Enum):
@@ -39,11 +183,17 @@ class Section:
     title: str
     content: Optional[str] = None
     subsections: List['Section'] = field(default_factory=list)
-    data_table: Optional[pd.DataFrame] = None
+    data_table: Optional[Union[pd.DataFrame, DataSource, Callable[[], Any]]] = None
     chart: Optional[Dict[str, Any]] = None
     custom_html: Optional[str] = None
     page_break_before: bool = False
     page_break_after: bool = False
+    # Campos novos ficam no fim: construção posicional antiga continua válida
+    table_formats: Optional[Dict[str, FormatSpec]] = None
+    table_locale: Optional[str] = None
+    table_highlights: List[HighlightRule] = field(default_factory=list)
+    table_html: Optional[str] = None
+    chart_png: Optional[bytes] = None
 
 
 @dataclass
@@ -54,22 +204,54 @@ class ReportConfig:
     author: Optional[str] = None
     company: Optional[str] = None
     logo_path: Optional[str] = None
-    theme: ReportTheme = ReportTheme.CORPORATE
+    theme: Union[ReportTheme, str] = ReportTheme.CORPORATE
     date: datetime = field(default_factory=datetime.now)
     show_page_numbers: bool = True
     show_toc: bool = True
     header_text: Optional[str] = None
     footer_text: Optional[str] = None
     custom_css: Optional[str] = None
+    locale: str = 'en-US'
+    template: str = BASE_TEMPLATE
 
 
 class ReportBuilder:
     """Construtor de relatórios com API fluente"""
     
-    def __init__(self, config: ReportConfig):
+    def __init__(self, config: ReportConfig, streaming: bool = False):
+        """`streaming=True` renderiza tabelas e gráficos ao serem adicionados e
+        solta os dados: a memória fica em uma seção mais a marcação acumulada"""
         self.config = config
+        self.streaming = streaming
         self.sections: List[Section] = []
-        self._themes = self._load_themes()
+
+    def _append_section(self, section: Section) -> None:
+        if self.streaming:
+            self._freeze_section(section)
+        self.sections.append(section)
+
+    def _freeze_section(self, section: Section) -> None:
+        """Modo streaming: troca DataFrame e dados do gráfico pelo HTML e PNG finais
+
+        Provedores e fontes em arquivo são resolvidos aqui, um de cada vez. Os
+        caches de fragmentos, gráficos e assets ficam de fora para não guardar
+        uma segunda cópia do HTML e das imagens.
+        """
+        if section.data_table is not None:
+            df = resolve_table(section.data_table)
+            section.table_html = self._render_table(
+                df,
+                formats=section.table_formats,
+                locale=section.table_locale,
+                highlights=section.table_highlights
+            )
+            section.data_table = None
+            section.table_highlights = []
+        if section.chart is not None:
+            chart = resolve_chart(section.chart)
+            png = render_chart(chart, cache=False)
+            # Sem imagem (matplotlib ausente), mantém a configuração já resolvida
+            section.chart, section.chart_png = (None, png) if png is not None else (chart, None)
         
     def add_section(
         self,
@@ -85,42 +267,103 @@ class ReportBuilder:
             page_break_before=page_break_before,
             page_break_after=page_break_after
         )
-        self.sections.append(section)
+        self._append_section(section)
         return self
     
     def add_table(
         self,
         title: str,
-        data: Union[pd.DataFrame, List[Dict], Dict],
-        highlight_rows: Optional[Callable] = None,
-        page_break_before: bool = False
+        data: Union[pd.DataFrame, List[Dict], Dict, DataSource, Callable[[], Any]],
+        highlight_rows: Optional[HighlightSpec] = None,
+        page_break_before: bool = False,
+        formats: Optional[Dict[str, FormatSpec]] = None,
+        locale: Optional[str] = None
     ) -> 'ReportBuilder':
-        """Adiciona uma tabela de dados com formatação automática"""
-        if isinstance(data, dict):
-            df = pd.DataFrame([data])
-        elif isinstance(data, list):
-            df = pd.DataFrame(data)
-        else:
-            df = data
-            
+        """Adiciona uma tabela de dados com formatação automática
+
+        `formats` mapeia colunas para ColumnFormat (ou 'currency', 'percent', ...);
+        as demais colunas são formatadas pelo dtype. `locale` sobrepõe o do relatório.
+
+        `highlight_rows` aceita uma expressão ("'% Meta' < 100"), máscara booleana,
+        função DataFrame -> máscara, {classe_css: condição} ou lista de HighlightRule;
+        as condições são avaliadas uma vez sobre a tabela inteira.
+
+        Com uma fonte em arquivo (open_source, FeatherSource, ...), só as colunas
+        e linhas selecionadas são lidas, e apenas em generate().
+
+        `data` também pode ser uma função (ou função assíncrona) que retorna os
+        dados: em generate() todas as seções rodam seus provedores em paralelo
+        (limite em configure_providers).
+        """
+        check_data(data)
         section = Section(
             title=title,
-            data_table=df,
+            data_table=data if is_lazy(data) else to_frame(data),
+            table_formats=formats,
+            table_locale=locale,
+            table_highlights=to_highlight_rules(highlight_rows),
             page_break_before=page_break_before
         )
-        self.sections.append(section)
+        self._append_section(section)
         return self
     
+    def add_table_from_query(
+        self,
+        title: str,
+        conn: Any,
+        sql: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        chunksize: int = 10_000,
+        highlight_rows: Optional[HighlightSpec] = None,
+        page_break_before: bool = False,
+        formats: Optional[Dict[str, FormatSpec]] = None,
+        locale: Optional[str] = None
+    ) -> 'ReportBuilder':
+        """Adiciona uma tabela com o resultado de uma consulta SQL, lida em blocos
+
+        `conn` é uma conexão DB-API (sqlite3) ou SQLAlchemy, como em
+        pandas.read_sql_query. A consulta roda aqui: cada bloco de `chunksize`
+        linhas é formatado em HTML e descartado, de modo que só a marcação fica
+        na seção. Formatos e destaques funcionam como em add_table; o locale é
+        o do relatório no momento da chamada, se `locale` não for informado.
+        """
+        import pandas as pd
+
+        chunks = pd.read_sql_query(sql, conn, params=params, chunksize=chunksize)
+        html = render_table_chunks(
+            chunks,
+            formats=formats,
+            locale=locale or self.config.locale,
+            highlights=to_highlight_rules(highlight_rows)
+        )
+        section = Section(
+            title=title,
+            table_html=html,
+            page_break_before=page_break_before
+        )
+        self._append_section(section)
+        return self
+
     def add_chart(
         self,
         title: str,
         chart_type: ChartType,
-        data: Dict[str, List],
-        labels: Optional[List[str]] = None,
+        data: Union[Dict[str, List], DataSource, Callable[[], Any]],
+        labels: Optional[Union[List[str], str]] = None,
         colors: Optional[List[str]] = None,
         page_break_before: bool = False
     ) -> 'ReportBuilder':
-        """Adiciona um gráfico (renderizado como SVG/imagem)"""
+        """Adiciona um gráfico (renderizado como SVG/imagem)
+
+        `data` também pode ser uma fonte em arquivo ou uma função (ou função
+        assíncrona) resolvida em generate(), em paralelo com as demais seções.
+        Se ela produzir um DataFrame, cada coluna vira uma série e `labels` pode
+        ser o nome da coluna de rótulos.
+        """
+        check_data(data)
+        if isinstance(data, DataSource) and isinstance(labels, str) \
+                and data.columns is not None and labels not in data.columns:
+            data = dataclasses.replace(data, columns=[*data.columns, labels])
         section = Section(
             title=title,
             chart={
@@ -131,7 +374,7 @@ class ReportBuilder:
             },
             page_break_before=page_break_before
         )
-        self.sections.append(section)
+        self._append_section(section)
         return self
     
     def add_kpi_grid(
@@ -146,7 +389,7 @@ class ReportBuilder:
             title=title,
             custom_html=html
         )
-        self.sections.append(section)
+        self._append_section(section)
         return self
     
     def add_executive_summary(
@@ -176,143 +419,387 @@ class ReportBuilder:
             title=title,
             custom_html=html
         )
-        self.sections.append(section)
+        self._append_section(section)
         return self
     
-    def generate(self, output_path: Optional[str] = None) -> bytes:
-        """Gera o PDF do relatório"""
-        html_content = self._build_html()
-        css_content = self._build_css()
-        
-        html_obj = HTML(string=html_content)
-        css_obj = CSS(string=css_content)
+    def generate(
+        self,
+        output_path: Optional[str] = None,
+        chart_workers: int = 0,
+        cache: Union[bool, ReportCache, None] = None,
+        format: str = 'pdf',
+        render_workers: int = 0
+    ) -> bytes:
+        """Gera o PDF do relatório
+
+        `chart_workers > 1` renderiza os gráficos em um pool de processos
+        (-1 usa todos os núcleos); 0 renderiza no processo atual.
+
+        `cache=True` usa o cache de relatórios do processo (configure_report_cache)
+        e `cache=ReportCache(...)` um cache próprio: com o mesmo fingerprint, o PDF
+        volta sem renderizar de novo.
+
+        `format='html'` retorna o HTML autocontido (CSS e imagens embutidos, em
+        UTF-8) para pré-visualização ou e-mail, sem carregar o WeasyPrint.
+
+        `render_workers > 1` divide relatórios grandes nas quebras de página e
+        diagrama as partes em paralelo, unindo-as em um único PDF (requer pypdf;
+        -1 usa todos os núcleos).
+        """
+        if format not in OUTPUT_FORMATS:
+            raise ValueError(f"Formato de saída desconhecido: {format!r} (use 'pdf' ou 'html')")
+
+        if format == 'html':
+            render = partial(self._write_html, chart_workers=chart_workers)
+        else:
+            render = partial(self._write_pdf, chart_workers=chart_workers, render_workers=render_workers)
+
+        # Provedores de dados começam todos agora; fingerprint e renderização usam os mesmos resultados
+        with prefetch(self.sections):
+            if cache:
+                from .report_cache import get_report_cache
+
+                cache = get_report_cache() if cache is True else cache
+                output = cache.get_or_render(self, render, format)
+            else:
+                output = render()
         
-        pdf_bytes = html_obj.write_pdf(stylesheets=[css_obj])
+        if output_path:
+            Path(output_path).write_bytes(output)
         
+        return output
+
+    def generate_with_stats(
+        self,
+        output_path: Optional[str] = None,
+        hooks: Iterable[Hook] = (),
+        trace_memory: bool = False,
+        chart_workers: int = 0
+    ) -> Tuple[bytes, RenderStats]:
+        """Como generate, mas também retorna o RenderStats com o tempo de cada etapa
+
+        `hooks` (além dos registrados com add_render_hook) recebem cada span;
+        `trace_memory=True` mede o pico de memória por etapa com tracemalloc.
+        """
+        tracer = Tracer([*global_render_hooks(), *hooks], trace_memory=trace_memory)
+        pdf_bytes = self._write_pdf(chart_workers=chart_workers, tracer=tracer)
+
         if output_path:
             Path(output_path).write_bytes(pdf_bytes)
-        
+
+        return pdf_bytes, tracer.stats()
+
+    def generate_to(
+        self,
+        target: Union[str, os.PathLike, BinaryIO],
+        return_bytes: bool = False,
+        chart_workers: int = 0
+    ) -> Optional[bytes]:
+        """Gera o PDF direto em um caminho ou arquivo binário (arquivo aberto,
+        SpooledTemporaryFile, stream de resposta HTTP)
+
+        O WeasyPrint escreve no destino sem materializar o PDF inteiro em
+        memória; os bytes só são retornados com `return_bytes=True`.
+        """
+        if return_bytes:
+            pdf_bytes = self._write_pdf(chart_workers=chart_workers)
+            if isinstance(target, (str, os.PathLike)):
+                Path(target).write_bytes(pdf_bytes)
+            else:
+                target.write(pdf_bytes)
+            return pdf_bytes
+
+        if isinstance(target, os.PathLike):
+            target = os.fspath(target)
+        self._write_pdf(target, chart_workers=chart_workers)
+        return None
+
+    def fingerprint(self) -> str:
+        """Hash determinístico de configuração, seções e dados (chave do cache de relatórios)"""
+        from .report_cache import report_fingerprint
+
+        return report_fingerprint(self)
+
+    def render_document(self, chart_workers: int = 0) -> RenderedDocument:
+        """Faz o layout uma única vez e retorna o documento diagramado
+
+        Do RenderedDocument saem contagem de páginas, o PDF (inteiro ou de
+        páginas escolhidas) e miniaturas PNG sem repetir o layout.
+        """
+        from .document import RenderedDocument
+
+        tracer = default_tracer()
+        with tracer.run('render_document', title=self.config.title):
+            document, assets = self._layout(chart_workers=chart_workers, tracer=tracer)
+        return RenderedDocument(document, assets, tracer.stats() if tracer.enabled else None)
+
+    def _layout(self, chart_workers: int = 0, tracer: Tracer = NULL_TRACER) -> Tuple[Any, RenderAssets]:
+        """Etapas build_html, css e layout: weasyprint.Document e os assets que ele usa"""
+        assets = self._render_assets()
+        with tracer.span('build_html') as span:
+            html_content = self._build_html(chart_workers=chart_workers, tracer=tracer, assets=assets)
+            span.bytes = len(html_content)
+            span.attributes['assets'] = len(assets.assets)
+            span.attributes['asset_bytes'] = assets.nbytes
+
+        with tracer.span('css', theme=self._theme_name()):
+            stylesheets = get_stylesheets(self._theme_name(), self.config.custom_css)
+
+        from weasyprint import HTML
+
+        with tracer.span('layout') as span:
+            document = HTML(string=html_content, url_fetcher=assets.url_fetcher()).render(
+                stylesheets=stylesheets
+            )
+            span.attributes['pages'] = len(document.pages)
+        return document, assets
+
+    def _write_html(self, chart_workers: int = 0, tracer: Optional[Tracer] = None) -> bytes:
+        """HTML autocontido em UTF-8: CSS do tema em <style> e imagens em data URIs"""
+        tracer = tracer or default_tracer()
+
+        with tracer.run('generate', title=self.config.title, format='html') as root:
+            with tracer.span('build_html') as span:
+                html_content = self._build_html(chart_workers=chart_workers, tracer=tracer)
+                span.bytes = len(html_content)
+
+            with tracer.span('css', theme=self._theme_name()):
+                style = f'<style>\n{self._build_css()}\n</style>\n</head>'
+                html_content = html_content.replace('</head>', style, 1)
+
+            output = html_content.encode('utf-8')
+            root.bytes = len(output)
+        return output
+
+    def _write_pdf(
+        self,
+        target: Optional[Union[str, BinaryIO]] = None,
+        chart_workers: int = 0,
+        tracer: Optional[Tracer] = None,
+        render_workers: int = 0
+    ) -> Optional[bytes]:
+        """Renderiza com o WeasyPrint; sem `target`, retorna os bytes do PDF"""
+        tracer = tracer or default_tracer()
+
+        with tracer.run('generate', title=self.config.title) as root:
+            if render_workers not in (0, 1):
+                from .partition import render_partitioned
+
+                workers = render_workers if render_workers > 1 else os.cpu_count() or 1
+                pdf_bytes = render_partitioned(self, workers, chart_workers=chart_workers, tracer=tracer)
+                if pdf_bytes is not None:
+                    root.bytes = len(pdf_bytes)
+                    if target is None:
+                        return pdf_bytes
+                    if isinstance(target, str):
+                        Path(target).write_bytes(pdf_bytes)
+                    else:
+                        target.write(pdf_bytes)
+                    return None
+
+            document, _assets = self._layout(chart_workers=chart_workers, tracer=tracer)
+
+            with tracer.span('write_pdf') as span:
+                start = target.tell() if hasattr(target, 'seekable') and target.seekable() else None
+                pdf_bytes = document.write_pdf(target)
+                if pdf_bytes is not None:
+                    span.bytes = len(pdf_bytes)
+                elif isinstance(target, str):
+                    span.bytes = os.path.getsize(target)
+                elif start is not None:
+                    span.bytes = target.tell() - start
+            root.bytes = span.bytes
+
         return pdf_bytes
     
-    def _build_html(self) -> str:
-        """Constrói o HTML completo do relatório"""
-        template = Template(self._get_base_template())
+    async def agenerate(
+        self,
+        output_path: Optional[str] = None,
+        renderer: Optional[AsyncRenderer] = None
+    ) -> bytes:
+        """Versão assíncrona de generate: renderiza fora do event loop e retorna o PDF"""
+        from .aio import get_async_renderer
+
+        renderer = renderer or get_async_renderer()
+        return await renderer.render(self, output_path)
+
+    def _build_html(
+        self,
+        chart_workers: int = 0,
+        tracer: Tracer = NULL_TRACER,
+        assets: Optional[RenderAssets] = None
+    ) -> str:
+        """Constrói o HTML completo do relatório
+
+        Imagens são referenciadas por URLs de asset servidas pelo url_fetcher de
+        `assets`; sem `assets`, o HTML sai autocontido (imagens em data URIs).
+        """
+        inline = assets is None
+        assets = assets or self._render_assets()
+        template = get_template(self.config.template)
         
+        # Provedores rodam em paralelo; cada seção é renderizada assim que seus dados chegam
+        with prefetch(self.sections):
+            sections = self._prepare_sections(chart_workers=chart_workers, tracer=tracer, assets=assets)
+
         # Prepara dados para o template
         context = {
             'config': self.config,
-            'sections': self._prepare_sections(),
+            'sections': sections,
             'date_formatted': self.config.date.strftime('%d/%m/%Y'),
-            'logo_base64': self._get_logo_base64() if self.config.logo_path else None,
-            'theme': self.config.theme.value
+            'logo_url': self._logo_url(assets),
+            'theme': self._theme_name()
         }
+        # Templates customizados antigos ainda podem usar o logo em base64
+        if 'logo_base64' in template_variables(self.config.template):
+            context['logo_base64'] = self._get_logo_base64()
         
-        return template.render(**context)
+        with tracer.span('template', template=self.config.template) as span:
+            html = template.render(**context)
+            span.bytes = len(html)
+        return assets.inline(html) if inline else html
 
     def _build_css(self) -> str:
         """Constrói o CSS do relatório baseado no tema"""
-        base_css = self._themes[self.config.theme.value]
+        base_css = get_theme_css(self._theme_name())
 
         if self.config.custom_css:
             base_css += f"\n\n/* Custom CSS */\n{self.config.custom_css}"
 
         return base_css
 
-    def _prepare_sections(self) -> List[Dict]:
-        """Prepara as seções para renderização"""
+    def _theme_name(self) -> str:
+        """Nome do tema no registro (ReportTheme ou nome de tema registrado)"""
+        theme = self.config.theme
+        return theme.value if isinstance(theme, ReportTheme) else theme
+
+    def _prepare_sections(
+        self,
+        chart_workers: int = 0,
+        tracer: Tracer = NULL_TRACER,
+        assets: Optional[RenderAssets] = None
+    ) -> List[Dict]:
+        """Prepara as seções para renderização
+
+        Com `chart_workers` em 0 ou 1, cada gráfico é renderizado dentro do span
+        da sua seção; em paralelo, todos entram juntos no span 'charts'.
+        Tabelas e gráficos com as mesmas entradas vêm do cache de fragmentos;
+        os PNGs dos gráficos são registrados em `assets`.
+        """
+        assets = assets if assets is not None else self._render_assets()
         prepared = []
+        charts = []
+        parallel_charts = chart_workers not in (0, 1)
+        use_fragments = fragment_cache_enabled() and not self.streaming
         
-        for section in self.sections:
-            section_data = {
-                'title': section.title,
-                'content': section.content,
-                'page_break_before': section.page_break_before,
-                'page_break_after': section.page_break_after,
-                'custom_html': section.custom_html
-            }
-            
-            # Renderiza tabela se existir
-            if section.data_table is not None:
-                section_data['table_html'] = self._render_table(section.data_table)
-            
-            # Renderiza gráfico se existir
-            if section.chart is not None:
-                section_data['chart_html'] = self._render_chart(section.chart)
+        with tracer.span('prepare_sections', sections=len(self.sections)):
+            for index, section in enumerate(self.sections):
+                with tracer.span(section.title, section=index) as span:
+                    section_data = {
+                        'title': section.title,
+                        'content': section.content,
+                        'page_break_before': section.page_break_before,
+                        'page_break_after': section.page_break_after,
+                        'custom_html': section.custom_html
+                    }
+                    
+                    # Renderiza tabela se existir
+                    if section.data_table is not None:
+                        df = resolve_table(section.data_table)
+                        section_data['table_html'], cached = self._table_html(section, df)
+                        if cached:
+                            span.attributes['cached'] = True
+                        span.attributes['rows'] = len(df)
+                    elif section.table_html is not None:
+                        # Tabela já renderizada (add_table_from_query ou modo streaming)
+                        section_data['table_html'] = section.table_html
+                    
+                    # Gráficos em paralelo são renderizados juntos, depois do laço
+                    if section.chart is not None:
+                        chart = resolve_chart(section.chart)
+                        span.attributes['chart'] = chart['type']
+                        key = chart_fragment_key(chart_key(chart)) if use_fragments else None
+                        # O fragmento guardado é a URL do asset, válida enquanto o registro tiver a imagem
+                        url = get_fragment(key) if key else None
+                        if url is not None and assets.pin(url):
+                            section_data['chart_html'] = chart_html(url)
+                            span.attributes['cached'] = True
+                        elif parallel_charts:
+                            charts.append((section_data, chart, key))
+                        else:
+                            section_data['chart_html'] = self._render_chart(chart, assets, key)
+                    elif section.chart_png is not None:
+                        section_data['chart_html'] = chart_html(assets.add(section.chart_png))
+                    
+                    if tracer.enabled:
+                        span.bytes = sum(
+                            len(section_data.get(key) or '')
+                            for key in ('content', 'custom_html', 'table_html', 'chart_html')
+                        )
+                    prepared.append(section_data)
             
-            prepared.append(section_data)
+            if charts:
+                with tracer.span('charts', count=len(charts), workers=chart_workers) as span:
+                    pngs = render_charts([chart for _, chart, _ in charts], workers=chart_workers)
+                    for (section_data, _, key), png in zip(charts, pngs):
+                        section_data['chart_html'] = self._chart_fragment(png, assets, key)
+                    span.bytes = sum(len(png or b'') for png in pngs)
         
         return prepared
 
-    def _render_table(self, df: pd.DataFrame) -> str:
+    def _table_html(self, section: Section, df: pd.DataFrame) -> Tuple[str, bool]:
+        """(HTML da tabela da seção, veio_do_cache), usando o cache de fragmentos se ativo"""
+        locale = section.table_locale or self.config.locale
+        if not fragment_cache_enabled():
+            html = self._render_table(
+                df,
+                formats=section.table_formats,
+                locale=locale,
+                highlights=section.table_highlights
+            )
+            return html, False
+
+        highlights = resolve_highlights(df, section.table_highlights)
+        render = lambda: self._render_table(df, formats=section.table_formats, locale=locale, highlights=highlights)
+        try:
+            key = table_key(df, section.table_formats, locale, highlights)
+        except TypeError:
+            # Células sem hash (listas, dicts, objetos arbitrários): renderiza sem cache
+            return render(), False
+        return cached_fragment(key, render)
+
+    def _render_table(
+        self,
+        df: pd.DataFrame,
+        formats: Optional[Dict[str, FormatSpec]] = None,
+        locale: Optional[str] = None,
+        highlights: Optional[List[HighlightRule]] = None
+    ) -> str:
         """Renderiza DataFrame como HTML formatado"""
-        # Aplica formatação condicional
-        html = '<div class="data-table-wrapper">'
-        html += '<table class="data-table">'
-        
-        # Cabeçalho
-        html += '<thead><tr>'
-        for col in df.columns:
-            html += f'<th>{col}</th>'
-        html += '</tr></thead>'
-        
-        # Corpo
-        html += '<tbody>'
-        for _, row in df.iterrows():
-            html += '<tr>'
-            for val in row:
-                # Formata valores numéricos
-                if isinstance(val, (int, float)):
-                    if isinstance(val, float):
-                        formatted = f'{val:,.2f}'
-                    else:
-                        formatted = f'{val:,}'
-                else:
-                    formatted = str(val)
-                html += f'<td>{formatted}</td>'
-            html += '</tr>'
-        html += '</tbody>'
-        
-        html += '</table></div>'
-        return html
+        return render_table(
+            df,
+            formats=formats,
+            locale=locale or self.config.locale,
+            highlights=highlights
+        )
 
-    def _render_chart(self, chart_config: Dict) -> str:
-        """Renderiza gráfico como SVG inline ou imagem"""
-        # Aqui você pode integrar com matplotlib, plotly, etc.
-        # Por simplicidade, vou criar um placeholder
-        chart_type = chart_config['type']
-        data = chart_config['data']
-        
-        # Exemplo básico com matplotlib (requer matplotlib instalado)
-        try:
-            import matplotlib.pyplot as plt
-            import io
-            
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            if chart_type == 'bar':
-                for label, values in data.items():
-                    ax.bar(range(len(values)), values, label=label)
-            elif chart_type == 'line':
-                for label, values in data.items():
-                    ax.plot(values, label=label, marker='o')
-            elif chart_type == 'pie':
-                values = list(data.values())[0]
-                labels = chart_config.get('labels', [])
-                ax.pie(values, labels=labels, autopct='%1.1f%%')
-            
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            # Converte para base64
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-            plt.close()
-            buf.seek(0)
-            img_base64 = base64.b64encode(buf.read()).decode()
-            
-            return f'<img src="data:image/png;base64,{img_base64}" class="chart-image" />'
-        except ImportError:
-            return '<div class="chart-placeholder">Gráfico (matplotlib não disponível)</div>'
+    def _render_chart(
+        self,
+        chart_config: Dict,
+        assets: RenderAssets,
+        fragment_key: Optional[str] = None
+    ) -> str:
+        """Renderiza gráfico como imagem (reaproveitando o cache de gráficos)"""
+        return self._chart_fragment(render_chart(chart_config), assets, fragment_key)
+
+    def _chart_fragment(self, png: Optional[bytes], assets: RenderAssets, fragment_key: Optional[str]) -> str:
+        """Registra o PNG como asset e guarda a URL no cache de fragmentos"""
+        if png is None:
+            return chart_html(None)
+        url = assets.add(png)
+        if fragment_key:
+            put_fragment(fragment_key, url)
+        return chart_html(url)
 
     def _generate_kpi_html(self, kpis: List[Dict], columns: int) -> str:
         """Gera HTML para grid de KPIs"""
@@ -397,57 +884,46 @@ class ReportBuilder:
         html += '</div>'
         return html
 
-    def _get_logo_base64(self) -> str:
-        """Converte logo para base64"""
-        if self.config.logo_path and Path(self.config.logo_path).exists():
-            with open(self.config.logo_path, 'rb') as f:
-                return base64.b64encode(f.read()).decode()
-        return ""
-
-    def _get_base_template(self) -> str:
-        """Template HTML base do relatório"""
-        return TEMPLATE_STRING
-
-    def _load_themes(self) -> Dict[str, str]:
-        """Carrega temas CSS pré-definidos"""
-        return {
-            'corporate': self._get_corporate_theme(),
-            'modern': self._get_modern_theme(),
-            'minimal': self._get_minimal_theme(),
-            'executive': self._get_executive_theme(),
-            'colorful': self._get_colorful_theme()
-        }
-
-    def _get_corporate_theme(self) -> str:
-        """Tema corporativo tradicional"""
-        return CORPORATE_THEME_CSS
-
-    def _get_modern_theme(self) -> str:
-        """Tema moderno com cores vibrantes"""
-        base = self._get_corporate_theme()
-        return base.replace('#1a4d7a', '#6366f1').replace('#f5f5f5', '#f8fafc')
-
-    def _get_minimal_theme(self) -> str:
-        """Tema minimalista"""
-        base = self._get_corporate_theme()
-        return base.replace('#1a4d7a', '#000000').replace('border-left: 4px solid', 'border-left: 2px solid')
-
-    def _get_executive_theme(self) -> str:
-        """Tema executivo premium"""
-        base = self._get_corporate_theme()
-        return base.replace('#1a4d7a', '#2c3e50')
+    def _render_assets(self) -> RenderAssets:
+        """Assets de uma renderização; no modo streaming, fora do registro do
+        processo: as imagens vivem só até o fim do layout"""
+        if self.streaming:
+            return RenderAssets(AssetRegistry(max_bytes=0))
+        return RenderAssets()
+
+    def _logo_url(self, assets: RenderAssets) -> Optional[str]:
+        """URL de asset do logo (o arquivo só é relido quando muda)"""
+        if not self.config.logo_path:
+            return None
+        try:
+            return assets.add_file(self.config.logo_path)
+        except OSError:
+            return None
 
-    def _get_colorful_theme(self) -> str:
-        """Tema colorido"""
-        base = self._get_corporate_theme()
-        return base.replace('#1a4d7a', '#e91e63')
+    def _get_logo_base64(self) -> str:
+        """Converte logo para base64 (para templates que usam logo_base64)"""
+        if not self.config.logo_path:
+            return ""
+        try:
+            _, asset = get_asset_registry().add_file(self.config.logo_path)
+        except OSError:
+            return ""
+        return base64.b64encode(asset.data).decode()
 
 
 # Funções de conveniência para criação rápida
-def create_report(title: str, theme: ReportTheme = ReportTheme.CORPORATE) -> ReportBuilder:
-    """Cria um novo relatório com configuração padrão"""
+def create_report(
+    title: str,
+    theme: Union[ReportTheme, str] = ReportTheme.CORPORATE,
+    streaming: bool = False
+) -> ReportBuilder:
+    """Cria um novo relatório com configuração padrão
+
+    `streaming=True` para relatórios com muitas tabelas grandes: cada seção é
+    renderizada ao ser adicionada e seus dados são liberados.
+    """
     config = ReportConfig(title=title, theme=theme)
-    return ReportBuilder(config)
+    return ReportBuilder(config, streaming=streaming)
 
 
 def quick_report(
@@ -465,303 +941,3 @@ def quick_report(
     builder.add_table("Dados", data)
     
     return builder.generate(output_path)
-
-
-TEMPLATE_STRING = '''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>{{ config.title }}</title>
-    </head>
-    <body class="theme-{{ theme }}">
-        <!-- Capa -->
-        <div class="cover-page">
-            {% if logo_base64 %}
-            <div class="logo">
-                <img src="data:image/png;base64,{{ logo_base64 }}" alt="Logo" />
-            </div>
-            {% endif %}
-            
-            <h1 class="report-title">{{ config.title }}</h1>
-            
-            {% if config.subtitle %}
-            <h2 class="report-subtitle">{{ config.subtitle }}</h2>
-            {% endif %}
-            
-            <div class="report-meta">
-                {% if config.author %}
-                <p><strong>Autor:</strong> {{ config.author }}</p>
-                {% endif %}
-                {% if config.company %}
-                <p><strong>Empresa:</strong> {{ config.company }}</p>
-                {% endif %}
-                <p><strong>Data:</strong> {{ date_formatted }}</p>
-            </div>
-        </div>
-        
-        <!-- Índice -->
-        {% if config.show_toc and sections|length > 3 %}
-        <div class="toc-page">
-            <h2>Índice</h2>
-            <ul class="toc">
-                {% for section in sections %}
-                <li><a href="#section-{{ loop.index }}">{{ section.title }}</a></li>
-                {% endfor %}
-            </ul>
-        </div>
-        {% endif %}
-        
-        <!-- Seções -->
-        {% for section in sections %}
-        <div class="section {% if section.page_break_before %}page-break-before{% endif %} {% if section.page_break_after %}page-break-after{% endif %}" id="section-{{ loop.index }}">
-            <h2 class="section-title">{{ section.title }}</h2>
-            
-            {% if section.content %}
-            <div class="section-content">{{ section.content|safe }}</div>
-            {% endif %}
-            
-            {% if section.custom_html %}
-            <div class="section-custom">{{ section.custom_html|safe }}</div>
-            {% endif %}
-            
-            {% if section.table_html %}
-            {{ section.table_html|safe }}
-            {% endif %}
-            
-            {% if section.chart_html %}
-            <div class="chart-container">
-                {{ section.chart_html|safe }}
-            </div>
-            {% endif %}
-        </div>
-        {% endfor %}
-        
-        <!-- Rodapé -->
-        {% if config.footer_text %}
-        <div class="report-footer">
-            {{ config.footer_text }}
-        </div>
-        {% endif %}
-    </body>
-    </html>
-'''
-
-CORPORATE_THEME_CSS = '''
-    @page {
-        size: A4;
-        margin: 2.5cm 2cm;
-        @bottom-right {
-            content: "Página " counter(page) " de " counter(pages);
-            font-size: 9pt;
-            color: #666;
-        }
-    }
-    
-    body {
-        font-family: 'Helvetica', 'Arial', sans-serif;
-        color: #333;
-        line-height: 1.6;
-        font-size: 11pt;
-    }
-    
-    .cover-page {
-        page-break-after: always;
-        text-align: center;
-        padding-top: 30%;
-    }
-    
-    .logo img {
-        max-width: 200px;
-        margin-bottom: 2cm;
-    }
-    
-    .report-title {
-        font-size: 32pt;
-        color: #1a4d7a;
-        margin-bottom: 0.5cm;
-        font-weight: bold;
-    }
-    
-    .report-subtitle {
-        font-size: 18pt;
-        color: #666;
-        margin-bottom: 2cm;
-        font-weight: normal;
-    }
-    
-    .report-meta {
-        font-size: 12pt;
-        color: #666;
-    }
-    
-    .toc-page {
-        page-break-after: always;
-    }
-    
-    .toc {
-        list-style: none;
-        padding: 0;
-    }
-    
-    .toc li {
-        padding: 0.5cm 0;
-        border-bottom: 1px solid #eee;
-    }
-    
-    .section-title {
-        color: #1a4d7a;
-        font-size: 18pt;
-        margin-top: 1cm;
-        margin-bottom: 0.5cm;
-        border-bottom: 2px solid #1a4d7a;
-        padding-bottom: 0.3cm;
-    }
-    
-    .section-content {
-        margin-bottom: 1cm;
-        text-align: justify;
-    }
-    
-    .data-table {
-        width: 100%;
-        border-collapse: collapse;
-        margin: 1cm 0;
-        font-size: 10pt;
-    }
-    
-    .data-table th {
-        background-color: #1a4d7a;
-        color: white;
-        padding: 0.3cm;
-        text-align: left;
-        font-weight: bold;
-    }
-    
-    .data-table td {
-        padding: 0.3cm;
-        border-bottom: 1px solid #ddd;
-    }
-    
-    .data-table tr:nth-child(even) {
-        background-color: #f9f9f9;
-    }
-    
-    .kpi-grid {
-        display: grid;
-        gap: 0.5cm;
-        margin: 1cm 0;
-    }
-    
-    .kpi-grid-2 { grid-template-columns: repeat(2, 1fr); }
-    .kpi-grid-3 { grid-template-columns: repeat(3, 1fr); }
-    .kpi-grid-4 { grid-template-columns: repeat(4, 1fr); }
-    
-    .kpi-card {
-        background: #f5f5f5;
-        padding: 0.5cm;
-        border-radius: 5px;
-        border-left: 4px solid #1a4d7a;
-    }
-    
-    .kpi-label {
-        font-size: 9pt;
-        color: #666;
-        margin-bottom: 0.2cm;
-    }
-    
-    .kpi-value {
-        font-size: 24pt;
-        font-weight: bold;
-        color: #1a4d7a;
-        margin-bottom: 0.2cm;
-    }
-    
-    .kpi-trend {
-        font-size: 10pt;
-    }
-    
-    .trend-up { color: #27ae60; }
-    .trend-down { color: #e74c3c; }
-    .trend-neutral { color: #666; }
-    
-    .chart-image {
-        max-width: 100%;
-        height: auto;
-        margin: 1cm 0;
-    }
-    
-    .page-break-before {
-        page-break-before: always;
-    }
-    
-    .page-break-after {
-        page-break-after: always;
-    }
-    
-    .executive-summary {
-        background: #f0f8ff;
-        padding: 0.7cm;
-        border-radius: 5px;
-        margin: 1cm 0;
-    }
-    
-    .summary-metrics {
-        display: grid;
-        grid-template-columns: repeat(2, 1fr);
-        gap: 0.5cm;
-        margin-bottom: 0.5cm;
-    }
-    
-    .summary-metric {
-        background: white;
-        padding: 0.3cm;
-        border-radius: 3px;
-    }
-    
-    .metric-value {
-        font-weight: bold;
-        color: #1a4d7a;
-    }
-    
-    .highlights-list {
-        margin-top: 0.3cm;
-    }
-    
-    .highlights-list li {
-        margin-bottom: 0.2cm;
-    }
-    
-    .comparison-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-        gap: 0.5cm;
-        margin: 1cm 0;
-    }
-    
-    .comparison-item {
-        background: #f9f9f9;
-        padding: 0.5cm;
-        border-radius: 5px;
-    }
-    
-    .comparison-title {
-        color: #1a4d7a;
-        font-size: 14pt;
-        margin-bottom: 0.3cm;
-    }
-    
-    .comparison-field {
-        margin-bottom: 0.2cm;
-        font-size: 10pt;
-    }
-    
-    .field-label {
-        color: #666;
-    }
-    
-    .field-value {
-        font-weight: bold;
-        color: #333;
-    }
-'''
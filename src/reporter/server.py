@@ -0,0 +1,306 @@
+"""
+Servidor de renderização persistente (reporter serve)
+Mantém um pool de workers aquecidos (WeasyPrint, pandas, matplotlib, fontes e
+template já carregados) e recebe especificações JSON por HTTP local ou socket Unix
+
+Endpoints:
+    POST /render   especificação JSON ou ReportSpec binário (ver spec.py) -> application/pdf
+    GET  /health   {"status": "ok", ...}
+    GET  /stats    contadores de requisições e vazão
+"""
+
+import http.client
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from .assets import restrict_resources
+from .batch import RenderPool
+from .spec import SPEC_CONTENT_TYPE, ReportSpec, builder_from_dict
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_SPEC_BYTES = 256 * 1024 * 1024
+
+
+class RenderServerError(RuntimeError):
+    """Erro devolvido pelo servidor de renderização"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+@dataclass
+class ServerStats:
+    """Contadores do servidor"""
+    requests: int = 0
+    rendered: int = 0
+    failed: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    total_bytes: int = 0
+    render_time: float = 0.0
+    started_at: float = field(default_factory=time.time)
+
+
+def _render_spec_job(spec: Union[Dict[str, Any], bytes], allowed_paths: Tuple[str, ...] = ()) -> Tuple[bytes, float]:
+    """Executa no worker: monta o ReportBuilder a partir da especificação e gera o PDF
+
+    A especificação vem de um cliente: nada de pickle e só arquivos sob `allowed_paths`.
+    """
+    start = time.perf_counter()
+    with restrict_resources(allowed_paths):
+        if isinstance(spec, bytes):
+            builder = ReportSpec.from_bytes(spec, allow_pickle=False).to_builder()
+        else:
+            builder = builder_from_dict(spec)
+        pdf_bytes = builder.generate()
+    return pdf_bytes, time.perf_counter() - start
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'ReportMaster'
+    protocol_version = 'HTTP/1.1'
+
+    def address_string(self) -> str:
+        # Conexões por socket Unix não têm endereço (client_address == '')
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.render_server.quiet:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:
+        render_server: RenderServer = self.server.render_server
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok', 'workers': render_server.pool.jobs})
+        elif self.path == '/stats':
+            self._send_json(200, render_server.stats_dict())
+        else:
+            self._send_json(404, {'error': f"Rota desconhecida: {self.path}"})
+
+    def do_POST(self) -> None:
+        render_server: RenderServer = self.server.render_server
+        if self.path != '/render':
+            self._send_json(404, {'error': f"Rota desconhecida: {self.path}"})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_SPEC_BYTES:
+            self._send_json(413, {'error': f"Especificação maior que {MAX_SPEC_BYTES} bytes"})
+            self.close_connection = True
+            return
+        body = self.rfile.read(length)
+        if self.headers.get_content_type() == SPEC_CONTENT_TYPE:
+            spec = body
+        else:
+            try:
+                spec = json.loads(body)
+            except ValueError as exc:
+                self._send_json(400, {'error': f"JSON inválido: {exc}"})
+                return
+
+        status, body = render_server.render(spec)
+        if status == 200:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/pdf')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_json(status, body)
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        if status == 503:
+            self.send_header('Retry-After', '1')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class RenderServer:
+    """Servidor HTTP (localhost ou socket Unix) na frente de um pool de workers aquecidos
+
+    No máximo `workers + max_queue` renderizações ficam pendentes; além disso
+    as requisições recebem 503 com Retry-After, assim como as que perdem o
+    worker (o pool é recriado). Especificações binárias com
+    pickle recebem 400; logo, CSS e HTML das especificações só leem arquivos
+    sob `allowed_paths` (nenhum, por padrão) e nunca URLs remotas.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        socket_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        max_queue: int = 64,
+        quiet: bool = False,
+        allowed_paths: Iterable[str] = ()
+    ):
+        self.socket_path = socket_path
+        self.quiet = quiet
+        self.allowed_paths = tuple(allowed_paths)
+        self.pool = RenderPool(workers)
+        self.max_pending = self.pool.jobs + max_queue
+        self._stats = ServerStats()
+        self._lock = threading.Lock()
+
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self._httpd = _UnixServer(socket_path, _Handler)
+        else:
+            self._httpd = _TCPServer((host, port), _Handler)
+        self._httpd.render_server = self
+
+    @property
+    def address(self) -> str:
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def prestart(self) -> None:
+        """Sobe e aquece todos os workers antes de aceitar requisições"""
+        self.pool.prestart()
+
+    def render(self, spec: Union[Dict[str, Any], bytes]) -> Tuple[int, Any]:
+        """Renderiza no pool: (200, bytes do PDF) ou (status de erro, {'error': ...})"""
+        with self._lock:
+            self._stats.requests += 1
+            if self._stats.in_flight >= self.max_pending:
+                self._stats.rejected += 1
+                return 503, {'error': f"{self._stats.in_flight} renderizações pendentes"}
+            self._stats.in_flight += 1
+
+        pool = self.pool
+        try:
+            pdf_bytes, elapsed = pool.executor.submit(_render_spec_job, spec, self.allowed_paths).result()
+        except BrokenProcessPool:
+            # Um worker morreu: troca o pool e o cliente tenta de novo
+            self._replace_pool(pool)
+            status, body = 503, {'error': "Worker de renderização encerrado; tente novamente"}
+        except (ValueError, KeyError) as exc:
+            # Especificação inválida: versão, campos, tema, template ou colunas
+            message = exc.args[0] if isinstance(exc, KeyError) and exc.args else exc
+            status, body = 400, {'error': str(message)}
+        except Exception as exc:
+            status, body = 500, {'error': f"{type(exc).__name__}: {exc}"}
+        else:
+            status, body = 200, pdf_bytes
+        finally:
+            with self._lock:
+                self._stats.in_flight -= 1
+
+        with self._lock:
+            if status == 200:
+                self._stats.rendered += 1
+                self._stats.total_bytes += len(pdf_bytes)
+                self._stats.render_time += elapsed
+            else:
+                self._stats.failed += 1
+        return status, body
+
+    def _replace_pool(self, broken: RenderPool) -> None:
+        """Troca o pool quebrado (uma vez, mesmo com várias requisições falhando juntas)"""
+        with self._lock:
+            if self.pool is not broken:
+                return
+            self.pool = RenderPool(broken.jobs)
+        broken.shutdown(wait=False)
+
+    def stats_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            data = asdict(self._stats)
+        data['uptime'] = time.time() - data.pop('started_at')
+        data['workers'] = self.pool.jobs
+        return data
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """Para de aceitar conexões, encerra os workers e remove o socket"""
+        self._httpd.shutdown()
+        self.close()
+
+    def close(self) -> None:
+        self._httpd.server_close()
+        self.pool.shutdown(wait=True)
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def render_remote(
+    report: Any,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+    timeout: Optional[float] = 300
+) -> bytes:
+    """Envia um relatório ao servidor e retorna o PDF
+
+    `report` pode ser um ReportBuilder ou ReportSpec (enviados no formato binário
+    colunar) ou uma especificação JSON já em dict.
+    """
+    if isinstance(report, dict):
+        body, content_type = json.dumps(report).encode(), 'application/json'
+    else:
+        spec = report if isinstance(report, ReportSpec) else ReportSpec.from_builder(report)
+        body, content_type = spec.to_bytes(), SPEC_CONTENT_TYPE
+
+    if socket_path:
+        conn = _UnixHTTPConnection(socket_path, timeout=timeout)
+    else:
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request(
+            'POST',
+            '/render',
+            body=body,
+            headers={'Content-Type': content_type}
+        )
+        response = conn.getresponse()
+        body = response.read()
+    finally:
+        conn.close()
+
+    if response.status != 200:
+        try:
+            message = json.loads(body).get('error', '')
+        except ValueError:
+            message = body.decode(errors='replace')
+        raise RenderServerError(response.status, message)
+    return body
@@ -0,0 +1,110 @@
+"""
+Transporte por memória compartilhada para workers de renderização
+O ReportSpec binário (colunas em buffers alinhados) é escrito uma única vez em
+um segmento de multiprocessing.shared_memory; cada worker reconstrói os
+DataFrames como views sem cópia sobre o segmento, em vez de receber um pickle
+"""
+
+import atexit
+import gc
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from .spec import ReportSpec
+
+T = TypeVar('T')
+
+
+class SharedSpec:
+    """ReportSpec publicado em um segmento de memória compartilhada
+
+    O processo que cria é o dono: `release()` (ou o bloco `with`) fecha e
+    remove o segmento. Segmentos esquecidos são removidos na saída do processo.
+    """
+
+    def __init__(self, spec: ReportSpec):
+        self._shm: Optional[SharedMemory] = None
+
+        def allocate(size: int) -> memoryview:
+            self._shm = SharedMemory(create=True, size=max(size, 1))
+            return self._shm.buf
+
+        self.size = spec.write_into(allocate)
+        self.name = self._shm.name
+        _register(self)
+
+    @classmethod
+    def from_builder(cls, builder: Any) -> 'SharedSpec':
+        return cls(ReportSpec.from_builder(builder))
+
+    @property
+    def handle(self) -> Tuple[str, int]:
+        """O que viaja para o worker: nome do segmento e tamanho útil"""
+        return self.name, self.size
+
+    def release(self) -> None:
+        """Fecha e remove o segmento (idempotente)"""
+        shm, self._shm = self._shm, None
+        if shm is None:
+            return
+        _unregister(self)
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> 'SharedSpec':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+
+_live: Dict[int, SharedSpec] = {}
+_live_lock = threading.Lock()
+
+
+def _register(shared: SharedSpec) -> None:
+    with _live_lock:
+        _live[id(shared)] = shared
+
+
+def _unregister(shared: SharedSpec) -> None:
+    with _live_lock:
+        _live.pop(id(shared), None)
+
+
+def release_all() -> None:
+    """Remove todos os segmentos ainda vivos deste processo (chamado na saída)"""
+    with _live_lock:
+        pending = list(_live.values())
+    for shared in pending:
+        shared.release()
+
+
+atexit.register(release_all)
+
+
+def _close_segment(shm: SharedMemory) -> None:
+    """Fecha o mapeamento no worker; views remanescentes seguram o mapeamento até o GC"""
+    gc.collect()
+    try:
+        shm.close()
+    except BufferError:
+        pass
+
+
+def with_shared_builder(handle: Tuple[str, int], func: Callable[[Any], T]) -> T:
+    """Executa no worker: anexa o segmento, monta o ReportBuilder sobre ele e chama `func`
+
+    O builder (e suas views) não deve sobreviver a `func`; em seguida o
+    mapeamento é fechado.
+    """
+    name, size = handle
+    shm = SharedMemory(name=name)
+    try:
+        return func(ReportSpec.from_bytes(shm.buf[:size]).to_builder())
+    finally:
+        _close_segment(shm)
@@ -0,0 +1,191 @@
+"""
+Fontes de dados em arquivo para tabelas e gráficos
+Feather/Arrow IPC é mapeado em memória; Parquet é lido por row group e CSV em
+blocos. Só as colunas e linhas pedidas são lidas, e apenas em generate():
+o pico de memória acompanha o que vai para a página, não o tamanho do arquivo.
+"""
+
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+def _require_pyarrow() -> None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("Arquivos Feather/Parquet exigem o pyarrow: pip install pyarrow") from None
+
+
+@dataclass
+class DataSource(ABC):
+    """Arquivo lido sob demanda: `columns` (todas, se None) e linhas [start, stop)"""
+    path: Union[str, os.PathLike]
+    columns: Optional[List[str]] = None
+    start: int = 0
+    stop: Optional[int] = None
+
+    def __post_init__(self):
+        self.path = os.fspath(self.path)
+        if self.columns is not None:
+            self.columns = list(self.columns)
+        if self.start < 0 or (self.stop is not None and self.stop < self.start):
+            raise ValueError(f"Intervalo de linhas inválido: [{self.start}, {self.stop})")
+
+    @abstractmethod
+    def load(self) -> pd.DataFrame:
+        """Lê as colunas e linhas selecionadas como DataFrame"""
+
+    def _overlaps(self, offset: int, rows: int) -> bool:
+        """O bloco [offset, offset + rows) tem linhas dentro do intervalo?"""
+        return offset + rows > self.start and (self.stop is None or offset < self.stop)
+
+    def _finish(self, table: pa.Table, first_row: int) -> pd.DataFrame:
+        """Recorta a tabela Arrow (que começa na linha `first_row`) e converte para pandas"""
+        length = None if self.stop is None else self.stop - self.start
+        table = table.slice(max(self.start - first_row, 0), length)
+        if self.columns is not None:
+            table = table.select(self.columns)
+        return table.to_pandas(split_blocks=True)
+
+
+@dataclass
+class FeatherSource(DataSource):
+    """Arquivo Feather v2 / Arrow IPC, mapeado em memória
+
+    Sem compressão, colunas e lotes fora da seleção nem chegam a ser
+    paginados do disco; com compressão, só os selecionados são descomprimidos.
+    """
+
+    def load(self) -> pd.DataFrame:
+        _require_pyarrow()
+        import pyarrow as pa
+        import pyarrow.ipc
+
+        with pa.memory_map(self.path) as source:
+            options = None
+            if self.columns is not None:
+                schema = pa.ipc.open_file(source).schema
+                options = pa.ipc.IpcReadOptions(
+                    included_fields=sorted(schema.get_field_index(name) for name in self._checked(schema))
+                )
+            reader = pa.ipc.open_file(source, options=options)
+
+            batches = []
+            offset = first_row = 0
+            for index in range(reader.num_record_batches):
+                batch = reader.get_batch(index)
+                if self._overlaps(offset, batch.num_rows):
+                    first_row = offset if not batches else first_row
+                    batches.append(batch)
+                offset += batch.num_rows
+                if self.stop is not None and offset >= self.stop:
+                    break
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+            return self._finish(table, first_row)
+
+    def _checked(self, schema: pa.Schema) -> List[str]:
+        missing = [name for name in self.columns if schema.get_field_index(name) < 0]
+        if missing:
+            raise KeyError(f"Colunas inexistentes em {self.path}: {missing}")
+        return self.columns
+
+
+@dataclass
+class ParquetSource(DataSource):
+    """Arquivo Parquet: lê apenas os row groups que cobrem as linhas pedidas"""
+
+    def load(self) -> pd.DataFrame:
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        with pq.ParquetFile(self.path, memory_map=True) as parquet:
+            metadata = parquet.metadata
+            groups = []
+            offset = first_row = 0
+            for index in range(metadata.num_row_groups):
+                rows = metadata.row_group(index).num_rows
+                if self._overlaps(offset, rows):
+                    first_row = offset if not groups else first_row
+                    groups.append(index)
+                offset += rows
+            table = parquet.read_row_groups(groups, columns=self.columns)
+            return self._finish(table, first_row)
+
+
+@dataclass
+class CsvSource(DataSource):
+    """Arquivo CSV lido em blocos de `batch_size` linhas
+
+    `options` vai para pandas.read_csv (sep, encoding, dtype, ...). Blocos
+    anteriores a `start` são descartados e a leitura para em `stop`.
+    """
+    batch_size: int = 100_000
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def load(self) -> pd.DataFrame:
+        import pandas as pd
+
+        frames = []
+        empty = None
+        offset = 0
+        with pd.read_csv(self.path, usecols=self.columns, chunksize=self.batch_size, **self.options) as reader:
+            for chunk in reader:
+                if empty is None:
+                    empty = chunk.iloc[:0]
+                if self._overlaps(offset, len(chunk)):
+                    stop = None if self.stop is None else self.stop - offset
+                    frames.append(chunk.iloc[max(self.start - offset, 0):stop])
+                offset += len(chunk)
+                if self.stop is not None and offset >= self.stop:
+                    break
+
+        if frames:
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0].reset_index(drop=True)
+        elif empty is not None:
+            df = empty
+        else:
+            df = pd.read_csv(self.path, usecols=self.columns, nrows=0, **self.options)
+        # usecols mantém a ordem do arquivo; a seleção define a da tabela
+        return df[self.columns] if self.columns is not None else df
+
+
+_EXTENSIONS = {
+    '.feather': FeatherSource,
+    '.arrow': FeatherSource,
+    '.ipc': FeatherSource,
+    '.parquet': ParquetSource,
+    '.pq': ParquetSource,
+    '.csv': CsvSource,
+}
+
+
+def open_source(
+    path: Union[str, os.PathLike],
+    columns: Optional[List[str]] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    **options: Any
+) -> DataSource:
+    """Fonte de dados pela extensão do arquivo (.feather/.arrow, .parquet, .csv[.gz])
+
+    `options` vai para pandas.read_csv em arquivos CSV.
+    """
+    name = os.fspath(path).lower()
+    for suffix in ('.gz', '.bz2', '.zip', '.xz', '.zst'):
+        name = name.removesuffix(suffix)
+    source_class = _EXTENSIONS.get(os.path.splitext(name)[1])
+    if source_class is None:
+        raise ValueError(f"Formato de arquivo não suportado: {os.fspath(path)!r}")
+    if source_class is CsvSource:
+        return CsvSource(path, columns, start, stop, options=options)
+    if options:
+        raise TypeError(f"Opções de leitura só se aplicam a CSV: {sorted(options)}")
+    return source_class(path, columns, start, stop)
@@ -0,0 +1,679 @@
+"""
+Especificação serializável de relatórios (ReportSpec)
+Captura ReportConfig e todas as seções de um ReportBuilder em um formato
+versionado, com duas codificações:
+
+- dicionário JSON (to_dict/from_dict): legível, usado pelo servidor HTTP;
+- binário colunar (to_bytes/from_bytes): cabeçalho JSON + buffers NumPy das
+  colunas, sem pickle por linha; numéricos voltam como views sem cópia.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import json
+import pickle
+import struct
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+from .formatting import ColumnFormat, FormatSpec, FormatType, to_column_format
+from .providers import prefetch, resolve_chart, resolve_table
+from .tables import HighlightRule, evaluate_condition
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from .report_framework import ReportBuilder, Section
+
+
+SPEC_VERSION = 1
+
+# Cabeçalho do formato binário: magic, versão da especificação, tamanho do JSON
+SPEC_MAGIC = b'RPTSPEC\x00'
+SPEC_CONTENT_TYPE = 'application/x-reporter-spec'
+_PREFIX = struct.Struct('<8sIQ')
+_ALIGN = 8
+
+_CONFIG_FIELDS = (
+    'title', 'subtitle', 'author', 'company', 'logo_path', 'show_page_numbers',
+    'show_toc', 'header_text', 'footer_text', 'custom_css', 'locale', 'template'
+)
+
+_FORMAT_DEFAULTS = ColumnFormat()
+
+_JSON_SCALARS = (str, int, float, bool)
+
+
+# ---------------------------------------------------------------------------
+# Formatos e destaques
+# ---------------------------------------------------------------------------
+
+def _format_to_dict(spec: FormatSpec) -> Any:
+    """ColumnFormat -> 'currency' ou {'type': 'currency', 'decimals': 0, ...}"""
+    fmt = to_column_format(spec)
+    extra = {
+        f.name: getattr(fmt, f.name)
+        for f in dataclasses.fields(fmt)
+        if f.name != 'type' and getattr(fmt, f.name) != getattr(_FORMAT_DEFAULTS, f.name)
+    }
+    if not extra:
+        return fmt.type.value
+    return {'type': fmt.type.value, **extra}
+
+
+def _format_from_dict(data: Any) -> ColumnFormat:
+    if isinstance(data, dict):
+        options = dict(data)
+        return ColumnFormat(type=FormatType(options.pop('type', 'text')), **options)
+    return to_column_format(data)
+
+
+def _highlight_from_dict(data: Any) -> List[HighlightRule]:
+    if isinstance(data, dict) and 'condition' not in data:
+        # Forma abreviada: {classe_css: condição}
+        return [HighlightRule(condition, css_class) for css_class, condition in data.items()]
+    if isinstance(data, dict):
+        return [HighlightRule(**data)]
+    return [rule for item in data for rule in _highlight_from_dict(item)]
+
+
+# ---------------------------------------------------------------------------
+# Tabelas em JSON (colunas/linhas)
+# ---------------------------------------------------------------------------
+
+def _table_to_dict(df: pd.DataFrame) -> Dict[str, Any]:
+    """Tabela em colunas/linhas JSON; dtypes preservam inteiros, datas e categorias
+
+    Ao contrário de to_bytes, não é sem perdas para objetos arbitrários.
+    """
+    import pandas as pd
+
+    columns = []
+    for name in df.columns:
+        values = df[name]
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+            values = values.map(lambda v: v.isoformat(), na_action='ignore')
+        elif pd.api.types.is_timedelta64_dtype(values.dtype):
+            values = values.map(str, na_action='ignore')
+        plain_dtype = values.dtype != object
+        values = values.astype(object)
+        column = values.where(values.notna(), None).tolist()
+        if not plain_dtype:
+            # Valores sem equivalente JSON (Decimal, listas, ...) viajam como texto
+            column = [v if v is None or isinstance(v, _JSON_SCALARS) else str(v) for v in column]
+        columns.append(column)
+
+    return {
+        'columns': [str(name) for name in df.columns],
+        'dtypes': {str(name): str(dtype) for name, dtype in df.dtypes.items()},
+        'rows': [list(row) for row in zip(*columns)] if columns else [[] for _ in range(len(df))]
+    }
+
+
+def _table_from_dict(data: Dict[str, Any]) -> pd.DataFrame:
+    import pandas as pd
+
+    if 'records' in data:
+        df = pd.DataFrame(data['records'])
+    else:
+        df = pd.DataFrame(data.get('rows', []), columns=data.get('columns'))
+
+    for name, dtype in (data.get('dtypes') or {}).items():
+        if dtype != 'object' and name in df.columns:
+            df[name] = df[name].astype(dtype)
+    return df
+
+
+def _plain(value: Any) -> Any:
+    """Converte escalares e arrays NumPy (comuns em dados de gráficos) para tipos JSON"""
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Tabelas em buffers colunares
+# ---------------------------------------------------------------------------
+
+class _Buffers:
+    """Acumula buffers alinhados em 8 bytes e devolve o índice de cada um"""
+
+    def __init__(self):
+        self.chunks: List[Union[bytes, memoryview]] = []
+        self.layout: List[List[int]] = []
+        self.size = 0
+
+    def add(self, data: Union[bytes, memoryview]) -> int:
+        nbytes = memoryview(data).nbytes
+        self.layout.append([self.size, nbytes])
+        self.chunks.append(data)
+        padding = -nbytes % _ALIGN
+        if padding:
+            self.chunks.append(b'\x00' * padding)
+        self.size += nbytes + padding
+        return len(self.layout) - 1
+
+    def add_array(self, array: np.ndarray) -> int:
+        import numpy as np
+
+        return self.add(memoryview(np.ascontiguousarray(array).reshape(-1).view(np.uint8)))
+
+
+def _is_json_name(name: Any) -> bool:
+    return name is None or (isinstance(name, (str, int)) and not isinstance(name, bool))
+
+
+def _tz_roundtrips(dtype: Any) -> bool:
+    """O fuso pode ser reconstruído pelo nome? (senão a coluna vai por pickle)"""
+    import pandas as pd
+
+    try:
+        return pd.DatetimeTZDtype(dtype.unit, str(dtype.tz)) == dtype
+    except (TypeError, ValueError):
+        return False
+
+
+def _encode_column(values: Any, buffers: _Buffers) -> Dict[str, Any]:
+    """Array de uma coluna (ou índice) -> metadados + buffers"""
+    import numpy as np
+    import pandas as pd
+
+    array = pd.array(values, copy=False) if not isinstance(values, np.ndarray) else values
+    if isinstance(array, pd.arrays.NumpyExtensionArray):
+        # .array de colunas int64/float64/bool embrulha o ndarray: desembrulha sem cópia
+        array = array.to_numpy()
+    dtype = array.dtype
+
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+        return {'kind': 'numpy', 'dtype': dtype.str, 'data': buffers.add_array(np.asarray(array))}
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        return {
+            'kind': 'categorical',
+            'ordered': bool(dtype.ordered),
+            'codes': _encode_column(np.asarray(array.codes), buffers),
+            'categories': _encode_column(dtype.categories.array, buffers)
+        }
+
+    if isinstance(dtype, pd.DatetimeTZDtype) and _tz_roundtrips(dtype):
+        naive = np.asarray(array.tz_convert('UTC').tz_localize(None))
+        return {'kind': 'datetimetz', 'tz': str(dtype.tz), 'values': _encode_column(naive, buffers)}
+
+    if isinstance(array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)):
+        # Int64, Float64, boolean: valores + máscara de ausentes
+        mask = np.asarray(array.isna())
+        data = array.to_numpy(dtype=dtype.numpy_dtype, na_value=dtype.numpy_dtype.type(0))
+        return {
+            'kind': 'masked',
+            'dtype': str(dtype),
+            'data': buffers.add_array(data),
+            'mask': buffers.add_array(mask)
+        }
+
+    if isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow':
+        # Strings do pandas 3 (Arrow): buffers de validade/offsets/dados sem conversão
+        import pyarrow as pa
+
+        arrow = pa.array(array)
+        if isinstance(arrow, pa.ChunkedArray):
+            arrow = arrow.combine_chunks()
+        if arrow.offset == 0 and arrow.type in (pa.string(), pa.large_string()):
+            validity, offsets, data = arrow.buffers()
+            return {
+                'kind': 'arrow_string',
+                'dtype': str(dtype),
+                'arrow_type': str(arrow.type),
+                'length': len(arrow),
+                'validity': None if validity is None else buffers.add(memoryview(validity)),
+                'offsets': buffers.add(memoryview(offsets)),
+                'data': buffers.add(memoryview(data) if data is not None else b'')
+            }
+
+    if (dtype == object or isinstance(dtype, pd.StringDtype)) \
+            and pd.api.types.infer_dtype(array, skipna=True) in ('string', 'empty'):
+        objects = np.asarray(array, dtype=object)
+        mask = pd.isna(objects)
+        missing = {type(value) for value in objects[mask]}
+        if dtype != object or len(missing) <= 1:
+            present = objects[~mask].tolist()
+            lengths = np.fromiter(map(len, present), dtype=np.int64, count=len(present))
+            offsets = np.zeros(len(present) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            return {
+                'kind': 'string',
+                'dtype': str(dtype),
+                'na': 'nan' if float in missing else None,
+                'offsets': buffers.add_array(offsets),
+                'data': buffers.add(''.join(present).encode('utf-8', 'surrogatepass')),
+                'mask': buffers.add_array(mask)
+            }
+
+    # Demais casos (objetos mistos, Decimal, períodos, ...): pickle do array inteiro
+    return {'kind': 'pickle', 'data': buffers.add(pickle.dumps(array, protocol=5))}
+
+
+def _unpickle(buffer: memoryview, allow_pickle: bool) -> Any:
+    if not allow_pickle:
+        raise ValueError("Especificação contém dados em pickle, recusados nesta origem")
+    return pickle.loads(buffer)
+
+
+def _decode_column(meta: Dict[str, Any], buffers: List[memoryview], allow_pickle: bool = True) -> Any:
+    """Metadados + buffers -> array NumPy/pandas (views sem cópia quando possível)"""
+    import numpy as np
+    import pandas as pd
+
+    kind = meta['kind']
+    if kind == 'numpy':
+        return np.frombuffer(buffers[meta['data']], dtype=np.dtype(meta['dtype']))
+
+    if kind == 'categorical':
+        categories = _decode_column(meta['categories'], buffers, allow_pickle)
+        codes = _decode_column(meta['codes'], buffers, allow_pickle)
+        dtype = pd.CategoricalDtype(pd.Index(categories), ordered=meta['ordered'])
+        return pd.Categorical.from_codes(codes, dtype=dtype)
+
+    if kind == 'datetimetz':
+        naive = pd.DatetimeIndex(_decode_column(meta['values'], buffers, allow_pickle), copy=False)
+        return naive.tz_localize('UTC').tz_convert(meta['tz']).array
+
+    if kind == 'masked':
+        dtype = pd.api.types.pandas_dtype(meta['dtype'])
+        data = np.frombuffer(buffers[meta['data']], dtype=dtype.numpy_dtype)
+        mask = np.frombuffer(buffers[meta['mask']], dtype=bool)
+        return dtype.construct_array_type()(data, mask)
+
+    if kind == 'string':
+        offsets = np.frombuffer(buffers[meta['offsets']], dtype=np.int64)
+        mask = np.frombuffer(buffers[meta['mask']], dtype=bool)
+        text = bytes(buffers[meta['data']]).decode('utf-8', 'surrogatepass')
+        objects = np.full(len(mask), np.nan if meta['na'] == 'nan' else None, dtype=object)
+        objects[~mask] = [text[start:end] for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+        if meta['dtype'] == 'object':
+            return objects
+        return pd.array(objects, dtype=meta['dtype'])
+
+    if kind == 'arrow_string':
+        import pyarrow as pa
+
+        arrow = pa.Array.from_buffers(
+            pa.large_string() if meta['arrow_type'] == 'large_string' else pa.string(),
+            meta['length'],
+            [
+                None if meta['validity'] is None else pa.py_buffer(buffers[meta['validity']]),
+                pa.py_buffer(buffers[meta['offsets']]),
+                pa.py_buffer(buffers[meta['data']])
+            ]
+        )
+        return pd.arrays.ArrowStringArray(
+            pa.chunked_array([arrow]),
+            dtype=pd.api.types.pandas_dtype(meta['dtype'])
+        )
+
+    if kind == 'pickle':
+        return _unpickle(buffers[meta['data']], allow_pickle)
+
+    raise ValueError(f"Codificação de coluna desconhecida: {kind!r}")
+
+
+def _encode_frame(df: pd.DataFrame, buffers: _Buffers) -> Dict[str, Any]:
+    import pandas as pd
+
+    meta: Dict[str, Any] = {
+        'length': len(df),
+        'columns': [_encode_column(df.iloc[:, i].array, buffers) for i in range(df.shape[1])]
+    }
+
+    names = list(df.columns)
+    if isinstance(df.columns, pd.MultiIndex) or not all(_is_json_name(name) for name in names):
+        meta['names'] = {'pickle': buffers.add(pickle.dumps(df.columns, protocol=5))}
+    else:
+        meta['names'] = names
+
+    index = df.index
+    if isinstance(index, pd.RangeIndex) and _is_json_name(index.name):
+        meta['index'] = {'range': [index.start, index.stop, index.step], 'name': index.name}
+    elif not isinstance(index, pd.MultiIndex) and _is_json_name(index.name):
+        meta['index'] = {'values': _encode_column(index.array, buffers), 'name': index.name}
+    else:
+        meta['index'] = {'pickle': buffers.add(pickle.dumps(index, protocol=5))}
+    return meta
+
+
+def _decode_frame(meta: Dict[str, Any], buffers: List[memoryview], allow_pickle: bool = True) -> pd.DataFrame:
+    import pandas as pd
+
+    index_meta = meta['index']
+    if 'range' in index_meta:
+        index = pd.RangeIndex(*index_meta['range'], name=index_meta['name'])
+    elif 'values' in index_meta:
+        index = pd.Index(_decode_column(index_meta['values'], buffers, allow_pickle), name=index_meta['name'], copy=False)
+    else:
+        index = _unpickle(buffers[index_meta['pickle']], allow_pickle)
+
+    columns = [_decode_column(column, buffers, allow_pickle) for column in meta['columns']]
+    df = pd.DataFrame(dict(enumerate(columns)), index=index, copy=False)
+    if not columns:
+        df = pd.DataFrame(index=index)
+
+    names = meta['names']
+    if isinstance(names, dict):
+        df.columns = _unpickle(buffers[names['pickle']], allow_pickle)
+    else:
+        df.columns = pd.Index(names, dtype=object if not names else None)
+    return df
+
+
+def _encode_value(value: Any, buffers: _Buffers) -> Any:
+    """Percorre a árvore da especificação trocando DataFrames e arrays por buffers"""
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, dict):
+        return {key: _encode_value(item, buffers) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item, buffers) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        return {'__bytes__': buffers.add(value)}
+    if isinstance(value, pd.DataFrame):
+        return {'__frame__': _encode_frame(value, buffers)}
+    if isinstance(value, (np.ndarray, pd.Series)):
+        array = np.asarray(value)
+        if array.dtype == object:
+            return {'__pickle__': buffers.add(pickle.dumps(array, protocol=5))}
+        return {'__array__': {'dtype': array.dtype.str, 'shape': list(array.shape), 'data': buffers.add_array(array)}}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode_value(value: Any, buffers: List[memoryview], allow_pickle: bool = True) -> Any:
+    import numpy as np
+
+    if isinstance(value, list):
+        return [_decode_value(item, buffers, allow_pickle) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '__bytes__' in value:
+        return bytes(buffers[value['__bytes__']])
+    if '__frame__' in value:
+        return _decode_frame(value['__frame__'], buffers, allow_pickle)
+    if '__array__' in value:
+        meta = value['__array__']
+        return np.frombuffer(buffers[meta['data']], dtype=np.dtype(meta['dtype'])).reshape(meta['shape'])
+    if '__pickle__' in value:
+        return _unpickle(buffers[value['__pickle__']], allow_pickle)
+    return {key: _decode_value(item, buffers, allow_pickle) for key, item in value.items()}
+
+
+# ---------------------------------------------------------------------------
+# Seções
+# ---------------------------------------------------------------------------
+
+def _section_to_spec(section: Section) -> Dict[str, Any]:
+    """Seção -> dicionário da especificação (DataFrame e máscaras ainda vivos)"""
+    data: Dict[str, Any] = {'title': section.title}
+    for name in ('content', 'custom_html', 'table_html'):
+        if getattr(section, name) is not None:
+            data[name] = getattr(section, name)
+    for name in ('page_break_before', 'page_break_after'):
+        if getattr(section, name):
+            data[name] = True
+
+    if section.data_table is not None:
+        # Provedores e fontes em arquivo são resolvidos aqui: a especificação carrega os dados em si
+        df = resolve_table(section.data_table)
+        table: Dict[str, Any] = {'data': df}
+        if section.table_formats:
+            table['formats'] = {
+                str(col): _format_to_dict(spec) for col, spec in section.table_formats.items()
+            }
+        if section.table_locale:
+            table['locale'] = section.table_locale
+        if section.table_highlights:
+            table['highlights'] = []
+            for rule in section.table_highlights:
+                # Expressões seguem como texto; máscaras e funções viram máscara booleana
+                condition = rule.condition
+                if not isinstance(condition, str):
+                    condition = evaluate_condition(df, condition)
+                highlight = {'condition': condition, 'css_class': rule.css_class}
+                if rule.columns is not None:
+                    highlight['columns'] = list(rule.columns)
+                table['highlights'].append(highlight)
+        data['table'] = table
+
+    if section.chart is not None:
+        data['chart'] = {key: value for key, value in resolve_chart(section.chart).items() if value is not None}
+    if section.chart_png is not None:
+        data['chart_png'] = section.chart_png
+    if section.subsections:
+        data['subsections'] = [_section_to_spec(sub) for sub in section.subsections]
+    return data
+
+
+def _section_from_spec(data: Dict[str, Any]) -> Section:
+    from .report_framework import Section
+
+    section = Section(
+        title=data['title'],
+        content=data.get('content'),
+        custom_html=data.get('custom_html'),
+        table_html=data.get('table_html'),
+        page_break_before=bool(data.get('page_break_before', False)),
+        page_break_after=bool(data.get('page_break_after', False)),
+        subsections=[_section_from_spec(sub) for sub in data.get('subsections', [])]
+    )
+
+    table = data.get('table')
+    if table is not None:
+        df = table['data'] if 'data' in table else _table_from_dict(table)
+        section.data_table = df
+        if table.get('formats'):
+            # Chaves JSON são texto: volta para o nome real da coluna (ex.: inteiros)
+            names = {str(col): col for col in df.columns}
+            section.table_formats = {
+                names.get(col, col): _format_from_dict(spec) for col, spec in table['formats'].items()
+            }
+        section.table_locale = table.get('locale')
+        if table.get('highlights'):
+            section.table_highlights = _highlight_from_dict(table['highlights'])
+
+    png = data.get('chart_png')
+    if png is not None:
+        # Em JSON o PNG pré-renderizado viaja em base64
+        section.chart_png = base64.b64decode(png['base64']) if isinstance(png, dict) else png
+
+    chart = data.get('chart')
+    if chart is not None:
+        section.chart = {
+            'type': chart['type'],
+            'data': chart['data'],
+            'labels': chart.get('labels'),
+            'colors': chart.get('colors')
+        }
+    return section
+
+
+def _section_to_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    data = dict(data)
+    if 'table' in data:
+        table = dict(data['table'])
+        table.update(_table_to_dict(table.pop('data')))
+        data['table'] = _plain(table)
+    if 'chart' in data:
+        data['chart'] = _plain(data['chart'])
+    if 'chart_png' in data:
+        data['chart_png'] = {'base64': base64.b64encode(data['chart_png']).decode('ascii')}
+    if 'subsections' in data:
+        data['subsections'] = [_section_to_json(sub) for sub in data['subsections']]
+    return data
+
+
+# ---------------------------------------------------------------------------
+# ReportSpec
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ReportSpec:
+    """Especificação versionada e serializável de um relatório
+
+    `config` e `sections` são dicionários no formato JSON, exceto que tabelas
+    (section['table']['data']) são DataFrames e máscaras de destaque são arrays.
+    Funções de destaque são avaliadas em from_builder e viajam como máscaras.
+    """
+    config: Dict[str, Any]
+    sections: List[Dict[str, Any]] = field(default_factory=list)
+    version: int = SPEC_VERSION
+
+    @classmethod
+    def from_builder(cls, builder: ReportBuilder) -> 'ReportSpec':
+        from .report_framework import ReportTheme
+
+        config = builder.config
+        config_data: Dict[str, Any] = {name: getattr(config, name) for name in _CONFIG_FIELDS}
+        theme = config.theme
+        config_data['theme'] = theme.value if isinstance(theme, ReportTheme) else theme
+        config_data['date'] = config.date.isoformat()
+
+        with prefetch(builder.sections):
+            sections = [_section_to_spec(section) for section in builder.sections]
+        return cls(
+            config={key: value for key, value in config_data.items() if value is not None},
+            sections=sections
+        )
+
+    def to_builder(self) -> ReportBuilder:
+        """ReportBuilder pronto para generate(); ValueError se a especificação for inválida"""
+        from .report_framework import ReportBuilder, ReportConfig, ReportTheme
+
+        if self.version != SPEC_VERSION:
+            raise ValueError(f"Versão de especificação não suportada: {self.version!r}")
+
+        try:
+            config_data = dict(self.config)
+            theme = config_data.pop('theme', ReportTheme.CORPORATE.value)
+            date: Optional[str] = config_data.pop('date', None)
+            unknown = set(config_data) - set(_CONFIG_FIELDS)
+            if unknown:
+                raise ValueError(f"Campos de configuração desconhecidos: {', '.join(sorted(unknown))}")
+
+            config = ReportConfig(**config_data)
+            config.theme = ReportTheme(theme) if theme in ReportTheme._value2member_map_ else theme
+            if date is not None:
+                config.date = datetime.fromisoformat(date)
+
+            builder = ReportBuilder(config)
+            builder.sections = [_section_from_spec(section) for section in self.sections]
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Especificação de relatório inválida: {exc}") from exc
+        return builder
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dicionário serializável em JSON (tabelas como columns/dtypes/rows)"""
+        return {
+            'version': self.version,
+            'config': dict(self.config),
+            'sections': [_section_to_json(section) for section in self.sections]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ReportSpec':
+        if not isinstance(data, dict) or 'config' not in data:
+            raise ValueError("Especificação de relatório inválida: falta 'config'")
+        return cls(
+            config=data['config'],
+            sections=list(data.get('sections', [])),
+            version=data.get('version', SPEC_VERSION)
+        )
+
+    def _encode(self) -> List[Union[bytes, memoryview]]:
+        """Partes da codificação binária, na ordem (sem concatenar)"""
+        buffers = _Buffers()
+        header = {
+            'config': self.config,
+            'sections': _encode_value(self.sections, buffers),
+            'buffers': buffers.layout
+        }
+        header_bytes = json.dumps(header, separators=(',', ':')).encode()
+        header_bytes += b' ' * (-(len(header_bytes) + _PREFIX.size) % _ALIGN)
+        return [
+            _PREFIX.pack(SPEC_MAGIC, self.version, len(header_bytes)),
+            header_bytes,
+            *buffers.chunks
+        ]
+
+    def to_bytes(self) -> bytes:
+        """Codificação binária colunar: prefixo + cabeçalho JSON + buffers alinhados"""
+        return b''.join(self._encode())
+
+    def write_into(self, allocate: Callable[[int], memoryview]) -> int:
+        """Escreve a codificação binária direto em um buffer externo, sem cópia intermediária
+
+        `allocate(tamanho)` deve devolver um buffer gravável com ao menos esse
+        tamanho (ex.: memória compartilhada). Retorna o número de bytes escritos.
+        """
+        parts = self._encode()
+        size = sum(memoryview(part).nbytes for part in parts)
+        target = memoryview(allocate(size)).cast('B')
+        offset = 0
+        for part in parts:
+            part = memoryview(part).cast('B')
+            target[offset:offset + part.nbytes] = part
+            offset += part.nbytes
+        target.release()
+        return size
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: Union[bytes, bytearray, memoryview],
+        copy: bool = False,
+        allow_pickle: bool = True
+    ) -> 'ReportSpec':
+        """Decodifica to_bytes()
+
+        Colunas numéricas são views sobre `data` (somente leitura para bytes);
+        `copy=True` copia o buffer uma vez e devolve DataFrames graváveis.
+        Colunas de objetos mistos, MultiIndex e nomes não-JSON vão em pickle:
+        para dados de origem não confiável use `allow_pickle=False`, que levanta
+        ValueError em vez de executar pickle.loads.
+        """
+        view = memoryview(bytearray(data) if copy else data).cast('B')
+        if view.nbytes < _PREFIX.size:
+            raise ValueError("Especificação binária truncada")
+        magic, version, header_size = _PREFIX.unpack_from(view)
+        if magic != SPEC_MAGIC:
+            raise ValueError("Dados não são uma especificação de relatório")
+        if version != SPEC_VERSION:
+            raise ValueError(f"Versão de especificação não suportada: {version!r}")
+
+        body = _PREFIX.size + header_size
+        header = json.loads(bytes(view[_PREFIX.size:body]))
+        buffers = [view[body + offset:body + offset + nbytes] for offset, nbytes in header['buffers']]
+        return cls(
+            config=header['config'],
+            sections=_decode_value(header['sections'], buffers, allow_pickle),
+            version=version
+        )
+
+
+def builder_to_dict(builder: ReportBuilder) -> Dict[str, Any]:
+    """ReportBuilder -> especificação JSON ({'version', 'config', 'sections'})"""
+    return ReportSpec.from_builder(builder).to_dict()
+
+
+def builder_from_dict(data: Dict[str, Any]) -> ReportBuilder:
+    """Especificação JSON -> ReportBuilder pronto para generate()
+
+    Levanta ValueError para especificações inválidas ou de versão desconhecida.
+    """
+    return ReportSpec.from_dict(data).to_builder()
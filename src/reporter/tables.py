@@ -0,0 +1,246 @@
+"""
+Renderização vetorizada de tabelas
+Formata cada coluna uma única vez (pelo dtype) e monta as linhas com um único join
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .formatting import ColumnFormat, FormatSpec, Locale, format_column, infer_format, resolve_formats
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+Condition = Union[str, 'pd.Series', 'np.ndarray', Sequence[bool], Callable[['pd.DataFrame'], Any]]
+
+_QUOTED_NAME = re.compile(r"""(['"])(.*?)\1""")
+
+
+@dataclass
+class HighlightRule:
+    """Destaque condicional avaliado uma única vez sobre a tabela inteira
+
+    `condition` pode ser uma expressão ("'% Meta' < 100"), uma máscara booleana
+    ou uma função que recebe o DataFrame e retorna a máscara. Sem `columns`,
+    a classe CSS vai para a linha; com `columns`, apenas para essas células.
+    """
+    condition: Condition
+    css_class: str = 'row-highlight'
+    columns: Optional[List[str]] = None
+
+
+HighlightSpec = Union[Condition, HighlightRule, List[HighlightRule], Dict[str, Condition]]
+
+
+def to_highlight_rules(spec: Optional[HighlightSpec]) -> List[HighlightRule]:
+    """Normaliza o argumento highlight_rows de add_table para uma lista de regras"""
+    if spec is None:
+        return []
+    if isinstance(spec, HighlightRule):
+        return [spec]
+    if isinstance(spec, dict):
+        return [HighlightRule(condition, css_class) for css_class, condition in spec.items()]
+    if isinstance(spec, list) and all(isinstance(r, HighlightRule) for r in spec):
+        return list(spec)
+    return [HighlightRule(spec)]
+
+
+def to_frame(data: Union[pd.DataFrame, List[Dict[str, Any]], Dict[str, Any]]) -> pd.DataFrame:
+    """Dados de tabela (DataFrame, lista de registros ou um único registro) como DataFrame"""
+    import pandas as pd
+
+    if isinstance(data, dict):
+        return pd.DataFrame([data])
+    if isinstance(data, list):
+        return pd.DataFrame(data)
+    return data
+
+
+def _quote_columns(expr: str, columns: Sequence[Any]) -> str:
+    """Converte nomes de coluna entre aspas ('% Meta') para a sintaxe de crase do pandas"""
+    names = {str(col) for col in columns}
+    return _QUOTED_NAME.sub(
+        lambda m: f'`{m.group(2)}`' if m.group(2) in names else m.group(0),
+        expr
+    )
+
+
+def evaluate_condition(df: pd.DataFrame, condition: Condition) -> np.ndarray:
+    """Avalia uma condição sobre o DataFrame inteiro, retornando máscara booleana"""
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(condition, str):
+        result = df.eval(_quote_columns(condition, df.columns))
+    elif callable(condition):
+        result = condition(df)
+    else:
+        result = condition
+
+    if isinstance(result, pd.Series):
+        mask = result.to_numpy(dtype=bool, na_value=False)
+    else:
+        mask = np.asarray(result, dtype=bool)
+
+    if mask.shape != (len(df),):
+        raise ValueError(
+            f"Condição de destaque deve gerar uma máscara com {len(df)} linhas, "
+            f"obteve formato {mask.shape}"
+        )
+    return mask
+
+
+def _merge_classes(current: np.ndarray, mask: np.ndarray, css_class: str) -> np.ndarray:
+    """Acrescenta `css_class` nas posições da máscara"""
+    import numpy as np
+
+    added = np.where(current == '', css_class, current + ' ' + css_class)
+    return np.where(mask, added, current)
+
+
+def _open_tags(tag: str, classes: np.ndarray) -> np.ndarray:
+    """Tags de abertura, com atributo class apenas onde houver classes"""
+    import numpy as np
+
+    return np.where(classes == '', f'<{tag}>', f'<{tag} class="' + classes + '">')
+
+
+def evaluate_highlights(
+    df: pd.DataFrame,
+    rules: List[HighlightRule]
+) -> Tuple[Optional[np.ndarray], Dict[int, np.ndarray]]:
+    """Classes CSS por linha (ou None) e por célula ({índice da coluna: classes})"""
+    import numpy as np
+
+    empty = np.full(len(df), '', dtype=object)
+    row_classes = None
+    cell_classes: Dict[int, np.ndarray] = {}
+
+    for rule in rules:
+        mask = evaluate_condition(df, rule.condition)
+        if rule.columns is None:
+            row_classes = _merge_classes(
+                empty if row_classes is None else row_classes, mask, rule.css_class
+            )
+            continue
+        for col in rule.columns:
+            j = df.columns.get_loc(col)
+            cell_classes[j] = _merge_classes(cell_classes.get(j, empty), mask, rule.css_class)
+
+    return row_classes, cell_classes
+
+
+def _table_body(
+    df: pd.DataFrame,
+    column_formats: List[ColumnFormat],
+    locale: Union[str, Locale, None],
+    highlights: Optional[List[HighlightRule]]
+) -> str:
+    """Linhas <tr> do DataFrame com formatações já resolvidas"""
+    import numpy as np
+
+    row_classes, cell_classes = evaluate_highlights(df, highlights) if highlights else (None, {})
+
+    if not df.shape[1]:
+        opens = ['<tr>'] * len(df) if row_classes is None else _open_tags('tr', row_classes)
+        return ''.join(f'{tag}</tr>' for tag in opens)
+
+    columns = [
+        format_column(df.iloc[:, i], fmt, locale)
+        for i, fmt in enumerate(column_formats)
+    ]
+
+    if row_classes is None and not cell_classes:
+        return ''.join(
+            '<tr><td>' + '</td><td>'.join(cells) + '</td></tr>'
+            for cells in zip(*columns)
+        )
+
+    # Com destaques: cada célula já sai com sua tag (e classe) pronta
+    cells = [
+        (
+            _open_tags('td', cell_classes[j]) if j in cell_classes else '<td>'
+        ) + np.asarray(strings, dtype=object) + '</td>'
+        for j, strings in enumerate(columns)
+    ]
+    opens = ['<tr>'] * len(df) if row_classes is None else _open_tags('tr', row_classes)
+    return ''.join(
+        tag + ''.join(row) + '</tr>'
+        for tag, *row in zip(opens, *cells)
+    )
+
+
+def _wrap_table(columns: Sequence[Any], body: str) -> str:
+    header = ''.join(f'<th>{col}</th>' for col in columns)
+    return (
+        '<div class="data-table-wrapper">'
+        '<table class="data-table">'
+        f'<thead><tr>{header}</tr></thead>'
+        f'<tbody>{body}</tbody>'
+        '</table></div>'
+    )
+
+
+def render_table(
+    df: pd.DataFrame,
+    formats: Optional[Mapping[str, FormatSpec]] = None,
+    locale: Union[str, Locale, None] = None,
+    highlights: Optional[List[HighlightRule]] = None
+) -> str:
+    """Renderiza DataFrame como HTML formatado, coluna a coluna"""
+    column_formats = resolve_formats(df, formats) if df.shape[1] else []
+    return _wrap_table(df.columns, _table_body(df, column_formats, locale, highlights))
+
+
+def _chunk_rules(rules: List[HighlightRule], start: int, stop: int) -> List[HighlightRule]:
+    """Regras para as linhas [start, stop): máscaras são fatiadas, expressões e funções valem por bloco"""
+    import numpy as np
+
+    return [
+        rule if isinstance(rule.condition, str) or callable(rule.condition)
+        else HighlightRule(np.asarray(rule.condition, dtype=bool)[start:stop], rule.css_class, rule.columns)
+        for rule in rules
+    ]
+
+
+def render_table_chunks(
+    chunks: Iterable[pd.DataFrame],
+    formats: Optional[Mapping[str, FormatSpec]] = None,
+    locale: Union[str, Locale, None] = None,
+    highlights: Optional[List[HighlightRule]] = None
+) -> str:
+    """Renderiza como HTML uma tabela recebida em blocos (ex.: read_sql_query com chunksize)
+
+    Cada bloco vira HTML e é descartado, então a memória fica limitada ao
+    bloco atual mais a marcação. As formatações inferidas pelo dtype vêm do
+    primeiro bloco em que a coluna tem algum valor (até lá ela só tem nulos);
+    expressões e funções de destaque são avaliadas por bloco.
+    """
+    columns: Optional[Sequence[Any]] = None
+    column_formats: List[ColumnFormat] = []
+    # Colunas inferidas que até agora só trouxeram nulos (dtype ainda desconhecido)
+    undecided: List[int] = []
+    parts: List[str] = []
+    rows = 0
+
+    for chunk in chunks:
+        if columns is None:
+            columns = list(chunk.columns)
+            column_formats = resolve_formats(chunk, formats) if chunk.shape[1] else []
+            explicit = set(formats or {})
+            undecided = [i for i, col in enumerate(columns) if col not in explicit]
+        if undecided:
+            present = chunk.iloc[:, undecided].notna().any().to_numpy()
+            for i in [i for i, found in zip(undecided, present) if found]:
+                column_formats[i] = infer_format(chunk.iloc[:, i])
+            undecided = [i for i, found in zip(undecided, present) if not found]
+        rules = _chunk_rules(highlights, rows, rows + len(chunk)) if highlights else None
+        parts.append(_table_body(chunk, column_formats, locale, rules))
+        rows += len(chunk)
+
+    return _wrap_table(columns or [], ''.join(parts))
@@ -0,0 +1,178 @@
+"""
+Templates Jinja2 compilados uma única vez por processo
+Um Environment compartilhado guarda os templates registrados por nome; com o
+bytecode cache em disco habilitado, novos processos também pulam a compilação
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, FileSystemBytecodeCache, Template
+
+
+BASE_TEMPLATE = 'base'
+
+# Diretório do bytecode cache herdado por processos filhos (workers)
+TEMPLATE_CACHE_DIR_ENV = 'REPORTER_TEMPLATE_CACHE_DIR'
+
+_sources: Dict[str, str] = {}
+_variables: Dict[str, FrozenSet[str]] = {}
+_environment: Optional[Environment] = None
+
+
+def get_environment() -> Environment:
+    """Environment Jinja2 compartilhado (criado na primeira chamada)"""
+    global _environment
+    if _environment is None:
+        from jinja2 import DictLoader, Environment
+
+        cache_dir = os.environ.get(TEMPLATE_CACHE_DIR_ENV)
+        _environment = Environment(
+            loader=DictLoader(_sources),
+            bytecode_cache=_make_bytecode_cache(cache_dir) if cache_dir else None,
+            cache_size=-1
+        )
+    return _environment
+
+
+def _make_bytecode_cache(directory: str) -> FileSystemBytecodeCache:
+    from jinja2 import FileSystemBytecodeCache
+
+    os.makedirs(directory, exist_ok=True)
+    return FileSystemBytecodeCache(directory)
+
+
+def enable_bytecode_cache(directory: str) -> None:
+    """Persiste o bytecode dos templates em disco
+
+    O diretório também é exportado via variável de ambiente, para que workers
+    iniciados depois carreguem os templates já compilados.
+    """
+    directory = os.fspath(directory)
+    os.environ[TEMPLATE_CACHE_DIR_ENV] = directory
+    get_environment().bytecode_cache = _make_bytecode_cache(directory)
+
+
+def register_template(name: str, source: str) -> None:
+    """Registra (ou substitui) um template pelo nome"""
+    _sources[name] = source
+    _variables.pop(name, None)
+
+
+def get_template(name: str = BASE_TEMPLATE) -> Template:
+    """Template compilado; a compilação acontece só no primeiro uso de cada fonte"""
+    if name not in _sources:
+        raise KeyError(
+            f"Template não registrado: {name!r} (disponíveis: {', '.join(sorted(_sources))})"
+        )
+    return get_environment().get_template(name)
+
+
+def template_source(name: str = BASE_TEMPLATE) -> str:
+    """Fonte registrada do template"""
+    if name not in _sources:
+        raise KeyError(
+            f"Template não registrado: {name!r} (disponíveis: {', '.join(sorted(_sources))})"
+        )
+    return _sources[name]
+
+
+def template_variables(name: str = BASE_TEMPLATE) -> FrozenSet[str]:
+    """Variáveis de contexto que o template usa (analisadas uma vez por fonte)"""
+    variables = _variables.get(name)
+    if variables is None:
+        from jinja2 import meta
+
+        source = template_source(name)
+        variables = frozenset(meta.find_undeclared_variables(get_environment().parse(source)))
+        _variables[name] = variables
+    return variables
+
+
+TEMPLATE_STRING = '''
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <title>{{ config.title }}</title>
+    </head>
+    <body class="theme-{{ theme }}">
+        <!-- Capa -->
+        <div class="cover-page">
+            {% if logo_url %}
+            <div class="logo">
+                <img src="{{ logo_url }}" alt="Logo" />
+            </div>
+            {% endif %}
+            
+            <h1 class="report-title">{{ config.title }}</h1>
+            
+            {% if config.subtitle %}
+            <h2 class="report-subtitle">{{ config.subtitle }}</h2>
+            {% endif %}
+            
+            <div class="report-meta">
+                {% if config.author %}
+                <p><strong>Autor:</strong> {{ config.author }}</p>
+                {% endif %}
+                {% if config.company %}
+                <p><strong>Empresa:</strong> {{ config.company }}</p>
+                {% endif %}
+                <p><strong>Data:</strong> {{ date_formatted }}</p>
+            </div>
+        </div>
+        
+        <!-- Índice -->
+        {% if config.show_toc and sections|length > 3 %}
+        <div class="toc-page">
+            <h2>Índice</h2>
+            <ul class="toc">
+                {% for section in sections %}
+                <li><a href="#section-{{ loop.index }}">{{ section.title }}</a></li>
+                {% endfor %}
+            </ul>
+        </div>
+        {% endif %}
+        
+        <!-- Seções -->
+        {% for section in sections %}
+        <!--reporter:section-->
+        <div class="section {% if section.page_break_before %}page-break-before{% endif %} {% if section.page_break_after %}page-break-after{% endif %}" id="section-{{ loop.index }}">
+            <h2 class="section-title">{{ section.title }}</h2>
+            
+            {% if section.content %}
+            <div class="section-content">{{ section.content|safe }}</div>
+            {% endif %}
+            
+            {% if section.custom_html %}
+            <div class="section-custom">{{ section.custom_html|safe }}</div>
+            {% endif %}
+            
+            {% if section.table_html %}
+            {{ section.table_html|safe }}
+            {% endif %}
+            
+            {% if section.chart_html %}
+            <div class="chart-container">
+                {{ section.chart_html|safe }}
+            </div>
+            {% endif %}
+        </div>
+        {% endfor %}
+        <!--reporter:sections-end-->
+        
+        <!-- Rodapé -->
+        {% if config.footer_text %}
+        <div class="report-footer">
+            {{ config.footer_text }}
+        </div>
+        {% endif %}
+    </body>
+    </html>
+'''
+
+
+register_template(BASE_TEMPLATE, TEMPLATE_STRING)
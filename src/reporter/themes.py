@@ -0,0 +1,354 @@
+"""
+Registro de temas compartilhado pelo processo
+Cada tema é montado sob demanda uma única vez e o CSS do WeasyPrint resultante
+é reaproveitado por todos os relatórios; custom_css é cacheado pelo hash do conteúdo
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+
+if TYPE_CHECKING:
+    from weasyprint import CSS
+
+
+# Quantos custom_css distintos (já parseados) manter em memória
+CUSTOM_CSS_CACHE_SIZE = 64
+
+_factories: Dict[str, Callable[[], str]] = {}
+_css_strings: Dict[str, str] = {}
+_stylesheets: Dict[str, CSS] = {}
+_custom_stylesheets: 'OrderedDict[str, CSS]' = OrderedDict()
+_lock = threading.Lock()
+
+
+def register_theme(name: str, css: Union[str, Callable[[], str]]) -> None:
+    """Registra (ou substitui) um tema: CSS pronto ou função que o constrói"""
+    with _lock:
+        _factories[name] = css if callable(css) else (lambda: css)
+        _css_strings.pop(name, None)
+        _stylesheets.pop(name, None)
+
+
+def available_themes() -> List[str]:
+    """Nomes dos temas registrados"""
+    return list(_factories)
+
+
+def get_theme_css(name: str) -> str:
+    """CSS do tema, construído na primeira chamada"""
+    css = _css_strings.get(name)
+    if css is None:
+        try:
+            factory = _factories[name]
+        except KeyError:
+            raise KeyError(
+                f"Tema não registrado: {name!r} (disponíveis: {', '.join(_factories)})"
+            ) from None
+        css = _css_strings.setdefault(name, factory())
+    return css
+
+
+def get_theme_stylesheet(name: str) -> CSS:
+    """Stylesheet WeasyPrint do tema, parseado uma única vez por processo"""
+    stylesheet = _stylesheets.get(name)
+    if stylesheet is None:
+        from weasyprint import CSS
+
+        stylesheet = _stylesheets.setdefault(name, CSS(string=get_theme_css(name)))
+    return stylesheet
+
+
+def get_custom_stylesheet(css: str) -> CSS:
+    """Stylesheet de um custom_css, cacheado (LRU) pelo hash do conteúdo
+
+    @import é resolvido ao parsear, sob a restrição de recursos corrente
+    (restrict_resources), que por isso também entra na chave.
+    """
+    from .assets import make_url_fetcher, resource_policy
+
+    key = hashlib.sha256(css.encode('utf-8')).hexdigest()
+    policy = resource_policy()
+    if policy is not None:
+        key += repr(policy)
+    with _lock:
+        stylesheet = _custom_stylesheets.get(key)
+        if stylesheet is not None:
+            _custom_stylesheets.move_to_end(key)
+            return stylesheet
+
+    from weasyprint import CSS
+
+    stylesheet = CSS(string=css, url_fetcher=make_url_fetcher({}))
+    with _lock:
+        _custom_stylesheets[key] = stylesheet
+        while len(_custom_stylesheets) > CUSTOM_CSS_CACHE_SIZE:
+            _custom_stylesheets.popitem(last=False)
+    return stylesheet
+
+
+def get_stylesheets(theme: str, custom_css: Optional[str] = None) -> List[CSS]:
+    """Stylesheets de um relatório: tema seguido do custom_css (que prevalece na cascata)"""
+    stylesheets = [get_theme_stylesheet(theme)]
+    if custom_css:
+        stylesheets.append(get_custom_stylesheet(custom_css))
+    return stylesheets
+
+
+CORPORATE_THEME_CSS = '''
+    @page {
+        size: A4;
+        margin: 2.5cm 2cm;
+        @bottom-right {
+            content: "Página " counter(page) " de " counter(pages);
+            font-size: 9pt;
+            color: #666;
+        }
+    }
+    
+    body {
+        font-family: 'Helvetica', 'Arial', sans-serif;
+        color: #333;
+        line-height: 1.6;
+        font-size: 11pt;
+    }
+    
+    .cover-page {
+        page-break-after: always;
+        text-align: center;
+        padding-top: 30%;
+    }
+    
+    .logo img {
+        max-width: 200px;
+        margin-bottom: 2cm;
+    }
+    
+    .report-title {
+        font-size: 32pt;
+        color: #1a4d7a;
+        margin-bottom: 0.5cm;
+        font-weight: bold;
+    }
+    
+    .report-subtitle {
+        font-size: 18pt;
+        color: #666;
+        margin-bottom: 2cm;
+        font-weight: normal;
+    }
+    
+    .report-meta {
+        font-size: 12pt;
+        color: #666;
+    }
+    
+    .toc-page {
+        page-break-after: always;
+    }
+    
+    .toc {
+        list-style: none;
+        padding: 0;
+    }
+    
+    .toc li {
+        padding: 0.5cm 0;
+        border-bottom: 1px solid #eee;
+    }
+    
+    .section-title {
+        color: #1a4d7a;
+        font-size: 18pt;
+        margin-top: 1cm;
+        margin-bottom: 0.5cm;
+        border-bottom: 2px solid #1a4d7a;
+        padding-bottom: 0.3cm;
+    }
+    
+    .section-content {
+        margin-bottom: 1cm;
+        text-align: justify;
+    }
+    
+    .data-table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 1cm 0;
+        font-size: 10pt;
+    }
+    
+    .data-table th {
+        background-color: #1a4d7a;
+        color: white;
+        padding: 0.3cm;
+        text-align: left;
+        font-weight: bold;
+    }
+    
+    .data-table td {
+        padding: 0.3cm;
+        border-bottom: 1px solid #ddd;
+    }
+    
+    .data-table tr:nth-child(even) {
+        background-color: #f9f9f9;
+    }
+    
+    .data-table tr.row-highlight td { background-color: #fff8e1; }
+    .data-table tr.row-success td { background-color: #e8f5e9; }
+    .data-table tr.row-warning td { background-color: #fff3e0; }
+    .data-table tr.row-danger td { background-color: #fdecea; }
+    
+    .data-table td.cell-success { color: #27ae60; font-weight: bold; }
+    .data-table td.cell-warning { color: #e67e22; font-weight: bold; }
+    .data-table td.cell-danger { color: #e74c3c; font-weight: bold; }
+    
+    .kpi-grid {
+        display: grid;
+        gap: 0.5cm;
+        margin: 1cm 0;
+    }
+    
+    .kpi-grid-2 { grid-template-columns: repeat(2, 1fr); }
+    .kpi-grid-3 { grid-template-columns: repeat(3, 1fr); }
+    .kpi-grid-4 { grid-template-columns: repeat(4, 1fr); }
+    
+    .kpi-card {
+        background: #f5f5f5;
+        padding: 0.5cm;
+        border-radius: 5px;
+        border-left: 4px solid #1a4d7a;
+    }
+    
+    .kpi-label {
+        font-size: 9pt;
+        color: #666;
+        margin-bottom: 0.2cm;
+    }
+    
+    .kpi-value {
+        font-size: 24pt;
+        font-weight: bold;
+        color: #1a4d7a;
+        margin-bottom: 0.2cm;
+    }
+    
+    .kpi-trend {
+        font-size: 10pt;
+    }
+    
+    .trend-up { color: #27ae60; }
+    .trend-down { color: #e74c3c; }
+    .trend-neutral { color: #666; }
+    
+    .chart-image {
+        max-width: 100%;
+        height: auto;
+        margin: 1cm 0;
+    }
+    
+    .page-break-before {
+        page-break-before: always;
+    }
+    
+    .page-break-after {
+        page-break-after: always;
+    }
+    
+    .executive-summary {
+        background: #f0f8ff;
+        padding: 0.7cm;
+        border-radius: 5px;
+        margin: 1cm 0;
+    }
+    
+    .summary-metrics {
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        gap: 0.5cm;
+        margin-bottom: 0.5cm;
+    }
+    
+    .summary-metric {
+        background: white;
+        padding: 0.3cm;
+        border-radius: 3px;
+    }
+    
+    .metric-value {
+        font-weight: bold;
+        color: #1a4d7a;
+    }
+    
+    .highlights-list {
+        margin-top: 0.3cm;
+    }
+    
+    .highlights-list li {
+        margin-bottom: 0.2cm;
+    }
+    
+    .comparison-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+        gap: 0.5cm;
+        margin: 1cm 0;
+    }
+    
+    .comparison-item {
+        background: #f9f9f9;
+        padding: 0.5cm;
+        border-radius: 5px;
+    }
+    
+    .comparison-title {
+        color: #1a4d7a;
+        font-size: 14pt;
+        margin-bottom: 0.3cm;
+    }
+    
+    .comparison-field {
+        margin-bottom: 0.2cm;
+        font-size: 10pt;
+    }
+    
+    .field-label {
+        color: #666;
+    }
+    
+    .field-value {
+        font-weight: bold;
+        color: #333;
+    }
+'''
+
+
+def _modern_theme() -> str:
+    """Tema moderno com cores vibrantes"""
+    return CORPORATE_THEME_CSS.replace('#1a4d7a', '#6366f1').replace('#f5f5f5', '#f8fafc')
+
+
+def _minimal_theme() -> str:
+    """Tema minimalista"""
+    return CORPORATE_THEME_CSS.replace('#1a4d7a', '#000000').replace('border-left: 4px solid', 'border-left: 2px solid')
+
+
+def _executive_theme() -> str:
+    """Tema executivo premium"""
+    return CORPORATE_THEME_CSS.replace('#1a4d7a', '#2c3e50')
+
+
+def _colorful_theme() -> str:
+    """Tema colorido"""
+    return CORPORATE_THEME_CSS.replace('#1a4d7a', '#e91e63')
+
+
+register_theme('corporate', CORPORATE_THEME_CSS)
+register_theme('modern', _modern_theme)
+register_theme('minimal', _minimal_theme)
+register_theme('executive', _executive_theme)
+register_theme('colorful', _colorful_theme)
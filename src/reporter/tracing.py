@@ -0,0 +1,248 @@
+"""
+Rastreamento por etapas da renderização
+Cada etapa de generate() (build_html, prepare_sections e uma sub-etapa por
+seção, template, css, layout, write_pdf) vira um Span com tempo de parede,
+tempo de CPU, bytes produzidos e, opcionalmente, pico de memória (tracemalloc)
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+@dataclass
+class Span:
+    """Uma etapa medida da renderização"""
+    name: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    bytes: int = 0
+    memory_peak: Optional[int] = None
+    children: List['Span'] = field(default_factory=list)
+    parent: Optional['Span'] = field(default=None, repr=False, compare=False)
+
+    @property
+    def path(self) -> str:
+        """Caminho completo ('generate/build_html/prepare_sections/Vendas')"""
+        return self.name if self.parent is None else f"{self.parent.path}/{self.name}"
+
+    def walk(self) -> Iterator['Span']:
+        """Este span e todos os descendentes, em pré-ordem"""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'attributes': dict(self.attributes),
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'bytes': self.bytes,
+            'memory_peak': self.memory_peak,
+            'children': [child.to_dict() for child in self.children]
+        }
+
+
+class RenderHook:
+    """Interface de hooks: sobrescreva os métodos desejados
+
+    Funções simples também são aceitas como hook e recebem cada span encerrado.
+    """
+
+    def on_span_start(self, span: Span) -> None:
+        pass
+
+    def on_span_end(self, span: Span) -> None:
+        pass
+
+
+Hook = Union[RenderHook, Callable[[Span], Any]]
+
+_global_hooks: List[Hook] = []
+
+
+def add_render_hook(hook: Hook) -> Hook:
+    """Registra um hook chamado em toda renderização do processo (inclusive generate())"""
+    _global_hooks.append(hook)
+    return hook
+
+
+def remove_render_hook(hook: Hook) -> None:
+    _global_hooks.remove(hook)
+
+
+def global_render_hooks() -> List[Hook]:
+    return list(_global_hooks)
+
+
+@dataclass
+class RenderStats:
+    """Árvore de spans de uma renderização, retornada junto com o PDF"""
+    root: Span
+
+    @property
+    def wall_time(self) -> float:
+        return self.root.wall_time
+
+    @property
+    def cpu_time(self) -> float:
+        return self.root.cpu_time
+
+    @property
+    def pdf_bytes(self) -> int:
+        stage = self.stage('write_pdf')
+        return stage.bytes if stage else 0
+
+    def stage(self, name: str) -> Optional[Span]:
+        """Etapa com esse nome (ex.: 'layout', 'write_pdf'), ignorando spans de seção"""
+        return next(
+            (span for span in self.root.walk() if span.name == name and 'section' not in span.attributes),
+            None
+        )
+
+    def sections(self) -> List[Span]:
+        """Sub-etapas por seção, na ordem do relatório"""
+        stage = self.stage('prepare_sections')
+        return [span for span in stage.children if 'section' in span.attributes] if stage else []
+
+    def slowest(self, n: int = 5) -> List[Span]:
+        """Spans folha mais lentos (onde o tempo realmente foi gasto)"""
+        leaves = [span for span in self.root.walk() if not span.children]
+        return sorted(leaves, key=lambda span: span.wall_time, reverse=True)[:n]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.root.to_dict()
+
+    def format(self) -> str:
+        """Árvore legível com tempo de parede, CPU, bytes e pico de memória"""
+        lines = [f"{'etapa':<48} {'parede (ms)':>12} {'CPU (ms)':>10} {'bytes':>12} {'pico mem':>10}"]
+
+        def add(span: Span, depth: int) -> None:
+            peak = f"{span.memory_peak / 1024:,.0f}K" if span.memory_peak is not None else '-'
+            label = ('  ' * depth + span.name)[:48]
+            lines.append(
+                f"{label:<48} {span.wall_time * 1000:>12.1f} {span.cpu_time * 1000:>10.1f} "
+                f"{span.bytes:>12,} {peak:>10}"
+            )
+            for child in span.children:
+                add(child, depth + 1)
+
+        add(self.root, 0)
+        return '\n'.join(lines)
+
+
+class Tracer:
+    """Abre spans aninhados e notifica os hooks
+
+    Com `trace_memory=True` o tracemalloc é ligado durante a renderização
+    (tem custo alto; use só ao investigar memória).
+    """
+
+    enabled = True
+
+    def __init__(self, hooks: Iterable[Hook] = (), trace_memory: bool = False):
+        self.hooks = list(hooks)
+        self.trace_memory = trace_memory
+        self.root: Optional[Span] = None
+        self._stack: List[Tuple[Span, float, float, int]] = []
+        self._peaks: Dict[int, int] = {}
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        parent = self._stack[-1][0] if self._stack else None
+        span = Span(name, attributes=attributes, parent=parent)
+        if parent is None:
+            self.root = span
+        else:
+            parent.children.append(span)
+
+        self._start(span)
+        try:
+            yield span
+        finally:
+            self._end(span)
+
+    def _start(self, span: Span) -> None:
+        for hook in self.hooks:
+            if isinstance(hook, RenderHook):
+                hook.on_span_start(span)
+
+        memory_start = 0
+        if self.trace_memory:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            # O pico do tracemalloc é global: guarda o do pai antes de zerá-lo
+            if self._stack:
+                parent = self._stack[-1][0]
+                self._peaks[id(parent)] = max(self._peaks.get(id(parent), 0), peak)
+            tracemalloc.reset_peak()
+            memory_start = current
+        self._stack.append((span, time.perf_counter(), time.process_time(), memory_start))
+
+    def _end(self, span: Span) -> None:
+        _, wall_start, cpu_start, memory_start = self._stack.pop()
+        span.wall_time = time.perf_counter() - wall_start
+        span.cpu_time = time.process_time() - cpu_start
+
+        if self.trace_memory:
+            import tracemalloc
+
+            peak = max(self._peaks.pop(id(span), 0), tracemalloc.get_traced_memory()[1])
+            span.memory_peak = peak - memory_start
+            if self._stack:
+                parent = self._stack[-1][0]
+                self._peaks[id(parent)] = max(self._peaks.get(id(parent), 0), peak)
+
+        for hook in self.hooks:
+            if isinstance(hook, RenderHook):
+                hook.on_span_end(span)
+            else:
+                hook(span)
+
+    @contextmanager
+    def run(self, name: str = 'generate', **attributes: Any) -> Iterator[Span]:
+        """Span raiz; liga/desliga o tracemalloc quando `trace_memory`"""
+        started_tracemalloc = False
+        if self.trace_memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracemalloc = True
+        try:
+            with self.span(name, **attributes) as span:
+                yield span
+        finally:
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+    def stats(self) -> RenderStats:
+        return RenderStats(self.root)
+
+
+class _NullTracer(Tracer):
+    """Tracer sem custo, usado por generate() quando não há hooks globais"""
+
+    enabled = False
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        # Span novo e solto a cada chamada: renderizações em threads escrevem nele sem disputa
+        yield Span(name)
+
+    def run(self, name: str = 'generate', **attributes: Any) -> ContextManager[Span]:
+        return self.span(name, **attributes)
+
+
+NULL_TRACER = _NullTracer()
+
+
+def default_tracer() -> Tracer:
+    """Tracer para uma renderização sem stats explícitas: nulo, salvo hooks globais"""
+    if _global_hooks:
+        return Tracer(_global_hooks)
+    return NULL_TRACER
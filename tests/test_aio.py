@@ -0,0 +1,51 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+
+from src.reporter import aio
+from src.reporter.aio import AsyncRenderer
+from src.reporter.report_framework import create_report
+
+
+class ImmediateExecutor(Executor):
+    """Devolve um PDF fixo sem renderizar, registrando os jobs recebidos"""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.jobs.append(args)
+        future = Future()
+        future.set_result((b'%PDF-fake', None, None))
+        return future
+
+
+def test_renderer_serves_several_event_loops():
+    renderer = AsyncRenderer(max_concurrency=1, executor=ImmediateExecutor())
+    reports = [create_report(f"Relatório {i}") for i in range(3)]
+
+    for _ in range(2):
+        assert asyncio.run(renderer.render_many(reports)) == [b'%PDF-fake'] * 3
+    assert renderer.pending == 0
+
+
+def test_pack_builder_runs_off_the_event_loop(monkeypatch):
+    threads = []
+    pack_builder = aio.pack_builder
+
+    def recording_pack(builder):
+        threads.append(threading.current_thread())
+        return pack_builder(builder)
+
+    monkeypatch.setattr(aio, 'pack_builder', recording_pack)
+    executor = ImmediateExecutor()
+    renderer = AsyncRenderer(executor=executor)
+
+    async def main():
+        await renderer.render(create_report("Mensal"))
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(main())
+    assert threads and threads[0] is not loop_thread
+    assert len(executor.jobs) == 1
+
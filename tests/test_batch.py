@@ -0,0 +1,70 @@
+import os
+from concurrent.futures import Future
+
+import pandas as pd
+
+from src.reporter.batch import BatchRun, get_render_pool, pack_builder, shutdown_render_pool, unpack_builder
+from src.reporter.report_framework import create_report
+from src.reporter.spec import ReportSpec
+
+
+class FakePool:
+    """Pool que 'renderiza' na hora; falha ao enviar relatórios sem título"""
+
+    def submit(self, builder, output_path=None, return_bytes=True, transport='pipe'):
+        payload = pack_builder(builder)
+        if not unpack_builder(payload).config.title:
+            raise ValueError("relatório sem título")
+        future = Future()
+        future.set_result((b'%PDF-fake', 9, 0.01))
+        return future
+
+
+def _report(title):
+    report = create_report(title)
+    report.add_table("Vendas", pd.DataFrame({'valor': [1, 2]}))
+    return report
+
+
+def test_submit_error_fails_only_that_item():
+    run = BatchRun([_report("A"), _report(""), _report("C")], FakePool(), return_bytes=None, max_pending=2)
+
+    results = sorted(run, key=lambda result: result.index)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert 'relatório sem título' in results[1].traceback
+    assert (run.stats.submitted, run.stats.completed, run.stats.failed) == (3, 2, 1)
+
+
+def test_report_spec_items():
+    spec = ReportSpec.from_builder(_report("Spec"))
+
+    assert pack_builder(spec) == spec.to_bytes()
+    assert unpack_builder(spec).config.title == "Spec"
+
+    results = list(BatchRun([(spec, None)], FakePool(), return_bytes=None, max_pending=1))
+    assert results[0].ok
+
+
+def test_pools_by_size_stay_alive():
+    try:
+        first = get_render_pool(2)
+        executor = first.executor
+        assert get_render_pool(3) is not first
+        assert get_render_pool(2) is first
+        # Pedir outro tamanho não encerra o executor que já estava em uso
+        executor.submit(pow, 2, 3)
+    finally:
+        shutdown_render_pool()
+
+
+def test_broken_pool_is_replaced():
+    try:
+        pool = get_render_pool(1)
+        pool.executor.submit(os._exit, 1).exception(timeout=60)
+        assert pool.broken
+        assert get_render_pool(1) is not pool
+        assert not get_render_pool(1).broken
+    finally:
+        shutdown_render_pool()
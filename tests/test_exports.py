@@ -0,0 +1,16 @@
+from src.reporter import report_framework
+
+
+def test_star_import_includes_lazy_exports():
+    namespace = {}
+    exec('from src.reporter.report_framework import *', namespace)
+
+    for name in ('report_cache_stats', 'configure_report_cache', 'ReportCache', 'generate_many', 'ReportSpec', 'AsyncRenderer'):
+        assert name in namespace
+    assert namespace['report_cache_stats'] is report_framework.report_cache_stats
+    assert namespace['create_report'] is report_framework.create_report
+
+
+def test_all_names_resolve():
+    for name in report_framework.__all__:
+        assert getattr(report_framework, name) is not None
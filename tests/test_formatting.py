@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.reporter.formatting import ColumnFormat, FormatType, format_column, infer_format, resolve_formats
+from src.reporter.report_framework import Section
+
+
+def test_currency_uses_locale_symbol():
+    values = pd.Series([1234.5, -10.0])
+    assert format_column(values, ColumnFormat.currency(), 'en-US') == ['$1,234.50', '-$10.00']
+    assert format_column(values, ColumnFormat.currency(), 'pt-BR') == ['R$ 1.234,50', '-R$ 10,00']
+    assert format_column(values, ColumnFormat.currency(decimals=0, symbol='€ '), 'pt-BR') == ['€ 1.234', '-€ 10']
+
+
+def test_percent_and_scale():
+    assert format_column(pd.Series([15.5, 3.0]), ColumnFormat.percent()) == ['15.5%', '3.0%']
+    assert format_column(pd.Series([0.155, 0.03]), ColumnFormat.percent(scale=100), 'pt-BR') == ['15,5%', '3,0%']
+
+
+def test_locale_translates_separators():
+    values = pd.Series([1234567.891, 0.5])
+    assert format_column(values, ColumnFormat.number(), 'en-US') == ['1,234,567.89', '0.50']
+    assert format_column(values, ColumnFormat.number(), 'pt-BR') == ['1.234.567,89', '0,50']
+    assert format_column(pd.Series([1234567]), ColumnFormat.integer(thousands=False), 'pt-BR') == ['1234567']
+    with pytest.raises(ValueError, match='Locale desconhecido'):
+        format_column(values, ColumnFormat.number(), 'xx-XX')
+
+
+def test_dates():
+    values = pd.Series([datetime(2025, 1, 31), datetime(2025, 2, 1, 14, 30)])
+    assert format_column(values[:1], infer_format(values), 'pt-BR') == ['31/01/2025']
+    # Algum horário na coluna: todas as datas mostram hora
+    assert format_column(values, ColumnFormat.date(), 'en-US') == ['01/31/2025 00:00', '02/01/2025 14:30']
+    assert format_column(values, ColumnFormat.date('%Y-%m'), 'pt-BR') == ['2025-01', '2025-02']
+
+
+def test_na_rep():
+    assert format_column(pd.Series([1.5, np.nan]), ColumnFormat.number(na_rep='-')) == ['1.50', '-']
+    assert format_column(pd.Series(['a', None]), ColumnFormat.text(na_rep='n/d')) == ['a', 'n/d']
+    assert format_column(pd.Series([pd.NaT, datetime(2025, 1, 1)]), ColumnFormat.date(na_rep='?')) == ['?', '01/01/2025']
+    # Texto que não vira número conta como ausente em colunas numéricas
+    assert format_column(pd.Series(['x', 2]), ColumnFormat.currency(na_rep='—')) == ['—', '$2.00']
+
+
+def test_inferred_formats():
+    df = pd.DataFrame({
+        'inteiro': [1, 2],
+        'real': [1.0, 2.5],
+        'flag': [True, False],
+        'texto': ['a', 'b'],
+        'objetos': pd.Series([3, 4], dtype=object)
+    })
+    types = [fmt.type for fmt in resolve_formats(df, {'real': 'currency'})]
+    assert types == [FormatType.INTEGER, FormatType.CURRENCY, FormatType.TEXT, FormatType.TEXT, FormatType.INTEGER]
+    with pytest.raises(KeyError):
+        resolve_formats(df, {'inexistente': 'number'})
+
+
+def test_mixed_object_columns_format_each_value():
+    # Como na tabela original: inteiros sem casas, reais com duas, o resto como texto
+    mixed = pd.Series([1, 2.5, None], dtype=object)
+    assert infer_format(mixed).type is FormatType.AUTO
+    assert format_column(mixed, infer_format(mixed)) == ['1', '2.50', '']
+    assert format_column(pd.Series([2.5, 'abc', 1000]), ColumnFormat.auto(), 'pt-BR') == ['2,50', 'abc', '1.000']
+
+
+def test_section_positional_fields():
+    df = pd.DataFrame({'a': [1]})
+    section = Section("Título", "texto", [], df, {'type': 'bar'}, '<p/>', True, False)
+    assert section.chart == {'type': 'bar'}
+    assert section.custom_html == '<p/>'
+    assert section.page_break_before and not section.page_break_after
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from src.reporter.fragments import configure_fragment_cache, fragment_cache_stats
+from src.reporter.report_framework import create_report
+
+
+def test_object_cells_render_uncached():
+    configure_fragment_cache()
+    df = pd.DataFrame({
+        'pedido': [1, 2],
+        'itens': [['a', 'b'], ['c']],
+        'extra': [{'cor': 'azul'}, {}],
+    })
+    report = create_report("Objetos")
+    report.add_table("Pedidos", df)
+
+    html = report.generate(format='html').decode('utf-8')
+
+    assert "<td>['a', 'b']</td>" in html
+    assert "<td>{'cor': 'azul'}</td>" in html
+    assert fragment_cache_stats().entries == 0
+
+
+def test_table_fragment_reused():
+    configure_fragment_cache()
+    report = create_report("Vendas")
+    report.add_table("Vendas", pd.DataFrame({'valor': [1.5, 2.25]}))
+
+    first = report.generate(format='html')
+    assert report.generate(format='html') == first
+    stats = fragment_cache_stats()
+    assert stats.entries == 1
+    assert stats.hits == 1
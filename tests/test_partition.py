@@ -0,0 +1,54 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from src.reporter.batch import get_render_pool, shutdown_render_pool
+from src.reporter.partition import (
+    _numbering,
+    get_partition_pool,
+    render_partitioned,
+    shutdown_partition_pools,
+    split_document
+)
+from src.reporter.report_framework import create_report
+
+
+def _report(sections=6):
+    report = create_report("Anual")
+    for i in range(sections):
+        report.add_table(f"Região {i}", pd.DataFrame({'valor': range(i + 1)}), page_break_before=True)
+    return report
+
+
+def test_numbering_from_page_counts():
+    assert _numbering([3, 2, 4]) == [(1, 9), (4, 9), (6, 9)]
+
+
+def test_partition_pool_is_separate():
+    try:
+        shared = get_render_pool(2)
+        pool = get_partition_pool(2)
+        assert pool is not shared
+        assert get_partition_pool(3) is not pool
+        # Partições com outro número de workers não mexem no pool de lotes
+        assert get_render_pool(2) is shared
+    finally:
+        shutdown_partition_pools()
+        shutdown_render_pool()
+
+
+def test_split_document_on_page_breaks():
+    report = _report()
+    partitions = split_document(report._build_html(), report.sections, 3)
+
+    assert [partition.sections for partition in partitions] == [[0, 1, 2], [3, 4], [5]]
+    assert 'cover-page' in partitions[0].html
+    assert 'cover-page' not in partitions[1].html
+    assert 'section-4' in partitions[1].anchors
+
+
+def test_falls_back_without_pypdf(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pypdf', None)
+    with pytest.warns(UserWarning, match='pypdf'):
+        assert render_partitioned(_report(), workers=2) is None
@@ -0,0 +1,48 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from src.reporter.providers import materialize
+from src.reporter.report_framework import ChartType, create_report
+
+
+async def vendas():
+    await asyncio.sleep(0)
+    return pd.DataFrame({'regiao': ['Norte', 'Sul'], 'valor': [10, 20]})
+
+
+def test_async_provider_resolves_twice():
+    report = create_report("Vendas")
+    report.add_table("Vendas", vendas)
+
+    first = report.generate(format='html')
+    assert b'Norte' in first
+    assert report.generate(format='html') == first
+
+
+def test_async_provider_inside_running_loop():
+    report = create_report("Vendas")
+    report.add_table("Vendas", vendas)
+    report.add_chart("Por região", ChartType.BAR, vendas, labels='regiao')
+
+    async def main():
+        # generate() síncrono chamado de código assíncrono, sem prefetch
+        return report.generate(format='html'), report.sections[0].data_table
+
+    html, provider = asyncio.run(main())
+    assert b'Norte' in html
+    assert provider is vendas
+
+
+def test_materialize_outside_prefetch_inside_running_loop():
+    async def main():
+        return materialize(vendas)
+
+    assert asyncio.run(main())['valor'].tolist() == [10, 20]
+
+
+def test_bare_coroutine_rejected():
+    report = create_report("Vendas")
+    with pytest.raises(TypeError, match='função assíncrona'):
+        report.add_table("Vendas", vendas())
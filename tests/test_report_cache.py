@@ -0,0 +1,40 @@
+import pandas as pd
+
+from src.reporter.report_cache import ReportCache
+from src.reporter.report_framework import create_report
+from src.reporter.templates import register_template
+from src.reporter.themes import register_theme
+
+
+def test_reregistered_template_misses_cache():
+    cache = ReportCache()
+    register_template('cache-capa', '<h1>{{ config.title }}</h1>')
+    report = create_report("Mensal")
+    report.config.template = 'cache-capa'
+
+    assert report.generate(format='html', cache=cache) == b'<h1>Mensal</h1>'
+    register_template('cache-capa', '<h2>{{ config.title }}</h2>')
+    assert report.generate(format='html', cache=cache) == b'<h2>Mensal</h2>'
+    assert cache.stats.hits == 0
+
+
+def test_reregistered_theme_misses_cache():
+    cache = ReportCache()
+    register_theme('cache-tema', 'body { color: red; }')
+    report = create_report("Mensal", theme='cache-tema')
+
+    first = report.generate(format='html', cache=cache)
+    register_theme('cache-tema', 'body { color: blue; }')
+    second = report.generate(format='html', cache=cache)
+
+    assert b'color: red' in first
+    assert b'color: blue' in second
+
+
+def test_unhashable_cells_render_without_cache():
+    cache = ReportCache()
+    report = create_report("Objetos")
+    report.add_table("Pedidos", pd.DataFrame({'itens': [['a', 'b'], ['c']]}))
+
+    assert b"['a', 'b']" in report.generate(format='html', cache=cache)
+    assert cache.stats.entries == 0
@@ -0,0 +1,106 @@
+import os
+import threading
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+import src.reporter.server as server_module
+from src.reporter.assets import check_url, restrict_resources
+from src.reporter.report_framework import ReportBuilder, ReportConfig, create_report
+from src.reporter.server import RenderServer, RenderServerError, _render_spec_job, render_remote
+from src.reporter.spec import ReportSpec
+
+
+def _weasyprint_loads() -> bool:
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def _crash(*args):
+    os._exit(1)
+
+
+def _pickle_spec() -> bytes:
+    """Especificação binária cuja coluna de objetos mistos vai em pickle"""
+    report = create_report("Pickle")
+    report.add_table("Valores", pd.DataFrame({'valor': [Decimal('1.5'), 'dois', 3]}))
+    return ReportSpec.from_builder(report).to_bytes()
+
+
+def test_from_bytes_refuses_pickle():
+    data = _pickle_spec()
+    assert ReportSpec.from_bytes(data).sections[0]['table']['data']['valor'].tolist() == [Decimal('1.5'), 'dois', 3]
+    with pytest.raises(ValueError, match='pickle'):
+        ReportSpec.from_bytes(data, allow_pickle=False)
+
+
+def test_from_bytes_accepts_plain_spec():
+    # Números e textos não passam por pickle: o servidor aceita relatórios comuns
+    report = create_report("Vendas")
+    df = pd.DataFrame({'regiao': ['Sul', 'Norte'], 'vendas': [10, 20], 'meta': [0.5, 1.25], 'ok': [True, False]})
+    report.add_table("Vendas", df)
+
+    spec = ReportSpec.from_bytes(ReportSpec.from_builder(report).to_bytes(), allow_pickle=False)
+    pd.testing.assert_frame_equal(spec.sections[0]['table']['data'], df)
+    assert spec.to_builder().sections[0].title == "Vendas"
+
+
+def test_render_job_refuses_pickle():
+    # ValueError vira 400 em RenderServer.render
+    with pytest.raises(ValueError, match='pickle'):
+        _render_spec_job(_pickle_spec())
+
+
+@pytest.mark.skipif(not _weasyprint_loads(), reason='WeasyPrint indisponível')
+def test_server_rejects_pickle_spec():
+    server = RenderServer(port=0, workers=1, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        port = server._httpd.server_address[1]
+        with pytest.raises(RenderServerError) as error:
+            render_remote(ReportSpec.from_bytes(_pickle_spec()), port=port)
+        assert error.value.status == 400
+        assert server.stats_dict()['rendered'] == 0
+    finally:
+        server.shutdown()
+
+
+def test_broken_pool_is_replaced(monkeypatch):
+    monkeypatch.setattr(server_module, '_render_spec_job', _crash)
+    server = RenderServer(port=0, workers=1, quiet=True)
+    try:
+        broken = server.pool
+        status, body = server.render({'title': "Queda"})
+        assert status == 503
+        assert 'tente novamente' in body['error']
+        assert server.pool is not broken
+        assert server.stats_dict()['failed'] == 1
+    finally:
+        server.close()
+
+
+def test_restricted_logo_outside_allowed_paths(tmp_path):
+    logo = tmp_path / 'logo.png'
+    logo.write_bytes(b'\x89PNG\r\n\x1a\nfake')
+    report = ReportBuilder(ReportConfig(title="Logo", logo_path=str(logo)))
+
+    with restrict_resources():
+        assert 'reporter-asset:' not in report._build_html()
+    with restrict_resources([tmp_path]):
+        assert 'data:image/png;base64' in report._build_html()
+
+
+def test_restricted_urls(tmp_path):
+    with restrict_resources([tmp_path]):
+        check_url('data:text/css,p{}')
+        check_url((tmp_path / 'estilo.css').as_uri())
+        with pytest.raises(PermissionError):
+            check_url('file:///etc/passwd')
+        with pytest.raises(PermissionError):
+            check_url('https://example.com/a.css')
+    check_url('https://example.com/a.css')
@@ -0,0 +1,62 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.reporter import shm
+from src.reporter.batch import RenderPool
+from src.reporter.report_framework import create_report
+from src.reporter.spec import ReportSpec
+
+
+def _spec() -> ReportSpec:
+    report = create_report("Memória compartilhada")
+    report.add_table("Dados", pd.DataFrame({'valor': np.arange(1000, dtype=np.int64), 'taxa': np.linspace(0, 1, 1000)}))
+    return ReportSpec.from_builder(report)
+
+
+def test_worker_columns_are_views(monkeypatch):
+    attached = []
+
+    class RecordingSharedMemory(SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if not kwargs.get('create'):
+                attached.append(self)
+
+    monkeypatch.setattr(shm, 'SharedMemory', RecordingSharedMemory)
+
+    def check(builder):
+        df = builder.sections[0].data_table
+        segment = np.frombuffer(attached[0].buf, dtype=np.uint8)
+        try:
+            return [np.shares_memory(df[column].to_numpy(), segment) for column in df.columns]
+        finally:
+            del segment
+
+    with shm.SharedSpec(_spec()) as shared:
+        assert shm.with_shared_builder(shared.handle, check) == [True, True]
+
+
+def test_segment_removed_when_future_completes(monkeypatch):
+    created = []
+
+    class RecordingSharedSpec(shm.SharedSpec):
+        def __init__(self, spec):
+            super().__init__(spec)
+            created.append(self.name)
+
+    monkeypatch.setattr(shm, 'SharedSpec', RecordingSharedSpec)
+
+    pool = RenderPool(1)
+    try:
+        future = pool.submit(_spec(), transport='shm')
+        # Com ou sem WeasyPrint no worker, o segmento some antes de a espera retornar
+        future.exception(timeout=60)
+    finally:
+        pool.shutdown()
+
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=created[0])
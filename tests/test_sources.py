@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from src.reporter.sources import CsvSource, DataSource, FeatherSource, ParquetSource, open_source
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'pedido': range(100),
+        'regiao': [['Norte', 'Sul'][i % 2] for i in range(100)],
+        'valor': [i * 1.5 for i in range(100)],
+    })
+
+
+@pytest.fixture
+def files(tmp_path, frame):
+    pytest.importorskip('pyarrow')
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    paths = {
+        'feather': tmp_path / 'pedidos.feather',
+        'parquet': tmp_path / 'pedidos.parquet',
+        'csv': tmp_path / 'pedidos.csv',
+    }
+    # Vários lotes / row groups, para que o recorte atravesse fronteiras
+    feather.write_feather(table, paths['feather'], compression='uncompressed', chunksize=16)
+    pq.write_table(table, paths['parquet'], row_group_size=16)
+    frame.to_csv(paths['csv'], index=False)
+    return paths
+
+
+@pytest.mark.parametrize('kind, source_class', [
+    ('feather', FeatherSource),
+    ('parquet', ParquetSource),
+    ('csv', CsvSource),
+])
+def test_columns_and_rows(files, frame, kind, source_class):
+    source = open_source(files[kind], columns=['valor', 'pedido'], start=10, stop=50)
+    assert type(source) is source_class
+
+    df = source.load()
+
+    expected = frame[['valor', 'pedido']].iloc[10:50].reset_index(drop=True)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize('kind', ['feather', 'parquet', 'csv'])
+def test_all_columns_open_ended(files, frame, kind):
+    df = open_source(files[kind], start=95).load()
+
+    assert list(df.columns) == ['pedido', 'regiao', 'valor']
+    assert df['pedido'].tolist() == [95, 96, 97, 98, 99]
+
+
+def test_csv_small_batches(files, frame):
+    df = CsvSource(files['csv'], columns=['regiao'], start=3, stop=8, batch_size=4).load()
+
+    assert df['regiao'].tolist() == frame['regiao'].iloc[3:8].tolist()
+
+
+def test_invalid_selection(files):
+    with pytest.raises(KeyError):
+        FeatherSource(files['feather'], columns=['inexistente']).load()
+    with pytest.raises(ValueError):
+        ParquetSource(files['parquet'], start=10, stop=5)
+
+
+def test_data_source_is_abstract():
+    with pytest.raises(TypeError):
+        DataSource('dados.bin')
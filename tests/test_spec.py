@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.reporter.report_framework import create_report
+from src.reporter.spec import ReportSpec, _Buffers, _encode_frame
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            'inteiro': [1, 2, 3],
+            'real': [1.5, np.nan, 3.25],
+            'flag': [True, False, True],
+            'texto': ['a', None, 'c']
+        },
+        index=pd.Index([10, 20, 30], name='id')
+    )
+
+
+def test_common_dtypes_skip_pickle():
+    meta = _encode_frame(_frame(), _Buffers())
+    assert [column['kind'] for column in meta['columns']] == ['numpy', 'numpy', 'numpy', 'arrow_string']
+    assert meta['index']['values']['kind'] == 'numpy'
+
+
+@pytest.mark.parametrize('column', ['inteiro', 'real', 'flag', 'texto'])
+def test_roundtrip_without_pickle(column):
+    df = _frame()[[column]]
+    report = create_report("Tipos")
+    report.add_table("Dados", df)
+
+    spec = ReportSpec.from_bytes(ReportSpec.from_builder(report).to_bytes(), allow_pickle=False)
+    pd.testing.assert_frame_equal(spec.sections[0]['table']['data'], df)
+
+
+def test_numeric_columns_are_views():
+    report = create_report("Views")
+    report.add_table("Dados", _frame())
+    data = bytearray(ReportSpec.from_builder(report).to_bytes())
+
+    df = ReportSpec.from_bytes(memoryview(data), allow_pickle=False).sections[0]['table']['data']
+    raw = np.frombuffer(data, dtype=np.uint8)
+    for column in ('inteiro', 'real', 'flag'):
+        assert np.shares_memory(df[column].to_numpy(), raw)
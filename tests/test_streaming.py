@@ -0,0 +1,42 @@
+import asyncio
+
+import pandas as pd
+
+from src.reporter.assets import get_asset_registry
+from src.reporter.charts import chart_cache_stats, configure_chart_cache
+from src.reporter.fragments import configure_fragment_cache, fragment_cache_stats
+from src.reporter.report_framework import ChartType, create_report
+
+
+async def vendas():
+    await asyncio.sleep(0)
+    return pd.DataFrame({'regiao': ['Norte', 'Sul'], 'valor': [10.5, 20.25]})
+
+
+def test_streaming_async_provider_inside_running_loop():
+    async def main():
+        report = create_report("Vendas", streaming=True)
+        report.add_table("Vendas", vendas)
+        return report
+
+    report = asyncio.run(main())
+    section = report.sections[0]
+    assert section.data_table is None
+    assert 'Norte' in section.table_html
+
+
+def test_streaming_bypasses_process_caches():
+    configure_fragment_cache()
+    configure_chart_cache()
+    registry_entries = len(get_asset_registry())
+
+    report = create_report("Vendas", streaming=True)
+    report.add_table("Vendas", vendas)
+    report.add_chart("Por região", ChartType.BAR, vendas, labels='regiao')
+    html = report.generate(format='html')
+
+    assert b'Norte' in html
+    assert b'data:image/png;base64' in html
+    assert fragment_cache_stats().entries == 0
+    assert chart_cache_stats().entries == 0
+    assert len(get_asset_registry()) == registry_entries
@@ -0,0 +1,109 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.reporter.report_framework import create_report
+from src.reporter.tables import (
+    HighlightRule,
+    _quote_columns,
+    evaluate_condition,
+    evaluate_highlights,
+    render_table
+)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE vendas (pedido INTEGER, regiao TEXT, valor REAL)')
+    rows = [(pedido, 'Norte' if pedido % 2 else 'Sul', None if pedido <= 3 else pedido * 1.5) for pedido in range(1, 8)]
+    conn.executemany('INSERT INTO vendas VALUES (?, ?, ?)', rows)
+    yield conn
+    conn.close()
+
+
+def _cells(html: str, column: int):
+    import re
+
+    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', html.split('<tbody>')[1], re.S)
+    return [re.findall(r'<td[^>]*>(.*?)</td>', row)[column] for row in rows]
+
+
+def test_table_from_query_matches_whole_table(conn):
+    chunked = create_report("Pedidos")
+    chunked.add_table_from_query("Pedidos", conn, 'SELECT * FROM vendas ORDER BY pedido', chunksize=2)
+    whole = create_report("Pedidos")
+    whole.add_table_from_query("Pedidos", conn, 'SELECT * FROM vendas ORDER BY pedido', chunksize=100)
+
+    html = chunked.sections[0].table_html
+    assert html == whole.sections[0].table_html
+    assert _cells(html, 0) == ['1', '2', '3', '4', '5', '6', '7']
+
+
+def test_all_null_first_chunk_uses_later_dtype(conn):
+    report = create_report("Pedidos")
+    report.add_table_from_query(
+        "Pedidos", conn, 'SELECT pedido, valor FROM vendas ORDER BY pedido', chunksize=3, locale='pt-BR'
+    )
+
+    assert _cells(report.sections[0].table_html, 1)[3:] == ['6,00', '7,50', '9,00', '10,50']
+
+
+def test_query_params_and_highlights(conn):
+    report = create_report("Pedidos")
+    report.add_table_from_query(
+        "Norte", conn, 'SELECT pedido, regiao FROM vendas WHERE regiao = ?', params=('Norte',),
+        chunksize=2, highlight_rows={'row-danger': "pedido > 4"}
+    )
+
+    html = report.sections[0].table_html
+    assert _cells(html, 0) == ['1', '3', '5', '7']
+    assert html.count('row-danger') == 2
+
+
+@pytest.fixture
+def metas():
+    return pd.DataFrame({'vendedor': ['Ana', 'Bia', 'Caio'], '% Meta': [80.0, 120.0, 95.0], 'vendas': [8, 12, 19]})
+
+
+def test_quoted_column_expressions(metas):
+    assert _quote_columns("'% Meta' < 100", metas.columns) == "`% Meta` < 100"
+    # Texto entre aspas que não é coluna continua literal
+    assert _quote_columns("vendedor == 'Ana'", metas.columns) == "vendedor == 'Ana'"
+    assert evaluate_condition(metas, "'% Meta' < 100 and vendedor != 'Ana'").tolist() == [False, False, True]
+
+
+def test_mask_and_callable_conditions(metas):
+    assert evaluate_condition(metas, [True, False, True]).tolist() == [True, False, True]
+    assert evaluate_condition(metas, pd.Series([None, True, False], dtype='boolean')).tolist() == [False, True, False]
+    assert evaluate_condition(metas, lambda df: df['vendas'] > 10).tolist() == [False, True, True]
+
+
+def test_mask_length_mismatch(metas):
+    with pytest.raises(ValueError, match='3 linhas'):
+        evaluate_condition(metas, np.array([True, False]))
+    with pytest.raises(ValueError, match='3 linhas'):
+        evaluate_condition(metas, lambda df: True)
+
+
+def test_row_and_cell_classes_merge(metas):
+    rules = [
+        HighlightRule("'% Meta' < 100", 'row-danger'),
+        HighlightRule(lambda df: df['vendas'] > 10, 'row-success'),
+        HighlightRule([True, False, True], 'cell-warn', columns=['vendas']),
+        HighlightRule("vendas > 15", 'cell-bold', columns=['vendas', '% Meta'])
+    ]
+
+    rows, cells = evaluate_highlights(metas, rules)
+
+    assert rows.tolist() == ['row-danger', 'row-success', 'row-danger row-success']
+    assert sorted(cells) == [1, 2]
+    assert cells[2].tolist() == ['cell-warn', '', 'cell-warn cell-bold']
+    assert cells[1].tolist() == ['', '', 'cell-bold']
+
+    html = render_table(metas, highlights=rules)
+    assert '<tr class="row-danger row-success">' in html
+    assert '<td class="cell-warn cell-bold">19</td>' in html
+    assert '<td>Bia</td>' in html
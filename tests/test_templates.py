@@ -0,0 +1,24 @@
+import base64
+
+from src.reporter.report_framework import ReportBuilder, ReportConfig
+from src.reporter.templates import register_template, template_variables
+
+
+def test_template_variables_follow_source():
+    register_template('variaveis', '<h1>{{ config.title }}</h1>')
+    assert template_variables('variaveis') == {'config'}
+
+    register_template('variaveis', '<img src="data:image/png;base64,{{ logo_base64 }}">')
+    assert template_variables('variaveis') == {'logo_base64'}
+
+
+def test_logo_base64_filled_by_template_source(tmp_path):
+    logo = tmp_path / 'logo.png'
+    logo.write_bytes(b'\x89PNG\r\n\x1a\nlogo')
+    # O nome do template não menciona logo_base64; só a fonte
+    register_template('capa-antiga', '<img src="data:image/png;base64,{{ logo_base64 }}">')
+    report = ReportBuilder(ReportConfig(title="Logo", logo_path=str(logo), template='capa-antiga'))
+
+    html = report._build_html()
+
+    assert base64.b64encode(logo.read_bytes()).decode() in html
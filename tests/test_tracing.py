@@ -0,0 +1,24 @@
+import threading
+
+from src.reporter.tracing import NULL_TRACER
+
+
+def test_null_tracer_spans_are_not_shared():
+    seen = []
+
+    def render(i):
+        with NULL_TRACER.span('layout', partitions=i) as span:
+            span.attributes['linhas'] = i
+            span.bytes += i
+            seen.append(span)
+
+    threads = [threading.Thread(target=render, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(span) for span in seen}) == 4
+    assert sorted(span.bytes for span in seen) == [0, 1, 2, 3]
+    with NULL_TRACER.run() as span:
+        assert span.attributes == {} and span.bytes == 0